@@ -18,7 +18,9 @@ from agent_framework.llm import (
     LLMResponse,
     LocalBackend,
     OpenAIBackend,
+    estimate_tokens,
     get_default_backend,
+    get_local_backend,
 )
 
 __all__ = [
@@ -31,6 +33,8 @@ __all__ = [
     "OpenAIBackend",
     "LocalBackend",
     "get_default_backend",
+    "get_local_backend",
+    "estimate_tokens",
     # Context Management
     "ContextBuilder",
     "render_org_context",
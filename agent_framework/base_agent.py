@@ -6,18 +6,70 @@ Abstract base class for all agents in the ANO framework.
 
 from __future__ import annotations
 
+import functools
+import inspect
 import json
 import logging
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Callable
+from contextvars import ContextVar
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
 
-from agent_framework.llm.base_backend import LLMBackend, get_default_backend
+from agent_framework.llm.base_backend import LLMBackend, LLMResponse, get_default_backend
+from agent_framework.llm.single_flight import SingleFlight
+from agent_framework.llm.tokens import (
+    CHARS_PER_TOKEN,
+    allocate_token_budget,
+    estimate_tokens,
+)
 from ano_core.errors import AgentExecutionError
 from ano_core.types import AgentContext, AgentInput, AgentMetadata, AgentOutput
 
 logger = logging.getLogger(__name__)
 
+TRUNCATION_MARKER = "\n...[TRUNCATED]"
+
+# Identical LLM requests in flight at the same time share one backend call
+_inflight_llm_calls = SingleFlight()
+
+
+@dataclass(slots=True)
+class _RunStats:
+    """Start time and LLM usage for one execute() call."""
+
+    started_at: datetime = field(default_factory=datetime.now)
+    llm_calls: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+
+
+# The agent whose execute() is running in the current task, with its stats.
+# Context variables are per task, so concurrent executions of one shared
+# agent instance each see their own stats.
+_current_run: ContextVar[tuple[BaseAgent, _RunStats] | None] = ContextVar(
+    "_current_run", default=None
+)
+
+
+def _run_scoped(execute: Callable[..., Any]) -> Callable[..., Any]:
+    """Wrap an execute() implementation so each call gets fresh _RunStats."""
+
+    @functools.wraps(execute)
+    async def wrapper(self: BaseAgent, *args: Any, **kwargs: Any) -> Any:
+        current = _current_run.get()
+        if current is not None and current[0] is self:
+            # super().execute() from a subclass: same run
+            return await execute(self, *args, **kwargs)
+        token = _current_run.set((self, _RunStats()))
+        try:
+            return await execute(self, *args, **kwargs)
+        finally:
+            _current_run.reset(token)
+
+    return wrapper
+
 
 class BaseAgent(ABC):
     """
@@ -32,6 +84,8 @@ class BaseAgent(ABC):
         version: Agent version string (e.g., "1.0.0")
         input_schema: Optional JSON schema for input validation
         output_schema: Optional JSON schema for output validation
+        expected_output_tokens: Default max_tokens budget for LLM calls
+        context_window_tokens: Prompt + output token limit of the target model
     """
 
     # Class-level metadata (override in subclasses)
@@ -39,6 +93,26 @@ class BaseAgent(ABC):
     version: str = "1.0.0"
     input_schema: dict[str, Any] | None = None
     output_schema: dict[str, Any] | None = None
+    expected_output_tokens: int = 4096
+    context_window_tokens: int = 128_000
+
+    # Per-instance state. Subclasses that also declare __slots__ get no
+    # instance __dict__; those that don't behave exactly as before.
+    # Per-execution state (start time, LLM usage) lives in _RunStats so one
+    # instance can serve concurrent executions.
+    __slots__ = (
+        "context",
+        "_llm",
+        "_policy_hooks",
+        "_idle_stats",
+    )
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Give every execute() override its own per-call usage stats."""
+        super().__init_subclass__(**kwargs)
+        execute = cls.__dict__.get("execute")
+        if inspect.iscoroutinefunction(execute):
+            setattr(cls, "execute", _run_scoped(execute))
 
     def __init__(
         self,
@@ -55,11 +129,9 @@ class BaseAgent(ABC):
         """
         self.context = context
         self._llm = llm  # Store as private, initialize lazily
-        self.started_at = datetime.now()
         self._policy_hooks: list[Any] = []
-        self._llm_call_count = 0
-        self._total_input_tokens = 0
-        self._total_output_tokens = 0
+        # Usage from LLM calls made outside execute()
+        self._idle_stats = _RunStats()
 
     @property
     def llm(self) -> LLMBackend:
@@ -68,6 +140,13 @@ class BaseAgent(ABC):
             self._llm = get_default_backend()
         return self._llm
 
+    def _run_stats(self) -> _RunStats:
+        """Stats of this agent's execute() call in the current task, if any."""
+        current = _current_run.get()
+        if current is not None and current[0] is self:
+            return current[1]
+        return self._idle_stats
+
     @abstractmethod
     def get_system_prompt(self) -> str:
         """
@@ -104,10 +183,96 @@ class BaseAgent(ABC):
             f"{self.__class__.__name__} must implement execute()"
         )
 
+    def get_max_tokens(self, agent_input: AgentInput) -> int:
+        """
+        Resolve the output token budget for a single request.
+
+        Uses the per-request ``max_output_tokens`` override from the input
+        data when present, otherwise the agent's expected_output_tokens.
+
+        Args:
+            agent_input: Input for the current execution
+
+        Returns:
+            max_tokens value to pass to call_llm()
+        """
+        override = agent_input.data.get("max_output_tokens")
+        if override:
+            return int(override)
+        return self.expected_output_tokens
+
+    def get_prompt_budget(self, max_tokens: int | None = None) -> int:
+        """
+        Return the tokens left for user prompt content.
+
+        The budget is the model context window minus the system prompt and
+        the reserved output tokens.
+
+        Args:
+            max_tokens: Output tokens reserved for the response. If None,
+                        uses expected_output_tokens.
+
+        Returns:
+            Token budget for the user prompt
+        """
+        if max_tokens is None:
+            max_tokens = self.expected_output_tokens
+        system_tokens = estimate_tokens(self.get_system_prompt())
+        return max(self.context_window_tokens - max_tokens - system_tokens, 0)
+
+    def truncate_text(self, text: str, max_tokens: int) -> str:
+        """
+        Truncate text to fit within a token allowance.
+
+        Args:
+            text: Text to embed in a prompt
+            max_tokens: Tokens available for this text
+
+        Returns:
+            The original text if it fits, otherwise a truncated copy
+            ending with a truncation marker
+        """
+        if estimate_tokens(text) <= max_tokens:
+            return text
+        return text[: max_tokens * CHARS_PER_TOKEN] + TRUNCATION_MARKER
+
+    def fit_documents(
+        self,
+        documents: list[str],
+        render: Callable[[list[str]], str],
+        token_budget: int,
+    ) -> str:
+        """
+        Render a prompt whose embedded documents are truncated to fit.
+
+        The rest of the prompt (everything render() adds around the
+        documents, plus a truncation marker per document) is charged to
+        token_budget first; the documents share what is left in proportion
+        to their size.
+
+        Args:
+            documents: Document texts to embed
+            render: Builds the full prompt from (possibly truncated)
+                document texts, in the same order
+            token_budget: Tokens available for the whole user prompt
+
+        Returns:
+            The rendered prompt
+        """
+        overhead = estimate_tokens(render([""] * len(documents))) + len(
+            documents
+        ) * estimate_tokens(TRUNCATION_MARKER)
+        allowances = allocate_token_budget(
+            [estimate_tokens(doc) for doc in documents], token_budget - overhead
+        )
+        return render(
+            [self.truncate_text(doc, share) for doc, share in zip(documents, allowances)]
+        )
+
     async def call_llm(
         self,
         user_prompt: str,
-        max_tokens: int = 4096,
+        max_tokens: int | None = None,
         temperature: float = 0.3,
         **kwargs: Any,
     ) -> str:
@@ -115,10 +280,13 @@ class BaseAgent(ABC):
         Call the LLM with the agent's system prompt and user prompt.
 
         Delegates to the configured LLM backend and tracks usage metrics.
+        Concurrent identical requests to the same backend are coalesced
+        into a single backend call.
 
         Args:
             user_prompt: The user/task prompt to send
-            max_tokens: Maximum response tokens
+            max_tokens: Maximum response tokens. If None, uses
+                        expected_output_tokens.
             temperature: Sampling temperature
             **kwargs: Additional LLM-specific parameters
 
@@ -129,8 +297,11 @@ class BaseAgent(ABC):
             LLMBackendError: If the LLM call fails
         """
         system_prompt = self.get_system_prompt()
+        if max_tokens is None:
+            max_tokens = self.expected_output_tokens
+        stats = self._run_stats()
 
-        try:
+        async def _complete() -> LLMResponse:
             response = await self.llm.complete(
                 system_prompt=system_prompt,
                 user_prompt=user_prompt,
@@ -139,21 +310,91 @@ class BaseAgent(ABC):
                 **kwargs,
             )
 
-            # Track usage
-            self._llm_call_count += 1
-            self._total_input_tokens += response.input_tokens
-            self._total_output_tokens += response.output_tokens
+            # Track usage (only the caller that actually hit the backend)
+            stats.llm_calls += 1
+            stats.input_tokens += response.input_tokens
+            stats.output_tokens += response.output_tokens
 
             logger.debug(
-                f"{self.agent_name}: LLM call completed "
-                f"({response.input_tokens} in, {response.output_tokens} out, "
-                f"{response.latency_ms:.0f}ms)"
+                "%s: LLM call completed (%d in, %d out, %.0fms)",
+                self.agent_name,
+                response.input_tokens,
+                response.output_tokens,
+                response.latency_ms,
             )
+            return response
+
+        try:
+            try:
+                key = (
+                    self.llm,
+                    system_prompt,
+                    user_prompt,
+                    max_tokens,
+                    temperature,
+                    frozenset(kwargs.items()),
+                )
+            except TypeError:
+                # Unhashable backend kwargs; call without coalescing
+                response = await _complete()
+            else:
+                response = await _inflight_llm_calls.do(key, _complete)
 
             return response.text
 
         except Exception as e:
-            logger.error(f"{self.agent_name}: LLM call failed: {e}")
+            logger.error("%s: LLM call failed: %s", self.agent_name, e)
+            raise AgentExecutionError(
+                f"LLM call failed: {e}",
+                agent_name=self.agent_name,
+            )
+
+    async def call_llm_streaming(
+        self,
+        user_prompt: str,
+        max_tokens: int | None = None,
+        temperature: float = 0.3,
+        **kwargs: Any,
+    ) -> AsyncIterator[str]:
+        """
+        Stream the LLM response for the agent's system prompt and user prompt.
+
+        Yields text deltas as the backend receives them, so callers can
+        start processing before generation completes. Token usage is not
+        reported by streaming backends; only the call count is tracked.
+
+        Args:
+            user_prompt: The user/task prompt to send
+            max_tokens: Maximum response tokens. If None, uses
+                        expected_output_tokens.
+            temperature: Sampling temperature
+            **kwargs: Additional LLM-specific parameters
+
+        Yields:
+            Text deltas in generation order
+
+        Raises:
+            AgentExecutionError: If the LLM call fails
+        """
+        system_prompt = self.get_system_prompt()
+        if max_tokens is None:
+            max_tokens = self.expected_output_tokens
+
+        try:
+            async for delta in self.llm.stream(
+                system_prompt=system_prompt,
+                user_prompt=user_prompt,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                **kwargs,
+            ):
+                yield delta
+
+            self._run_stats().llm_calls += 1
+            logger.debug("%s: Streaming LLM call completed", self.agent_name)
+
+        except Exception as e:
+            logger.error("%s: Streaming LLM call failed: %s", self.agent_name, e)
             raise AgentExecutionError(
                 f"LLM call failed: {e}",
                 agent_name=self.agent_name,
@@ -186,7 +427,7 @@ class BaseAgent(ABC):
             return json.loads(cleaned)
         except json.JSONDecodeError:
             logger.warning(
-                f"{self.agent_name}: Could not parse JSON response, returning raw text"
+                "%s: Could not parse JSON response, returning raw text", self.agent_name
             )
             return {"raw_text": text}
 
@@ -201,23 +442,24 @@ class BaseAgent(ABC):
             hook: Policy hook callable or object
         """
         self._policy_hooks.append(hook)
-        logger.debug(f"{self.agent_name}: Attached policy hook {hook}")
+        logger.debug("%s: Attached policy hook %s", self.agent_name, hook)
 
     def get_metadata(self) -> AgentMetadata:
         """
         Get execution metadata for this agent.
 
+        Inside execute() this covers the current call only, even when the
+        same instance is executing concurrently elsewhere.
+
         Returns:
             AgentMetadata with execution statistics
         """
-        completed_at = datetime.now()
-        duration_ms = (completed_at - self.started_at).total_seconds() * 1000
-
+        stats = self._run_stats()
         return AgentMetadata(
             agent_name=self.agent_name,
             version=self.version,
-            started_at=self.started_at,
-            completed_at=completed_at,
-            llm_calls=self._llm_call_count,
-            tokens_used=self._total_input_tokens + self._total_output_tokens,
+            started_at=stats.started_at,
+            completed_at=datetime.now(),
+            llm_calls=stats.llm_calls,
+            tokens_used=stats.input_tokens + stats.output_tokens,
         )
@@ -93,6 +93,6 @@ class ContextBuilder:
 
         return AgentContext(
             org_profile=self._org_profile,
-            pipeline_state=self._pipeline_state,
-            upstream_outputs=self._upstream_outputs,
+            pipeline_state=dict(self._pipeline_state),
+            upstream_outputs=dict(self._upstream_outputs),
         )
@@ -6,8 +6,10 @@ Provides pluggable LLM backends for the ANO agent framework.
 
 from agent_framework.llm.anthropic_backend import AnthropicBackend
 from agent_framework.llm.base_backend import LLMBackend, LLMResponse, get_default_backend
-from agent_framework.llm.local_backend import LocalBackend
+from agent_framework.llm.local_backend import LocalBackend, get_local_backend
 from agent_framework.llm.openai_backend import OpenAIBackend
+from agent_framework.llm.single_flight import SingleFlight
+from agent_framework.llm.tokens import estimate_tokens
 
 __all__ = [
     "LLMBackend",
@@ -16,4 +18,7 @@ __all__ = [
     "OpenAIBackend",
     "LocalBackend",
     "get_default_backend",
+    "get_local_backend",
+    "estimate_tokens",
+    "SingleFlight",
 ]
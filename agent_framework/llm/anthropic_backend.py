@@ -6,15 +6,16 @@ Provides integration with Anthropic's Claude models via the Messages API.
 
 from __future__ import annotations
 
+import json
 import logging
 import time
+from collections.abc import AsyncIterator
 from typing import Any
 
 import httpx
 
 from agent_framework.llm.base_backend import LLMBackend, LLMResponse
 from ano_core.errors import LLMBackendError
-from ano_core.settings import settings
 
 logger = logging.getLogger(__name__)
 
@@ -41,16 +42,19 @@ class AnthropicBackend(LLMBackend):
             model: Model identifier. If None, uses settings.DEFAULT_LLM_MODEL
             base_url: API endpoint URL (default: official Anthropic endpoint)
         """
-        self.api_key = api_key or settings.ANTHROPIC_API_KEY
-        self.model = model or settings.DEFAULT_LLM_MODEL
-        self.base_url = base_url
+        from ano_core.settings import settings
 
-        if not self.api_key:
+        api_key = api_key or settings.ANTHROPIC_API_KEY
+        if not api_key:
             raise LLMBackendError(
                 "ANTHROPIC_API_KEY is required",
                 provider="anthropic",
             )
 
+        self.api_key: str = api_key
+        self.model = model or settings.DEFAULT_LLM_MODEL
+        self.base_url = base_url
+
     async def complete(
         self,
         system_prompt: str,
@@ -143,3 +147,87 @@ class AnthropicBackend(LLMBackend):
                 f"Anthropic API request failed: {e}",
                 provider="anthropic",
             )
+
+    async def stream(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        max_tokens: int = 4096,
+        temperature: float = 0.3,
+        **kwargs: Any,
+    ) -> AsyncIterator[str]:
+        """
+        Stream a completion from Claude as server-sent events.
+
+        Args:
+            system_prompt: System-level instructions
+            user_prompt: User message
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature
+            **kwargs: Additional parameters passed to the API
+
+        Yields:
+            Text deltas as they are received
+
+        Raises:
+            LLMBackendError: If the API call fails
+        """
+        model = kwargs.pop("model", self.model)
+
+        payload = {
+            "model": model,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "system": system_prompt,
+            "messages": [{"role": "user", "content": user_prompt}],
+            "stream": True,
+            **kwargs,
+        }
+
+        headers = {
+            "x-api-key": self.api_key,
+            "anthropic-version": "2023-06-01",
+            "content-type": "application/json",
+        }
+
+        try:
+            async with httpx.AsyncClient() as client:
+                async with client.stream(
+                    "POST",
+                    self.base_url,
+                    headers=headers,
+                    json=payload,
+                    timeout=120.0,
+                ) as response:
+                    if response.status_code != 200:
+                        error_body = (await response.aread()).decode()
+                        logger.error(
+                            f"Anthropic API error ({response.status_code}): {error_body}"
+                        )
+                        raise LLMBackendError(
+                            f"Anthropic API returned status {response.status_code}: {error_body}",
+                            provider="anthropic",
+                            status_code=response.status_code,
+                        )
+
+                    async for line in response.aiter_lines():
+                        if not line.startswith("data:"):
+                            continue
+                        event = json.loads(line[5:])
+                        if event.get("type") == "content_block_delta":
+                            text = event["delta"].get("text")
+                            if text:
+                                yield text
+
+        except httpx.TimeoutException as e:
+            logger.error(f"Anthropic API timeout: {e}")
+            raise LLMBackendError(
+                "Anthropic API request timed out after 120s",
+                provider="anthropic",
+            )
+        except httpx.RequestError as e:
+            logger.error(f"Anthropic API request error: {e}")
+            raise LLMBackendError(
+                f"Anthropic API request failed: {e}",
+                provider="anthropic",
+            )
@@ -7,6 +7,7 @@ Defines the abstract interface for LLM backends and shared response types.
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 from dataclasses import dataclass
 from typing import Any
 
@@ -65,6 +66,43 @@ class LLMBackend(ABC):
         """
         pass
 
+    async def stream(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        max_tokens: int = 4096,
+        temperature: float = 0.3,
+        **kwargs: Any,
+    ) -> AsyncIterator[str]:
+        """
+        Generate a completion as a stream of text deltas.
+
+        The default implementation yields the full completion in a single
+        chunk. Backends with native streaming support override this to
+        yield deltas as they arrive.
+
+        Args:
+            system_prompt: System-level instructions for the LLM
+            user_prompt: User message / task description
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature
+            **kwargs: Backend-specific parameters
+
+        Yields:
+            Text deltas in generation order
+
+        Raises:
+            LLMBackendError: If the LLM call fails
+        """
+        response = await self.complete(
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            **kwargs,
+        )
+        yield response.text
+
 
 def get_default_backend() -> LLMBackend:
     """
@@ -103,9 +141,9 @@ def get_default_backend() -> LLMBackend:
         return OpenAIBackend()
 
     elif provider == "local":
-        from agent_framework.llm.local_backend import LocalBackend
+        from agent_framework.llm.local_backend import get_local_backend
 
-        return LocalBackend()
+        return get_local_backend()
 
     else:
         raise ConfigurationError(
@@ -6,8 +6,11 @@ Provides integration with local LLM servers (Ollama, vLLM, etc.).
 
 from __future__ import annotations
 
+import functools
+import json
 import logging
 import time
+from collections.abc import AsyncIterator
 from typing import Any
 
 import httpx
@@ -136,3 +139,107 @@ class LocalBackend(LLMBackend):
                 f"Local LLM server request failed: {e}. Is the server running at {self.base_url}?",
                 provider="local",
             )
+
+    async def stream(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        max_tokens: int = 4096,
+        temperature: float = 0.3,
+        **kwargs: Any,
+    ) -> AsyncIterator[str]:
+        """
+        Stream a completion from a local LLM server.
+
+        Ollama streams one JSON object per line, each carrying a
+        "response" text delta, until an object with "done": true.
+
+        Args:
+            system_prompt: System-level instructions
+            user_prompt: User message
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature
+            **kwargs: Additional parameters passed to the server
+
+        Yields:
+            Text deltas as they are received
+
+        Raises:
+            LLMBackendError: If the server call fails
+        """
+        model = kwargs.pop("model", self.model)
+
+        payload = {
+            "model": model,
+            "prompt": f"{system_prompt}\n\n{user_prompt}",
+            "stream": True,
+            "options": {
+                "temperature": temperature,
+                "num_predict": max_tokens,
+            },
+            **kwargs,
+        }
+
+        try:
+            async with httpx.AsyncClient() as client:
+                async with client.stream(
+                    "POST",
+                    self.base_url,
+                    json=payload,
+                    timeout=300.0,
+                ) as response:
+                    if response.status_code != 200:
+                        error_body = (await response.aread()).decode()
+                        logger.error(
+                            f"Local LLM server error ({response.status_code}): {error_body}"
+                        )
+                        raise LLMBackendError(
+                            f"Local LLM server returned status {response.status_code}: "
+                            f"{error_body}",
+                            provider="local",
+                            status_code=response.status_code,
+                        )
+
+                    async for line in response.aiter_lines():
+                        if not line:
+                            continue
+                        chunk = json.loads(line)
+                        text = chunk.get("response")
+                        if text:
+                            yield text
+                        if chunk.get("done"):
+                            break
+
+        except httpx.TimeoutException as e:
+            logger.error(f"Local LLM server timeout: {e}")
+            raise LLMBackendError(
+                "Local LLM server request timed out after 300s",
+                provider="local",
+            )
+        except httpx.RequestError as e:
+            logger.error(f"Local LLM server request error: {e}")
+            raise LLMBackendError(
+                f"Local LLM server request failed: {e}. Is the server running at {self.base_url}?",
+                provider="local",
+            )
+
+
+@functools.cache
+def get_local_backend(
+    base_url: str = "http://localhost:11434/api/generate",
+    model: str = "llama3.1:8b",
+) -> LocalBackend:
+    """
+    Get a shared LocalBackend for the given endpoint and model.
+
+    LocalBackend holds only its immutable configuration, so one instance
+    per (base_url, model) can serve every agent and pipeline.
+
+    Args:
+        base_url: Local server endpoint URL
+        model: Model identifier for the local server
+
+    Returns:
+        The cached LocalBackend instance
+    """
+    return LocalBackend(base_url=base_url, model=model)
@@ -6,15 +6,16 @@ Provides integration with OpenAI-compatible APIs (OpenAI, Azure OpenAI, etc.).
 
 from __future__ import annotations
 
+import json
 import logging
 import time
+from collections.abc import AsyncIterator
 from typing import Any
 
 import httpx
 
 from agent_framework.llm.base_backend import LLMBackend, LLMResponse
 from ano_core.errors import LLMBackendError
-from ano_core.settings import settings
 
 logger = logging.getLogger(__name__)
 
@@ -42,6 +43,8 @@ class OpenAIBackend(LLMBackend):
             model: Model identifier (default: gpt-4o)
             base_url: API endpoint URL (default: official OpenAI endpoint)
         """
+        from ano_core.settings import settings
+
         self.api_key = api_key or settings.OPENAI_API_KEY
         self.model = model
         self.base_url = base_url
@@ -145,3 +148,91 @@ class OpenAIBackend(LLMBackend):
                 f"OpenAI API request failed: {e}",
                 provider="openai",
             )
+
+    async def stream(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        max_tokens: int = 4096,
+        temperature: float = 0.3,
+        **kwargs: Any,
+    ) -> AsyncIterator[str]:
+        """
+        Stream a completion from the OpenAI API as server-sent events.
+
+        Args:
+            system_prompt: System-level instructions
+            user_prompt: User message
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature
+            **kwargs: Additional parameters passed to the API
+
+        Yields:
+            Text deltas as they are received
+
+        Raises:
+            LLMBackendError: If the API call fails
+        """
+        model = kwargs.pop("model", self.model)
+
+        payload = {
+            "model": model,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "messages": [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt},
+            ],
+            "stream": True,
+            **kwargs,
+        }
+
+        headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+        }
+
+        try:
+            async with httpx.AsyncClient() as client:
+                async with client.stream(
+                    "POST",
+                    self.base_url,
+                    headers=headers,
+                    json=payload,
+                    timeout=120.0,
+                ) as response:
+                    if response.status_code != 200:
+                        error_body = (await response.aread()).decode()
+                        logger.error(
+                            f"OpenAI API error ({response.status_code}): {error_body}"
+                        )
+                        raise LLMBackendError(
+                            f"OpenAI API returned status {response.status_code}: {error_body}",
+                            provider="openai",
+                            status_code=response.status_code,
+                        )
+
+                    async for line in response.aiter_lines():
+                        if not line.startswith("data:"):
+                            continue
+                        data = line[5:].strip()
+                        if data == "[DONE]":
+                            break
+                        choices = json.loads(data).get("choices")
+                        if choices:
+                            text = choices[0].get("delta", {}).get("content")
+                            if text:
+                                yield text
+
+        except httpx.TimeoutException as e:
+            logger.error(f"OpenAI API timeout: {e}")
+            raise LLMBackendError(
+                "OpenAI API request timed out after 120s",
+                provider="openai",
+            )
+        except httpx.RequestError as e:
+            logger.error(f"OpenAI API request error: {e}")
+            raise LLMBackendError(
+                f"OpenAI API request failed: {e}",
+                provider="openai",
+            )
@@ -0,0 +1,84 @@
+"""
+Single-Flight Call Coalescing
+
+Collapses concurrent identical LLM requests into one backend call.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+
+
+class _Flight:
+    """A shared call in flight and the number of callers awaiting it."""
+
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: asyncio.Future):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Deduplicates concurrent calls that share a key.
+
+    The first caller for a key starts the work in its own task; every caller
+    for that key, the first included, awaits the same result (or exception)
+    instead of repeating it. A caller that is cancelled only stops waiting;
+    the shared call is cancelled once no callers are left waiting on it.
+    Nothing is cached once the call completes.
+    """
+
+    def __init__(self):
+        """Initialize with no calls in flight."""
+        self._inflight: dict[Hashable, _Flight] = {}
+
+    @property
+    def inflight_count(self) -> int:
+        """Number of distinct calls currently in flight."""
+        return len(self._inflight)
+
+    async def do(
+        self,
+        key: Hashable,
+        coro_factory: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """
+        Run coro_factory() once per key among concurrent callers.
+
+        Args:
+            key: Identity of the call; equal keys are coalesced
+            coro_factory: Zero-argument callable returning the awaitable to run
+
+        Returns:
+            Result of the (possibly shared) call
+
+        Raises:
+            Exception: Whatever the shared call raised
+        """
+        flight = self._inflight.get(key)
+        if flight is None:
+            flight = _Flight(asyncio.ensure_future(coro_factory()))
+            self._inflight[key] = flight
+            flight.task.add_done_callback(lambda _: self._forget(key, flight))
+
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        except asyncio.CancelledError:
+            if flight.waiters == 1 and not flight.task.done():
+                flight.task.cancel()
+            raise
+        finally:
+            flight.waiters -= 1
+
+    def _forget(self, key: Hashable, flight: _Flight) -> None:
+        """Drop a finished call, unless the key has already been reused."""
+        if self._inflight.get(key) is flight:
+            del self._inflight[key]
+        if not flight.task.cancelled():
+            # Mark retrieved so a call whose waiters all left doesn't log a warning
+            flight.task.exception()
@@ -0,0 +1,57 @@
+"""
+Token Estimation
+
+Provides a provider-agnostic prompt token estimate shared by agents for
+output budgeting and prompt truncation.
+"""
+
+from __future__ import annotations
+
+# Average characters per token for English prose and source code across
+# the supported providers' tokenizers.
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate the number of tokens in a piece of text.
+
+    Args:
+        text: Text to measure
+
+    Returns:
+        Approximate token count (0 for empty text)
+    """
+    if not text:
+        return 0
+    return -(-len(text) // CHARS_PER_TOKEN)
+
+
+def allocate_token_budget(sizes: list[int], budget: int) -> list[int]:
+    """
+    Split a token budget across documents in proportion to their size.
+
+    Uses largest-remainder apportionment so the shares sum exactly to the
+    budget. Documents are never allotted more tokens than they contain.
+
+    Args:
+        sizes: Token count of each document
+        budget: Total tokens available for all documents
+
+    Returns:
+        Per-document token allowance, in the same order as sizes
+    """
+    total = sum(sizes)
+    if total <= budget:
+        return list(sizes)
+
+    budget = max(budget, 0)
+    exact = [size * budget / total for size in sizes]
+    shares = [int(share) for share in exact]
+    leftover = budget - sum(shares)
+    by_remainder = sorted(
+        range(len(sizes)), key=lambda i: exact[i] - shares[i], reverse=True
+    )
+    for i in by_remainder[:leftover]:
+        shares[i] += 1
+    return shares
@@ -7,7 +7,6 @@ and stakeholder management advice for Autonomous Network Organizations.
 
 import json
 import logging
-from datetime import datetime
 
 from ano_core.errors import AgentExecutionError
 from ano_core.types import AgentInput, AgentOutput
@@ -82,8 +81,6 @@ Your communication style is professional, direct, and focused on outcomes. You p
         Raises:
             AgentExecutionError: If execution fails
         """
-        started_at = datetime.utcnow()
-
         try:
             # Extract question and context
             question = agent_input.data.get("question")
@@ -100,7 +97,7 @@ Your communication style is professional, direct, and focused on outcomes. You p
             user_prompt = self._build_prompt(question, context, org_profile)
 
             # Call LLM
-            logger.info(f"{self.agent_name}: Analyzing strategic question")
+            logger.info("%s: Analyzing strategic question", self.agent_name)
             response_text = await self.call_llm(
                 user_prompt=user_prompt,
                 max_tokens=4096,
@@ -122,7 +119,7 @@ Your communication style is professional, direct, and focused on outcomes. You p
             )
 
         except Exception as e:
-            logger.error(f"{self.agent_name}: Execution failed: {e}")
+            logger.error("%s: Execution failed: %s", self.agent_name, e)
             raise AgentExecutionError(
                 f"Execution failed: {e}",
                 agent_name=self.agent_name,
@@ -7,7 +7,6 @@ via Telegram bots, web chat widgets, or other messaging channels.
 
 import json
 import logging
-from datetime import datetime
 
 from ano_core.errors import AgentExecutionError
 from ano_core.types import AgentInput, AgentOutput
@@ -96,8 +95,6 @@ Your communication style is conversational yet professional, concise yet thoroug
         Raises:
             AgentExecutionError: If execution fails
         """
-        started_at = datetime.utcnow()
-
         try:
             # Extract message
             message = agent_input.data.get("message")
@@ -113,7 +110,7 @@ Your communication style is conversational yet professional, concise yet thoroug
             user_prompt = self._build_prompt(message, context)
 
             # Call LLM
-            logger.info(f"{self.agent_name}: Processing user message")
+            logger.info("%s: Processing user message", self.agent_name)
             response_text = await self.call_llm(
                 user_prompt=user_prompt,
                 max_tokens=2048,
@@ -135,7 +132,7 @@ Your communication style is conversational yet professional, concise yet thoroug
             )
 
         except Exception as e:
-            logger.error(f"{self.agent_name}: Execution failed: {e}")
+            logger.error("%s: Execution failed: %s", self.agent_name, e)
             raise AgentExecutionError(
                 f"Execution failed: {e}",
                 agent_name=self.agent_name,
@@ -7,7 +7,6 @@ technical operations guidance for Autonomous Network Organizations.
 
 import json
 import logging
-from datetime import datetime
 
 from ano_core.errors import AgentExecutionError
 from ano_core.types import AgentInput, AgentOutput
@@ -85,8 +84,6 @@ Your communication style is technically precise yet accessible, explaining compl
         Raises:
             AgentExecutionError: If execution fails
         """
-        started_at = datetime.utcnow()
-
         try:
             # Extract question and context
             question = agent_input.data.get("question")
@@ -103,7 +100,7 @@ Your communication style is technically precise yet accessible, explaining compl
             user_prompt = self._build_prompt(question, context, org_profile)
 
             # Call LLM
-            logger.info(f"{self.agent_name}: Analyzing technical question")
+            logger.info("%s: Analyzing technical question", self.agent_name)
             response_text = await self.call_llm(
                 user_prompt=user_prompt,
                 max_tokens=4096,
@@ -125,7 +122,7 @@ Your communication style is technically precise yet accessible, explaining compl
             )
 
         except Exception as e:
-            logger.error(f"{self.agent_name}: Execution failed: {e}")
+            logger.error("%s: Execution failed: %s", self.agent_name, e)
             raise AgentExecutionError(
                 f"Execution failed: {e}",
                 agent_name=self.agent_name,
@@ -81,7 +81,7 @@ Format your response as JSON with keys: analysis, optimizations, model_recommend
 
             user_prompt = self._build_prompt(target, context, org_profile)
 
-            logger.info(f"{self.agent_name}: Analyzing optimization target: {target[:80]}")
+            logger.info("%s: Analyzing optimization target: %.80s", self.agent_name, target)
             response_text = await self.call_llm(
                 user_prompt=user_prompt,
                 max_tokens=4096,
@@ -97,7 +97,7 @@ Format your response as JSON with keys: analysis, optimizations, model_recommend
             )
 
         except Exception as e:
-            logger.error(f"{self.agent_name}: Execution failed: {e}")
+            logger.error("%s: Execution failed: %s", self.agent_name, e)
             raise AgentExecutionError(
                 f"Execution failed: {e}",
                 agent_name=self.agent_name,
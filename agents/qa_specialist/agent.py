@@ -87,7 +87,7 @@ Format your response as JSON with keys: test_plan, coverage_analysis, quality_ga
 
             user_prompt = self._build_prompt(target, context, org_profile)
 
-            logger.info(f"{self.agent_name}: Analyzing quality for: {target[:80]}")
+            logger.info("%s: Analyzing quality for: %.80s", self.agent_name, target)
             response_text = await self.call_llm(
                 user_prompt=user_prompt,
                 max_tokens=4096,
@@ -103,7 +103,7 @@ Format your response as JSON with keys: test_plan, coverage_analysis, quality_ga
             )
 
         except Exception as e:
-            logger.error(f"{self.agent_name}: Execution failed: {e}")
+            logger.error("%s: Execution failed: %s", self.agent_name, e)
             raise AgentExecutionError(
                 f"Execution failed: {e}",
                 agent_name=self.agent_name,
@@ -26,6 +26,7 @@ class ResearcherAgent(BaseAgent):
 
     agent_name = "researcher"
     version = "1.0.0"
+    expected_output_tokens = 2048
 
     def get_system_prompt(self) -> str:
         """Return the researcher system prompt."""
@@ -82,12 +83,15 @@ Format your response as JSON with keys: summary, findings, analysis, recommendat
             context = agent_input.data.get("context", {})
             org_profile = agent_input.context.org_profile
 
-            user_prompt = self._build_prompt(topic, context, org_profile)
+            max_tokens = self.get_max_tokens(agent_input)
+            user_prompt = self._build_prompt(
+                topic, context, org_profile, self.get_prompt_budget(max_tokens)
+            )
 
-            logger.info(f"{self.agent_name}: Researching topic: {topic[:80]}")
+            logger.info("%s: Researching topic: %.80s", self.agent_name, topic)
             response_text = await self.call_llm(
                 user_prompt=user_prompt,
-                max_tokens=4096,
+                max_tokens=max_tokens,
                 temperature=0.3,
             )
 
@@ -100,49 +104,66 @@ Format your response as JSON with keys: summary, findings, analysis, recommendat
             )
 
         except Exception as e:
-            logger.error(f"{self.agent_name}: Execution failed: {e}")
+            logger.error("%s: Execution failed: %s", self.agent_name, e)
             raise AgentExecutionError(
                 f"Execution failed: {e}",
                 agent_name=self.agent_name,
             ) from e
 
-    def _build_prompt(self, topic: str, context: dict, org_profile) -> str:
-        """Build the research prompt with topic and context."""
-        parts = [f"Research Topic:\n{topic}\n"]
+    def _build_prompt(
+        self,
+        topic: str,
+        context: dict,
+        org_profile,
+        token_budget: int | None = None,
+    ) -> str:
+        """
+        Build the research prompt with topic and context.
+
+        Source contents are truncated so that the whole prompt fits within
+        token_budget, each source receiving a share proportional to its size.
+        """
+        sources = context.get("sources", [])
+        if token_budget is None:
+            token_budget = self.get_prompt_budget()
+
+        def render(contents: list[str]) -> str:
+            parts = [f"Research Topic:\n{topic}\n"]
+
+            if org_profile:
+                parts.append(
+                    f"\nOrganization Context:\n"
+                    f"- Name: {org_profile.org_name}\n"
+                    f"- Type: {org_profile.org_type}\n"
+                )
+
+            if sources:
+                parts.append("\nAvailable Sources:\n")
+                for i, (src, content) in enumerate(zip(sources, contents), 1):
+                    title = src.get("title", f"Source {i}")
+                    url = src.get("url", "")
+                    parts.append(f"\n[{i}] {title}")
+                    if url:
+                        parts.append(f" ({url})")
+                    parts.append(f"\n{content}\n")
+
+            scope = context.get("scope", "standard")
+            parts.append(f"\nResearch Scope: {scope}\n")
+
+            focus_areas = context.get("focus_areas", [])
+            if focus_areas:
+                areas = "\n".join(f"- {a}" for a in focus_areas)
+                parts.append(f"\nFocus Areas:\n{areas}\n")
 
-        if org_profile:
             parts.append(
-                f"\nOrganization Context:\n"
-                f"- Name: {org_profile.org_name}\n"
-                f"- Type: {org_profile.org_type}\n"
+                "\nProvide a structured research report as JSON with keys: "
+                "summary, findings, analysis, recommendations, sources_used, confidence"
             )
 
-        sources = context.get("sources", [])
-        if sources:
-            parts.append("\nAvailable Sources:\n")
-            for i, src in enumerate(sources, 1):
-                title = src.get("title", f"Source {i}")
-                content = src.get("content", "")
-                url = src.get("url", "")
-                parts.append(f"\n[{i}] {title}")
-                if url:
-                    parts.append(f" ({url})")
-                parts.append(f"\n{content}\n")
-
-        scope = context.get("scope", "standard")
-        parts.append(f"\nResearch Scope: {scope}\n")
-
-        focus_areas = context.get("focus_areas", [])
-        if focus_areas:
-            areas = "\n".join(f"- {a}" for a in focus_areas)
-            parts.append(f"\nFocus Areas:\n{areas}\n")
-
-        parts.append(
-            "\nProvide a structured research report as JSON with keys: "
-            "summary, findings, analysis, recommendations, sources_used, confidence"
-        )
-
-        return "".join(parts)
+            return "".join(parts)
+
+        contents = [src.get("content", "") for src in sources]
+        return self.fit_documents(contents, render, token_budget)
 
     def _validate_result(self, result: dict) -> dict:
         """Validate and structure the parsed result."""
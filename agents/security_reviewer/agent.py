@@ -26,6 +26,7 @@ class SecurityReviewerAgent(BaseAgent):
 
     agent_name = "security_reviewer"
     version = "1.0.0"
+    expected_output_tokens = 2048
 
     def get_system_prompt(self) -> str:
         """Return the security reviewer system prompt."""
@@ -87,12 +88,15 @@ Format your response as JSON with keys: assessment, vulnerabilities, dependency_
             context = agent_input.data.get("context", {})
             org_profile = agent_input.context.org_profile
 
-            user_prompt = self._build_prompt(target, context, org_profile)
+            max_tokens = self.get_max_tokens(agent_input)
+            user_prompt = self._build_prompt(
+                target, context, org_profile, self.get_prompt_budget(max_tokens)
+            )
 
-            logger.info(f"{self.agent_name}: Security review of: {target[:80]}")
+            logger.info("%s: Security review of: %.80s", self.agent_name, target)
             response_text = await self.call_llm(
                 user_prompt=user_prompt,
-                max_tokens=4096,
+                max_tokens=max_tokens,
                 temperature=0.2,
             )
 
@@ -105,44 +109,61 @@ Format your response as JSON with keys: assessment, vulnerabilities, dependency_
             )
 
         except Exception as e:
-            logger.error(f"{self.agent_name}: Execution failed: {e}")
+            logger.error("%s: Execution failed: %s", self.agent_name, e)
             raise AgentExecutionError(
                 f"Execution failed: {e}",
                 agent_name=self.agent_name,
             ) from e
 
-    def _build_prompt(self, target: str, context: dict, org_profile) -> str:
-        """Build the security review prompt."""
-        parts = [f"Security Review Target:\n{target}\n"]
+    def _build_prompt(
+        self,
+        target: str,
+        context: dict,
+        org_profile,
+        token_budget: int | None = None,
+    ) -> str:
+        """Build the security review prompt, truncating code so it fits token_budget."""
+        if token_budget is None:
+            token_budget = self.get_prompt_budget()
+
+        def render(code: list[str]) -> str:
+            parts = [f"Security Review Target:\n{target}\n"]
+
+            if org_profile:
+                parts.append(
+                    f"\nOrganization:\n"
+                    f"- Name: {org_profile.org_name}\n"
+                    f"- Type: {org_profile.org_type}\n"
+                )
 
-        if org_profile:
-            parts.append(
-                f"\nOrganization:\n"
-                f"- Name: {org_profile.org_name}\n"
-                f"- Type: {org_profile.org_type}\n"
-            )
+            if context.get("code_content"):
+                parts.append(f"\nCode to Review:\n```\n{code[0]}\n```\n")
 
-        if context.get("code_content"):
-            parts.append(f"\nCode to Review:\n```\n{context['code_content']}\n```\n")
+            if context.get("dependencies"):
+                deps = "\n".join(f"- {d}" for d in context["dependencies"])
+                parts.append(f"\nDependencies:\n{deps}\n")
 
-        if context.get("dependencies"):
-            deps = "\n".join(f"- {d}" for d in context["dependencies"])
-            parts.append(f"\nDependencies:\n{deps}\n")
+            if context.get("configuration"):
+                import json
+                parts.append(
+                    f"\nConfiguration:\n{json.dumps(context['configuration'], indent=2)}\n"
+                )
 
-        if context.get("configuration"):
-            import json
-            parts.append(f"\nConfiguration:\n{json.dumps(context['configuration'], indent=2)}\n")
+            if context.get("access_patterns"):
+                patterns = "\n".join(f"- {p}" for p in context["access_patterns"])
+                parts.append(f"\nAccess Patterns:\n{patterns}\n")
 
-        if context.get("access_patterns"):
-            patterns = "\n".join(f"- {p}" for p in context["access_patterns"])
-            parts.append(f"\nAccess Patterns:\n{patterns}\n")
+            parts.append(
+                "\nProvide a security review as JSON with keys: "
+                "assessment, vulnerabilities, dependency_audit, recommendations, "
+                "compliance_notes, risk_score"
+            )
 
-        parts.append(
-            "\nProvide a security review as JSON with keys: "
-            "assessment, vulnerabilities, dependency_audit, recommendations, compliance_notes, risk_score"
-        )
+            return "".join(parts)
 
-        return "".join(parts)
+        return self.fit_documents(
+            [context.get("code_content") or ""], render, token_budget
+        )
 
     def _validate_result(self, result: dict) -> dict:
         """Validate and structure the parsed result."""
@@ -26,6 +26,7 @@ class TechnicalWriterAgent(BaseAgent):
 
     agent_name = "technical_writer"
     version = "1.0.0"
+    expected_output_tokens = 3072
 
     def get_system_prompt(self) -> str:
         """Return the technical writer system prompt."""
@@ -91,12 +92,15 @@ Format your response as JSON with keys: document, doc_type, sections, review_not
             context = agent_input.data.get("context", {})
             org_profile = agent_input.context.org_profile
 
-            user_prompt = self._build_prompt(task, subject, context, org_profile)
+            max_tokens = self.get_max_tokens(agent_input)
+            user_prompt = self._build_prompt(
+                task, subject, context, org_profile, self.get_prompt_budget(max_tokens)
+            )
 
-            logger.info(f"{self.agent_name}: {task} documentation for: {subject[:80]}")
+            logger.info("%s: %s documentation for: %.80s", self.agent_name, task, subject)
             response_text = await self.call_llm(
                 user_prompt=user_prompt,
-                max_tokens=4096,
+                max_tokens=max_tokens,
                 temperature=0.3,
             )
 
@@ -109,41 +113,62 @@ Format your response as JSON with keys: document, doc_type, sections, review_not
             )
 
         except Exception as e:
-            logger.error(f"{self.agent_name}: Execution failed: {e}")
+            logger.error("%s: Execution failed: %s", self.agent_name, e)
             raise AgentExecutionError(
                 f"Execution failed: {e}",
                 agent_name=self.agent_name,
             ) from e
 
-    def _build_prompt(self, task: str, subject: str, context: dict, org_profile) -> str:
-        """Build the documentation task prompt."""
-        parts = [f"Documentation Task: {task}\nSubject: {subject}\n"]
+    def _build_prompt(
+        self,
+        task: str,
+        subject: str,
+        context: dict,
+        org_profile,
+        token_budget: int | None = None,
+    ) -> str:
+        """
+        Build the documentation task prompt.
 
-        if org_profile:
-            parts.append(
-                f"\nOrganization:\n"
-                f"- Name: {org_profile.org_name}\n"
-                f"- Type: {org_profile.org_type}\n"
-            )
+        Source code and existing docs share what token_budget leaves after
+        the rest of the prompt, in proportion to their size, and are
+        truncated to their share.
+        """
+        if token_budget is None:
+            token_budget = self.get_prompt_budget()
+
+        def render(documents: list[str]) -> str:
+            source_code, existing_docs = documents
+            parts = [f"Documentation Task: {task}\nSubject: {subject}\n"]
+
+            if org_profile:
+                parts.append(
+                    f"\nOrganization:\n"
+                    f"- Name: {org_profile.org_name}\n"
+                    f"- Type: {org_profile.org_type}\n"
+                )
+
+            audience = context.get("audience", "developer")
+            parts.append(f"\nTarget Audience: {audience}\n")
 
-        audience = context.get("audience", "developer")
-        parts.append(f"\nTarget Audience: {audience}\n")
+            doc_format = context.get("format", "markdown")
+            parts.append(f"Output Format: {doc_format}\n")
 
-        doc_format = context.get("format", "markdown")
-        parts.append(f"Output Format: {doc_format}\n")
+            if context.get("source_code"):
+                parts.append(f"\nSource Code:\n```\n{source_code}\n```\n")
 
-        if context.get("source_code"):
-            parts.append(f"\nSource Code:\n```\n{context['source_code']}\n```\n")
+            if context.get("existing_docs"):
+                parts.append(f"\nExisting Documentation:\n{existing_docs}\n")
 
-        if context.get("existing_docs"):
-            parts.append(f"\nExisting Documentation:\n{context['existing_docs']}\n")
+            parts.append(
+                "\nProvide documentation output as JSON with keys: "
+                "document, doc_type, sections, review_notes, suggested_improvements, metadata"
+            )
 
-        parts.append(
-            "\nProvide documentation output as JSON with keys: "
-            "document, doc_type, sections, review_notes, suggested_improvements, metadata"
-        )
+            return "".join(parts)
 
-        return "".join(parts)
+        documents = [context.get("source_code") or "", context.get("existing_docs") or ""]
+        return self.fit_documents(documents, render, token_budget)
 
     def _validate_result(self, result: dict) -> dict:
         """Validate and structure the parsed result."""
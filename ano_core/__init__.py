@@ -5,7 +5,7 @@ Provides the foundational types, settings, error handling, and utilities
 for the Adaptive Network of Orchestrators framework.
 """
 
-from ano_core.settings import AnoSettings, load_settings, settings
+from ano_core.settings import AnoSettings, load_settings
 from ano_core.types import (
     AgentContext,
     AgentInput,
@@ -34,6 +34,20 @@ from ano_core.logging import get_agent_logger, setup_logging
 
 __version__ = "0.1.0"
 
+# Lazily built settings singleton, resolved by __getattr__ below
+settings: AnoSettings
+
+# Importing the submodule bound it as ``ano_core.settings``; drop that binding
+# so the name resolves to the lazily built settings singleton instead.
+globals().pop("settings", None)
+
+
+def __getattr__(name: str) -> AnoSettings:
+    """Resolve ``settings`` lazily so importing ano_core doesn't load config."""
+    if name == "settings":
+        return load_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 __all__ = [
     # Settings
     "AnoSettings",
@@ -10,9 +10,20 @@ import logging
 import sys
 from typing import Optional
 
+try:
+    import orjson
+except ImportError:
+    # orjson not installed (optional "speedups" extra), use stdlib json
+    orjson = None  # type: ignore[assignment]
+
 
 class JsonFormatter(logging.Formatter):
-    """Simple JSON formatter for structured logging."""
+    """
+    Simple JSON formatter for structured logging.
+
+    Uses orjson for serialization when installed, falling back to the
+    standard library json module.
+    """
 
     def format(self, record: logging.LogRecord) -> str:
         log_obj = {
@@ -22,9 +33,12 @@ class JsonFormatter(logging.Formatter):
             "message": record.getMessage(),
         }
         # Include extra fields from LoggerAdapter
-        if hasattr(record, "agent_name"):
-            log_obj["agent_name"] = record.agent_name
-        return json.dumps(log_obj)
+        agent_name = record.__dict__.get("agent_name")
+        if agent_name is not None:
+            log_obj["agent_name"] = agent_name
+        if orjson is not None:
+            return orjson.dumps(log_obj, default=str).decode()
+        return json.dumps(log_obj, default=str)
 
 
 def setup_logging(
@@ -5,14 +5,20 @@ Provides centralized configuration management with environment variable support,
 TOML overlay, and feature flag detection.
 """
 
+import functools
+import logging
 import os
+import tomllib
+from collections.abc import Mapping
 from enum import Enum
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
-from pydantic import Field
+from pydantic import Field, PrivateAttr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+logger = logging.getLogger(__name__)
+
 
 class AnoProfile(str, Enum):
     """Available ANO deployment profiles."""
@@ -34,6 +40,7 @@ class AnoSettings(BaseSettings):
         env_file_encoding="utf-8",
         case_sensitive=True,
         extra="ignore",
+        frozen=True,
     )
 
     # Profile and features
@@ -81,58 +88,91 @@ class AnoSettings(BaseSettings):
         description="Path to TOML configuration file",
     )
 
+    # Parsed ANO_FEATURES, bound per instance so has_feature is a set lookup
+    _features_fs: frozenset[str] = PrivateAttr(default=frozenset())
+
+    def model_post_init(self, __context: Any) -> None:
+        """Bind the parsed feature set once the fields are validated."""
+        self._features_fs = _parse_features(self.ANO_FEATURES)
+
+    def model_copy(
+        self, *, update: Optional[Mapping[str, Any]] = None, deep: bool = False
+    ) -> "AnoSettings":
+        """Copy the settings, re-binding the feature set from the copy's ANO_FEATURES."""
+        copied = super().model_copy(update=update, deep=deep)
+        copied._features_fs = _parse_features(copied.ANO_FEATURES)
+        return copied
+
     @property
     def features(self) -> frozenset[str]:
-        """Parse ANO_FEATURES into a frozenset of feature flags."""
-        if not self.ANO_FEATURES:
-            return frozenset()
-        return frozenset(
-            flag.strip() for flag in self.ANO_FEATURES.split(",") if flag.strip()
-        )
+        """Feature flags parsed from ANO_FEATURES (bound at construction)."""
+        return self._features_fs
 
     def has_feature(self, flag: str) -> bool:
         """Check if a feature flag is enabled."""
-        return flag in self.features
+        return flag in self._features_fs
+
 
+@functools.lru_cache(maxsize=32)
+def _parse_features(raw: str) -> frozenset[str]:
+    """
+    Parse a comma-separated feature string into a frozenset of flags.
 
+    Cached on the raw string rather than on the settings instance, so copies
+    made with model_copy(update=...) see their own flags.
+    """
+    return frozenset(flag.strip() for flag in raw.split(",") if flag.strip())
+
+
+@functools.lru_cache(maxsize=1)
 def load_settings() -> AnoSettings:
     """
     Load ANO settings from environment and optional TOML file.
 
     TOML configuration provides defaults that can be overridden by
-    environment variables.
+    environment variables. The result is cached, so the environment and
+    TOML file are only read once per process.
 
     Returns:
         AnoSettings instance with merged configuration
     """
     base_settings = AnoSettings()
 
-    # If TOML config file specified, overlay values
+    # If TOML config file specified, rebuild with its values as init kwargs
     if base_settings.ANO_CONFIG_FILE:
         config_path = Path(base_settings.ANO_CONFIG_FILE)
-        if config_path.exists():
-            try:
-                import tomli
-
-                with open(config_path, "rb") as f:
-                    toml_data = tomli.load(f)
-
-                # Merge TOML data with environment (env vars take precedence)
-                # Only update fields that aren't already set from environment
-                for key, value in toml_data.items():
-                    if key.upper() not in os.environ:
-                        setattr(base_settings, key.upper(), value)
-            except ImportError:
-                # tomli not installed, skip TOML loading
-                pass
-            except Exception as e:
-                # Log warning but continue with env-only settings
-                import logging
-
-                logging.warning(f"Failed to load TOML config: {e}")
+        try:
+            # One bulk read, then parse the in-memory string
+            toml_data = tomllib.loads(config_path.read_text(encoding="utf-8"))
+
+            # Merge TOML data with environment (env vars take precedence)
+            # Only pass fields that aren't already set from environment
+            env_keys = frozenset(os.environ)
+            toml_values = {}
+            for key, value in toml_data.items():
+                upper_key = key.upper()
+                if upper_key not in env_keys:
+                    toml_values[upper_key] = value
+            if toml_values:
+                base_settings = AnoSettings(**toml_values)
+        except FileNotFoundError:
+            # Config file missing, skip TOML loading
+            pass
+        except Exception as e:
+            # Log warning but continue with env-only settings
+            logger.warning("Failed to load TOML config: %s", e)
 
     return base_settings
 
 
-# Module-level singleton
-settings = load_settings()
+# Module-level singleton, built on first access by __getattr__ below
+settings: AnoSettings
+
+
+def __getattr__(name: str) -> AnoSettings:
+    """Build the module-level ``settings`` singleton on first access."""
+    if name == "settings":
+        value = load_settings()
+        globals()["settings"] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
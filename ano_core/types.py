@@ -3,14 +3,48 @@ ANO Core Types
 
 Defines the foundational data structures used throughout the ANO framework
 for agent execution, context passing, and policy reporting.
+
+Types that validate external input (OrgProfile, PolicyViolation,
+PolicyReport) are Pydantic models. Types constructed internally once per
+agent invocation (AgentContext, AgentInput, AgentMetadata, AgentOutput)
+are slotted dataclasses to keep the execution hot path cheap.
 """
 
+from collections.abc import Mapping, MutableMapping
+from dataclasses import Field as DataclassField
+from dataclasses import dataclass, field, fields
 from datetime import datetime
-from typing import Any, Optional
+from typing import Any, ClassVar, Optional
 
 from pydantic import BaseModel, Field
 
 
+def _dump_value(value: Any) -> Any:
+    """Recursively convert dataclasses and Pydantic models to builtins."""
+    if isinstance(value, _DumpMixin):
+        return value.model_dump()
+    if isinstance(value, BaseModel):
+        return value.model_dump()
+    if isinstance(value, Mapping):
+        return {k: _dump_value(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_dump_value(v) for v in value]
+    return value
+
+
+class _DumpMixin:
+    """Pydantic-compatible ``model_dump()`` for the dataclass types."""
+
+    __slots__ = ()
+
+    # Set by @dataclass on each subclass; declared so fields(self) type-checks
+    __dataclass_fields__: ClassVar[dict[str, DataclassField[Any]]]
+
+    def model_dump(self) -> dict[str, Any]:
+        """Return the instance as a dict of builtins (nested values included)."""
+        return {f.name: _dump_value(getattr(self, f.name)) for f in fields(self)}
+
+
 class OrgProfile(BaseModel):
     """
     Organization profile for contextual agent execution.
@@ -68,76 +102,68 @@ class OrgProfile(BaseModel):
     )
 
 
-class AgentContext(BaseModel):
+@dataclass(slots=True)
+class AgentContext(_DumpMixin):
     """
     Runtime context passed to agents during pipeline execution.
 
     Contains organizational profile, pipeline state, and outputs from
     upstream agents.
+
+    Attributes:
+        org_profile: Organization profile for this execution
+        pipeline_state: Shared state across pipeline execution
+        upstream_outputs: Outputs from upstream agents in the pipeline (the
+            coordinator layers this as a ChainMap, one map per stage)
     """
 
-    org_profile: OrgProfile = Field(
-        description="Organization profile for this execution",
-    )
-    pipeline_state: dict[str, Any] = Field(
-        default_factory=dict,
-        description="Shared state across pipeline execution",
-    )
-    upstream_outputs: dict[str, Any] = Field(
-        default_factory=dict,
-        description="Outputs from upstream agents in the pipeline",
-    )
+    org_profile: OrgProfile
+    pipeline_state: dict[str, Any] = field(default_factory=dict)
+    upstream_outputs: MutableMapping[str, Any] = field(default_factory=dict)
 
 
-class AgentInput(BaseModel):
+@dataclass(slots=True)
+class AgentInput(_DumpMixin):
     """
     Input data structure for agent execution.
 
     Combines the agent's specific input data with runtime context and
     any policy attachments.
+
+    Attributes:
+        data: Agent-specific input data
+        context: Runtime execution context
+        policy_attachments: List of policy document identifiers to enforce
     """
 
-    data: dict[str, Any] = Field(
-        description="Agent-specific input data",
-    )
-    context: AgentContext = Field(
-        description="Runtime execution context",
-    )
-    policy_attachments: list[str] = Field(
-        default_factory=list,
-        description="List of policy document identifiers to enforce",
-    )
+    data: dict[str, Any]
+    context: AgentContext
+    policy_attachments: list[str] = field(default_factory=list)
 
 
-class AgentMetadata(BaseModel):
+@dataclass(slots=True)
+class AgentMetadata(_DumpMixin):
     """
     Metadata about agent execution.
 
     Tracks execution timing, LLM usage, and version information for
     observability and cost tracking.
+
+    Attributes:
+        agent_name: Name of the agent that executed
+        version: Agent version identifier
+        started_at: Execution start timestamp
+        completed_at: Execution completion timestamp
+        llm_calls: Number of LLM API calls made
+        tokens_used: Total tokens consumed (prompt + completion)
     """
 
-    agent_name: str = Field(
-        description="Name of the agent that executed",
-    )
-    version: str = Field(
-        description="Agent version identifier",
-    )
-    started_at: datetime = Field(
-        description="Execution start timestamp",
-    )
-    completed_at: Optional[datetime] = Field(
-        default=None,
-        description="Execution completion timestamp",
-    )
-    llm_calls: int = Field(
-        default=0,
-        description="Number of LLM API calls made",
-    )
-    tokens_used: int = Field(
-        default=0,
-        description="Total tokens consumed (prompt + completion)",
-    )
+    agent_name: str
+    version: str
+    started_at: datetime
+    completed_at: Optional[datetime] = None
+    llm_calls: int = 0
+    tokens_used: int = 0
 
 
 class PolicyViolation(BaseModel):
@@ -184,21 +210,20 @@ class PolicyReport(BaseModel):
     )
 
 
-class AgentOutput(BaseModel):
+@dataclass(slots=True)
+class AgentOutput(_DumpMixin):
     """
     Output data structure from agent execution.
 
     Contains the agent's result data, execution metadata, and optional
     policy enforcement report.
+
+    Attributes:
+        result: Agent-specific output data
+        metadata: Execution metadata
+        policy_report: Policy enforcement report if policies were attached
     """
 
-    result: dict[str, Any] = Field(
-        description="Agent-specific output data",
-    )
-    metadata: AgentMetadata = Field(
-        description="Execution metadata",
-    )
-    policy_report: Optional[PolicyReport] = Field(
-        default=None,
-        description="Policy enforcement report if policies were attached",
-    )
+    result: dict[str, Any]
+    metadata: AgentMetadata
+    policy_report: Optional[PolicyReport] = None
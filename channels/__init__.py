@@ -5,8 +5,28 @@ Deployment channels for agents — Telegram, web chat, CLI.
 Provides a unified interface for agents to communicate across different platforms.
 """
 
+import importlib
+
 from channels.base_channel import BaseChannel
-from channels.telegram import TelegramBotService, TelegramConfig, create_webhook_app
+
+# Channel exports resolved on first access, so e.g. the CLI REPL doesn't pull
+# in httpx/FastAPI through the Telegram package.
+_LAZY = {
+    "TelegramBotService": ("channels.telegram", "TelegramBotService"),
+    "TelegramConfig": ("channels.telegram", "TelegramConfig"),
+    "create_webhook_app": ("channels.telegram", "create_webhook_app"),
+}
+
+
+def __getattr__(name: str):
+    """Import channel exports lazily (PEP 562)."""
+    if name in _LAZY:
+        module_name, attr = _LAZY[name]
+        value = getattr(importlib.import_module(module_name), attr)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "BaseChannel",
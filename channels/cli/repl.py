@@ -5,20 +5,37 @@ Interactive command-line REPL for testing agents locally.
 """
 
 import asyncio
-import sys
+import inspect
 import logging
+import os
+import sys
 from typing import Any, Optional, Dict
 
 from channels.base_channel import BaseChannel
 
 logger = logging.getLogger(__name__)
 
+# ANSI: erase display, cursor home
+_CLEAR_SEQUENCE = "\033[2J\033[H"
+
+_BANNER = "ANO Agent REPL\nType 'quit' or 'exit' to stop, 'help' for commands.\n\n"
+
 
 class CLIRepl(BaseChannel):
     """Interactive CLI REPL for testing agents locally."""
 
     channel_name = "cli"
 
+    _HELP_TEXT = (
+        "ANO Agent REPL Commands:\n"
+        "  quit, exit, q - Exit the REPL\n"
+        "  help          - Show this help message\n"
+        "  clear         - Clear the screen\n"
+        "\n"
+        "Everything else is sent to the agent.\n"
+        "\n"
+    )
+
     def __init__(self, agent: Any = None, prompt: str = "> "):
         """
         Initialize CLI REPL.
@@ -28,9 +45,30 @@ class CLIRepl(BaseChannel):
             prompt: Prompt string for user input
         """
         super().__init__()
-        self._agent = agent
         self.prompt = prompt
         self._running = False
+        self._clear_seq = _CLEAR_SEQUENCE if sys.platform != "win32" else None
+        self.set_agent(agent)
+
+        # Built-in commands, keyed by lowercased input
+        self._commands = {
+            "quit": self._quit,
+            "exit": self._quit,
+            "q": self._quit,
+            "help": self._print_help,
+            "clear": self._clear_screen,
+        }
+
+    def set_agent(self, agent: Any) -> None:
+        """
+        Set the agent that handles messages and resolve its execute method.
+
+        Args:
+            agent: An agent instance with an execute(text, metadata) method
+        """
+        super().set_agent(agent)
+        self._execute = getattr(agent, "execute", None) if agent else None
+        self._is_async = inspect.iscoroutinefunction(self._execute)
 
     async def send_message(self, recipient_id: str, text: str, **kwargs) -> bool:
         """
@@ -67,15 +105,19 @@ class CLIRepl(BaseChannel):
         metadata = metadata or {}
 
         # Route to agent
-        if self._agent and hasattr(self._agent, "execute"):
+        execute = self._execute
+        if execute is not None:
             try:
-                result = self._agent.execute(text, metadata)
-                if hasattr(result, "__await__"):
-                    result = await result
-                return result
+                if self._is_async:
+                    response: str = await execute(text, metadata)
+                else:
+                    response = execute(text, metadata)
+                    if inspect.isawaitable(response):
+                        response = await response
+                return response
             except Exception as e:
                 logger.error(f"[CLI] Agent execution error: {e}")
-                return f"Error: {str(e)}"
+                return f"Error: {e}"
         else:
             return "CLI REPL not configured with an agent."
 
@@ -89,17 +131,15 @@ class CLIRepl(BaseChannel):
             user_id: User ID for this REPL session
         """
         self._running = True
-        print("ANO Agent REPL")
-        print("Type 'quit' or 'exit' to stop, 'help' for commands.")
-        print()
+        sys.stdout.write(_BANNER)
+
+        prompt = self.prompt
+        commands = self._commands
 
         while self._running:
             try:
                 # Read user input
-                user_input = await asyncio.get_event_loop().run_in_executor(
-                    None,
-                    lambda: input(self.prompt)
-                )
+                user_input = await asyncio.to_thread(input, prompt)
 
                 # Strip whitespace
                 user_input = user_input.strip()
@@ -108,18 +148,10 @@ class CLIRepl(BaseChannel):
                 if not user_input:
                     continue
 
-                # Handle quit commands
-                if user_input.lower() in ("quit", "exit", "q"):
-                    print("Goodbye!")
-                    break
-
                 # Handle built-in commands
-                if user_input.lower() == "help":
-                    self._print_help()
-                    continue
-
-                if user_input.lower() == "clear":
-                    self._clear_screen()
+                command = commands.get(user_input.lower())
+                if command is not None:
+                    command()
                     continue
 
                 # Route to agent
@@ -137,7 +169,7 @@ class CLIRepl(BaseChannel):
 
             except Exception as e:
                 logger.error(f"[CLI] REPL error: {e}")
-                print(f"Error: {str(e)}")
+                print(f"Error: {e}")
                 print()
 
         self._running = False
@@ -146,24 +178,23 @@ class CLIRepl(BaseChannel):
         """Stop the REPL."""
         self._running = False
 
+    def _quit(self) -> None:
+        """Say goodbye and end the REPL loop."""
+        print("Goodbye!")
+        self._running = False
+
     def _print_help(self) -> None:
         """Print help message."""
-        print("ANO Agent REPL Commands:")
-        print("  quit, exit, q - Exit the REPL")
-        print("  help          - Show this help message")
-        print("  clear         - Clear the screen")
-        print()
-        print("Everything else is sent to the agent.")
-        print()
+        sys.stdout.write(self._HELP_TEXT)
 
     def _clear_screen(self) -> None:
         """Clear the terminal screen."""
         # Works on Unix/Linux/Mac
-        if sys.platform != "win32":
-            print("\033[2J\033[H", end="")
+        if self._clear_seq is not None:
+            sys.stdout.write(self._clear_seq)
+            sys.stdout.flush()
         else:
             # Windows
-            import os
             os.system("cls")
 
 
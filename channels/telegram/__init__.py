@@ -4,9 +4,27 @@ Telegram Channel Module
 Telegram bot implementation for deploying agents.
 """
 
+import importlib
+
 from channels.telegram.config import TelegramConfig
-from channels.telegram.bot_service import TelegramBotService
-from channels.telegram.webhook import create_webhook_app
+
+# Service and webhook pull in httpx/FastAPI, so they're resolved on first
+# access; loading TelegramConfig alone stays cheap.
+_LAZY = {
+    "TelegramBotService": ("channels.telegram.bot_service", "TelegramBotService"),
+    "create_webhook_app": ("channels.telegram.webhook", "create_webhook_app"),
+}
+
+
+def __getattr__(name: str):
+    """Import Telegram exports lazily (PEP 562)."""
+    if name in _LAZY:
+        module_name, attr = _LAZY[name]
+        value = getattr(importlib.import_module(module_name), attr)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "TelegramConfig",
@@ -4,17 +4,42 @@ Telegram Authentication and Authorization
 Tier-based access control for Telegram bot users.
 """
 
+import sys
 from dataclasses import dataclass, field
 from typing import Optional, List
 
+# Level for names that aren't tiers; no user tier reaches it
+_UNREACHABLE_LEVEL = sys.maxsize
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class TierConfig:
-    """Configuration for a single access tier."""
+    """
+    Configuration for a single access tier.
+
+    Immutable and hashable. Features may be passed as any iterable of
+    names; they are stored as a frozenset for constant-time membership checks.
+    """
 
     name: str
     level: int  # higher = more access
-    features: List[str] = field(default_factory=list)
+    features: frozenset[str] = field(default_factory=frozenset)
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.features, frozenset):
+            object.__setattr__(self, "features", frozenset(self.features))
+
+
+# Built once at import; tiers are immutable so default_tiers() can share them
+_DEFAULT_TIERS: tuple[TierConfig, ...] = (
+    TierConfig("free", 0, frozenset({"help", "start", "info"})),
+    TierConfig("basic", 1, frozenset({"help", "start", "info", "query", "analyze"})),
+    TierConfig(
+        "premium",
+        2,
+        frozenset({"help", "start", "info", "query", "analyze", "export", "custom"}),
+    ),
+)
 
 
 class TelegramAuth:
@@ -36,6 +61,9 @@ class TelegramAuth:
         self._tier_levels: dict[str, int] = {
             tier.name: tier.level for tier in self.tiers
         }
+        self._granted: frozenset[tuple[str, str]] = frozenset(
+            (tier.name, feature) for tier in self.tiers for feature in tier.features
+        )
 
     def check_access(self, user_tier: str, required_feature: str) -> bool:
         """
@@ -48,20 +76,16 @@ class TelegramAuth:
         Returns:
             True if user has access, False otherwise
         """
-        # Get user's tier config
-        tier_config = self._tier_by_name.get(user_tier)
-        if not tier_config:
-            return False
-
-        # Check if required_feature is a feature name
-        if required_feature in tier_config.features:
+        # Direct feature grant
+        if (user_tier, required_feature) in self._granted:
             return True
 
-        # Check if required_feature is a tier name (hierarchical check)
-        required_level = self._tier_levels.get(required_feature, float('inf'))
-        user_level = tier_config.level
+        user_level = self._tier_levels.get(user_tier)
+        if user_level is None:
+            return False
 
-        return user_level >= required_level
+        # Check if required_feature is a tier name (hierarchical check)
+        return user_level >= self._tier_levels.get(required_feature, _UNREACHABLE_LEVEL)
 
     def get_default_tier(self) -> str:
         """
@@ -84,20 +108,4 @@ class TelegramAuth:
         Returns:
             List of default tiers (free, basic, premium)
         """
-        return [
-            TierConfig(
-                "free",
-                0,
-                ["help", "start", "info"]
-            ),
-            TierConfig(
-                "basic",
-                1,
-                ["help", "start", "info", "query", "analyze"]
-            ),
-            TierConfig(
-                "premium",
-                2,
-                ["help", "start", "info", "query", "analyze", "export", "custom"]
-            ),
-        ]
+        return list(_DEFAULT_TIERS)
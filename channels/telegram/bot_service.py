@@ -5,11 +5,12 @@ Core service for handling Telegram bot interactions.
 Routes messages to configured agent and manages rate limiting, authentication.
 """
 
+import asyncio
 import httpx
+import inspect
 import logging
 import time
 from typing import Any, Callable, Optional
-from collections import defaultdict
 
 from channels.base_channel import BaseChannel
 from channels.telegram.config import TelegramConfig
@@ -18,9 +19,31 @@ from channels.telegram.commands import CommandRegistry
 
 logger = logging.getLogger(__name__)
 
+# Seconds between sweeps of idle rate-limit buckets
+_GC_INTERVAL_SECONDS = 30.0
+
+# Fixed replies, built once rather than per message
+_RATE_LIMITED_MSG = "You're sending messages too fast. Please wait a moment."
+_UNKNOWN_CMD_TEMPLATE = "Unknown command: /%s\n\nType /help to see available commands."
+_TIER_DENIED_TEMPLATE = (
+    "The /%s command requires %s tier access. Your current tier: %s"
+)
+_PROCESSING_ERROR_MSG = "Sorry, I encountered an error processing your message."
+_NO_HANDLER_MSG = (
+    "I don't understand. Please use a command like /help, "
+    "or configure a message handler for this bot."
+)
+_TRUNCATION_SUFFIX = "\n\n[Message truncated]"
+
 
 class TelegramBotService(BaseChannel):
-    """Telegram bot that routes messages to an agent."""
+    """
+    Telegram bot that routes messages to an agent.
+
+    The first message starts a background task that sweeps idle rate-limit
+    buckets. Callers outside the webhook app's lifespan must ``await
+    aclose()`` before their event loop ends to stop it.
+    """
 
     channel_name = "telegram"
 
@@ -40,15 +63,77 @@ class TelegramBotService(BaseChannel):
         """
         super().__init__()
         self.config = config
-        self._agent = agent
+        self.set_agent(agent)
         self.auth = auth or TelegramAuth()
         self.commands = CommandRegistry()
 
-        # Rate limiting: user_id -> list of timestamps
-        self._rate_limits: dict[int, list[float]] = defaultdict(list)
+        # Rate limiting token buckets: user_id -> (tokens, last_refill)
+        self._buckets: dict[int, tuple[float, float]] = {}
 
         # Message handler for non-command messages
-        self._message_handler: Optional[Callable[[str, dict], str]] = None
+        # May be sync or async; set_message_handler() records which
+        self._message_handler: Optional[Callable[[str, dict], Any]] = None
+        self._message_handler_is_async = False
+
+        # Shared Bot API client, created on first request
+        self._client: Optional[httpx.AsyncClient] = None
+
+        # Background sweep of idle buckets, started on first message
+        self._gc_task: Optional[asyncio.Task] = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """
+        Return the pooled Bot API client, creating it on first use.
+
+        Reusing one client keeps connections to api.telegram.org alive
+        across messages instead of handshaking on every request.
+
+        Returns:
+            httpx.AsyncClient bound to this bot's API base URL
+        """
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                base_url=f"https://api.telegram.org/bot{self.config.bot_token}",
+                timeout=10.0,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            )
+        return self._client
+
+    def _ensure_gc_task(self) -> None:
+        """
+        Start the cleanup task unless one is already running on this loop.
+
+        A task that has finished, or that belongs to an event loop other than
+        the running one (e.g. a previous asyncio.run()), is replaced.
+        """
+        task = self._gc_task
+        if (
+            task is None
+            or task.done()
+            or task.get_loop() is not asyncio.get_running_loop()
+        ):
+            self._gc_task = asyncio.create_task(self._gc_loop())
+
+    async def aclose(self) -> None:
+        """Stop background cleanup and close the pooled Bot API client."""
+        task, self._gc_task = self._gc_task, None
+        # A task left on a finished loop can no longer be cancelled
+        if task is not None and not task.get_loop().is_closed():
+            task.cancel()
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def set_agent(self, agent: Any) -> None:
+        """
+        Set the agent that handles messages and resolve its execute method.
+
+        Args:
+            agent: An agent instance with an execute(text, metadata) method
+        """
+        super().set_agent(agent)
+        self._execute = getattr(agent, "execute", None) if agent else None
+        self._is_async = inspect.iscoroutinefunction(self._execute)
 
     def set_message_handler(self, handler: Callable[[str, dict], str]) -> None:
         """
@@ -58,10 +143,11 @@ class TelegramBotService(BaseChannel):
             handler: Callable that takes (text, metadata) and returns response text
         """
         self._message_handler = handler
+        self._message_handler_is_async = inspect.iscoroutinefunction(handler)
 
     async def send_message(
         self,
-        chat_id: str,
+        chat_id: int | str,
         text: str,
         parse_mode: Optional[str] = None
     ) -> bool:
@@ -69,7 +155,7 @@ class TelegramBotService(BaseChannel):
         Send message via Telegram Bot API using httpx.
 
         Args:
-            chat_id: Telegram chat ID
+            chat_id: Telegram chat ID (integer ID or @channel username)
             text: Message text to send
             parse_mode: Optional parse mode override (Markdown, HTML, or None)
 
@@ -81,29 +167,29 @@ class TelegramBotService(BaseChannel):
             return False
 
         # Truncate message if needed
-        if len(text) > self.config.max_message_length:
-            text = text[:self.config.max_message_length - 50] + "\n\n[Message truncated]"
+        limit = self.config.max_message_length
+        if len(text) > limit:
+            text = "".join((text[:limit - 50], _TRUNCATION_SUFFIX))
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    f"https://api.telegram.org/bot{self.config.bot_token}/sendMessage",
-                    json={
-                        "chat_id": int(chat_id) if chat_id.isdigit() else chat_id,
-                        "text": text,
-                        "parse_mode": parse_mode or self.config.parse_mode,
-                    },
-                    timeout=10.0,
+            client = self._get_client()
+            response = await client.post(
+                "/sendMessage",
+                json={
+                    "chat_id": chat_id,
+                    "text": text,
+                    "parse_mode": parse_mode or self.config.parse_mode,
+                },
+            )
+
+            if response.status_code == 200:
+                logger.debug(f"[Telegram] Message sent to {chat_id}")
+                return True
+            else:
+                logger.error(
+                    f"[Telegram] Failed to send message: {response.status_code} - {response.text}"
                 )
-
-                if response.status_code == 200:
-                    logger.debug(f"[Telegram] Message sent to {chat_id}")
-                    return True
-                else:
-                    logger.error(
-                        f"[Telegram] Failed to send message: {response.status_code} - {response.text}"
-                    )
-                    return False
+                return False
 
         except Exception as e:
             logger.error(f"[Telegram] Failed to send message: {e}")
@@ -113,29 +199,49 @@ class TelegramBotService(BaseChannel):
         """
         Check if user is within rate limit.
 
+        Uses a token bucket per user: the bucket holds up to
+        rate_limit_per_minute tokens, refills continuously over a minute,
+        and each message spends one token.
+
         Args:
             user_id: Telegram user ID
 
         Returns:
             True if user is within rate limit, False otherwise
         """
-        now = time.time()
-        window_start = now - 60  # 1 minute window
+        now = time.monotonic()
+        capacity = self.config.rate_limit_per_minute
 
-        # Remove timestamps outside the window
-        self._rate_limits[user_id] = [
-            ts for ts in self._rate_limits[user_id]
-            if ts > window_start
-        ]
+        tokens, last_refill = self._buckets.get(user_id, (capacity, now))
+        tokens = min(capacity, tokens + (now - last_refill) * capacity / 60.0)
 
-        # Check if over limit
-        if len(self._rate_limits[user_id]) >= self.config.rate_limit_per_minute:
+        if tokens < 1.0:
+            self._buckets[user_id] = (tokens, now)
             return False
 
-        # Add current timestamp
-        self._rate_limits[user_id].append(now)
+        self._buckets[user_id] = (tokens - 1.0, now)
         return True
 
+    def _sweep_buckets(self) -> None:
+        """
+        Drop rate-limit buckets idle for a full minute.
+
+        A bucket untouched for a minute has refilled completely, which is
+        the same state as having no bucket, so dropping it loses nothing.
+        """
+        cutoff = time.monotonic() - 60.0
+        self._buckets = {
+            user_id: bucket
+            for user_id, bucket in self._buckets.items()
+            if bucket[1] > cutoff
+        }
+
+    async def _gc_loop(self) -> None:
+        """Periodically sweep idle rate-limit buckets."""
+        while True:
+            await asyncio.sleep(_GC_INTERVAL_SECONDS)
+            self._sweep_buckets()
+
     async def handle_message(
         self,
         sender_id: str,
@@ -156,9 +262,11 @@ class TelegramBotService(BaseChannel):
         metadata = metadata or {}
         user_id = int(sender_id)
 
+        self._ensure_gc_task()
+
         # Check rate limit
         if not self._check_rate_limit(user_id):
-            return "You're sending messages too fast. Please wait a moment."
+            return _RATE_LIMITED_MSG
 
         # Parse command
         cmd_tuple = self.commands.parse_command(text)
@@ -167,60 +275,61 @@ class TelegramBotService(BaseChannel):
 
         if command:
             # Handle as command
-            handler = self.commands.get_handler(command)
-            if handler:
+            entry = self.commands.get_entry(command)
+            if entry:
+                handler, required_tier, is_async = entry
                 try:
                     # Check tier access if auth is configured
                     user_tier = metadata.get("tier", self.auth.get_default_tier())
-                    required_tier = self.commands.commands.get(command, {}).get("required_tier", "free")
 
                     if not self.auth.check_access(user_tier, required_tier):
-                        return (
-                            f"The /{command} command requires {required_tier} tier access. "
-                            f"Your current tier: {user_tier}"
-                        )
+                        return _TIER_DENIED_TEMPLATE % (command, required_tier, user_tier)
 
                     # Call command handler
-                    result = handler(sender_id, args, metadata)
-                    if hasattr(result, "__await__"):
-                        result = await result
-                    return result
+                    if is_async:
+                        response: str = await handler(sender_id, args, metadata)
+                    else:
+                        response = handler(sender_id, args, metadata)
+                        if inspect.isawaitable(response):
+                            response = await response
+                    return response
 
                 except Exception as e:
                     logger.error(f"[Telegram] Command handler error: {e}")
-                    return f"Error processing command: {str(e)}"
+                    return f"Error processing command: {e}"
             else:
-                return (
-                    f"Unknown command: /{command}\n\n"
-                    "Type /help to see available commands."
-                )
+                return _UNKNOWN_CMD_TEMPLATE % command
         else:
             # Handle as natural language message
             if self._message_handler:
                 try:
-                    result = self._message_handler(text, metadata)
-                    if hasattr(result, "__await__"):
-                        result = await result
-                    return result
+                    if self._message_handler_is_async:
+                        response = await self._message_handler(text, metadata)
+                    else:
+                        response = self._message_handler(text, metadata)
+                        if inspect.isawaitable(response):
+                            response = await response
+                    return response
                 except Exception as e:
                     logger.error(f"[Telegram] Message handler error: {e}")
-                    return "Sorry, I encountered an error processing your message."
+                    return _PROCESSING_ERROR_MSG
 
-            elif self._agent and hasattr(self._agent, "execute"):
+            elif self._execute is not None:
                 try:
-                    result = self._agent.execute(text, metadata)
-                    if hasattr(result, "__await__"):
-                        result = await result
-                    return result
+                    if self._is_async:
+                        response = await self._execute(text, metadata)
+                    else:
+                        # Keep blocking agents off the event loop
+                        response = await asyncio.to_thread(self._execute, text, metadata)
+                        if inspect.isawaitable(response):
+                            response = await response
+                    return response
                 except Exception as e:
                     logger.error(f"[Telegram] Agent execution error: {e}")
-                    return "Sorry, I encountered an error processing your message."
+                    return _PROCESSING_ERROR_MSG
 
             else:
-                return (
-                    "I don't understand. Please use a command like /help, "
-                    "or configure a message handler for this bot."
-                )
+                return _NO_HANDLER_MSG
 
     async def handle_update(self, update: dict[str, Any]) -> dict[str, bool]:
         """
@@ -259,8 +368,9 @@ class TelegramBotService(BaseChannel):
         # Route to handler
         response = await self.handle_message(str(user_id), text, metadata)
 
-        # Send response
-        await self.send_message(str(chat_id), response)
+        # Send response before taking the next update for this chat, so
+        # replies go out in order (the webhook already acked the request)
+        await self.send_message(chat_id, response)
 
         return {"ok": True}
 
@@ -303,26 +413,22 @@ class TelegramBotService(BaseChannel):
             if self.config.webhook_secret:
                 payload["secret_token"] = self.config.webhook_secret
 
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    f"https://api.telegram.org/bot{self.config.bot_token}/setWebhook",
-                    json=payload,
-                    timeout=10.0,
-                )
+            client = self._get_client()
+            response = await client.post("/setWebhook", json=payload)
 
-                if response.status_code == 200:
-                    data = response.json()
-                    if data.get("ok"):
-                        logger.info(f"[Telegram] Webhook set to {url}")
-                        return True
-                    else:
-                        logger.error(f"[Telegram] Webhook API error: {data}")
-                        return False
+            if response.status_code == 200:
+                data = response.json()
+                if data.get("ok"):
+                    logger.info(f"[Telegram] Webhook set to {url}")
+                    return True
                 else:
-                    logger.error(
-                        f"[Telegram] Failed to set webhook: {response.status_code} - {response.text}"
-                    )
+                    logger.error(f"[Telegram] Webhook API error: {data}")
                     return False
+            else:
+                logger.error(
+                    f"[Telegram] Failed to set webhook: {response.status_code} - {response.text}"
+                )
+                return False
 
         except Exception as e:
             logger.error(f"[Telegram] Failed to set webhook: {e}")
@@ -4,8 +4,31 @@ Command Registry
 Registry for /command handlers in Telegram bots.
 """
 
+import functools
+import inspect
+import re
 from typing import Callable, Optional, List, Tuple, Dict, Any
 
+# "/command[@botname] [args]" -- the command is the first whitespace-delimited
+# token with its leading slashes and any @mention removed, whatever its
+# characters
+_CMD_RE = re.compile(r"/+([^\s@]*)(?:@\S*)?(?:\s+(.*))?$", re.DOTALL)
+
+# Commands shorter than this are memoized by parse_command; longer ones are
+# almost always one-off arguments. Plain messages are never cached
+_PARSE_CACHE_MAX_LEN = 128
+
+
+def _parse_command(text: str) -> Tuple[Optional[str], str]:
+    """Parse '/command args' into (command, args); see CommandRegistry.parse_command."""
+    match = _CMD_RE.match(text)
+    if match is None:
+        return (None, text)
+    return (match.group(1).lower(), match.group(2) or "")
+
+
+_parse_command_cached = functools.lru_cache(maxsize=2048)(_parse_command)
+
 
 class CommandRegistry:
     """Registry for /command handlers."""
@@ -13,6 +36,8 @@ class CommandRegistry:
     def __init__(self):
         """Initialize command registry."""
         self.commands: Dict[str, Dict[str, Any]] = {}
+        # command -> (handler, required_tier, is_async), for single-lookup dispatch
+        self._entries: Dict[str, Tuple[Callable, str, bool]] = {}
 
     def register(
         self,
@@ -35,6 +60,11 @@ class CommandRegistry:
             "description": description,
             "required_tier": required_tier,
         }
+        self._entries[command] = (
+            handler,
+            required_tier,
+            inspect.iscoroutinefunction(handler),
+        )
 
     def get_handler(self, command: str) -> Optional[Callable]:
         """
@@ -49,6 +79,18 @@ class CommandRegistry:
         cmd_data = self.commands.get(command)
         return cmd_data["handler"] if cmd_data else None
 
+    def get_entry(self, command: str) -> Optional[Tuple[Callable, str, bool]]:
+        """
+        Get handler, required tier and async flag for a command in one lookup.
+
+        Args:
+            command: Command name (without leading /)
+
+        Returns:
+            (handler, required_tier, is_async) tuple, or None if command not found
+        """
+        return self._entries.get(command)
+
     def list_commands(self, user_tier: str = "free") -> List[Dict[str, Any]]:
         """
         List all commands accessible to a tier.
@@ -87,15 +129,8 @@ class CommandRegistry:
             "hello world" -> (None, "hello world")
             "/start@botname args" -> ("start", "args")  # handles bot mentions
         """
-        if not text.startswith('/'):
+        if not text.startswith("/"):
             return (None, text)
-
-        # Split into command and args
-        parts = text.split(maxsplit=1)
-        command_part = parts[0].lstrip('/')
-        args = parts[1] if len(parts) > 1 else ""
-
-        # Handle bot mentions (e.g., /start@botname)
-        command = command_part.split('@')[0].lower()
-
-        return (command, args)
+        if len(text) < _PARSE_CACHE_MAX_LEN:
+            return _parse_command_cached(text)
+        return _parse_command(text)
@@ -4,25 +4,97 @@ Telegram Webhook Handler
 FastAPI webhook endpoint for receiving Telegram updates.
 """
 
+import asyncio
+import hmac
+import json
 import logging
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, Request, HTTPException
 
 from channels.telegram.bot_service import TelegramBotService
 from channels.telegram.config import TelegramConfig
 
+try:
+    import orjson
+except ImportError:
+    # orjson not installed (optional "speedups" extra), use stdlib json
+    orjson = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
+# Update types that carry a message, checked in order to find the chat
+_MESSAGE_KEYS = ("message", "edited_message", "channel_post", "edited_channel_post")
+
+
+def _chat_key(update: dict) -> object:
+    """
+    Return the chat an update belongs to, for routing it to a worker.
+
+    Updates without a chat fall back to their update_id, so they still
+    spread across workers.
+    """
+    for key in _MESSAGE_KEYS:
+        message = update.get(key)
+        if isinstance(message, dict):
+            chat = message.get("chat")
+            if isinstance(chat, dict) and "id" in chat:
+                return chat["id"]
+    callback = update.get("callback_query")
+    if isinstance(callback, dict):
+        chat = (callback.get("message") or {}).get("chat") or {}
+        if "id" in chat:
+            return chat["id"]
+    return update.get("update_id")
+
+
+async def _process_updates(
+    queue: "asyncio.Queue[dict]",
+    bot_service: TelegramBotService
+) -> None:
+    """
+    Drain one worker's queue into the bot service, one update at a time.
+
+    Args:
+        queue: Queue of raw Telegram updates
+        bot_service: Telegram bot service instance
+    """
+    while True:
+        update = await queue.get()
+        try:
+            await bot_service.handle_update(update)
+        except Exception as e:
+            logger.error(f"[Telegram] Update handling error: {e}")
+        finally:
+            queue.task_done()
+
 
 def create_webhook_app(
     bot_service: TelegramBotService,
-    config: TelegramConfig
+    config: TelegramConfig,
+    queue_size: int = 1000,
+    workers: int = 4,
+    drain_timeout: float = 10.0
 ) -> FastAPI:
     """
     Create a FastAPI app with Telegram webhook endpoint.
 
+    Updates are acknowledged as soon as they are queued and processed by a
+    pool of background workers, so slow agents don't hold Telegram's request
+    open and one user's agent call doesn't hold up everyone else's. Each chat
+    is routed to a single worker (by hash of its chat id), so one chat's
+    updates are still handled one at a time and in order. Workers start with
+    the app's lifespan, or on the first update if the lifespan never runs
+    (e.g. when the app is mounted as a sub-application). On shutdown the
+    queued updates, which Telegram won't resend, are drained before the
+    workers stop.
+
     Args:
         bot_service: Telegram bot service instance
         config: Telegram configuration
+        queue_size: Maximum updates waiting per worker
+        workers: Number of chats whose updates are processed concurrently
+        drain_timeout: Seconds to wait at shutdown for queued updates
 
     Returns:
         FastAPI application
@@ -37,15 +109,51 @@ def create_webhook_app(
         uvicorn.run(app, host="0.0.0.0", port=8000)
         ```
     """
-    app = FastAPI(title="ANO Telegram Bot", version="1.0.0")
-
+    queues: list[asyncio.Queue[dict]] = [
+        asyncio.Queue(maxsize=queue_size) for _ in range(workers)
+    ]
+    webhook_secret = config.webhook_secret.encode()
+    worker_tasks: list[asyncio.Task] = []
+
+    def start_workers() -> None:
+        """Start the worker pool unless it is already running."""
+        if any(not task.done() for task in worker_tasks):
+            return
+        worker_tasks[:] = [
+            asyncio.create_task(_process_updates(queue, bot_service))
+            for queue in queues
+        ]
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        start_workers()
+        yield
+        # Updates already acknowledged won't be resent, so finish them first
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(*(queue.join() for queue in queues)), drain_timeout
+            )
+        except asyncio.TimeoutError:
+            pending = sum(queue.qsize() for queue in queues)
+            logger.warning(
+                f"[Telegram] Shutdown drain timed out, dropping {pending} queued updates"
+            )
+        for task in worker_tasks:
+            task.cancel()
+        await asyncio.gather(*worker_tasks, return_exceptions=True)
+        # Release pooled Bot API connections on shutdown
+        await bot_service.aclose()
+
+    app = FastAPI(title="ANO Telegram Bot", version="1.0.0", lifespan=lifespan)
+
+    # Return annotations let FastAPI serialize responses via pydantic-core
     @app.get("/health")
-    async def health_check():
+    async def health_check() -> dict[str, str]:
         """Health check endpoint."""
         return {"status": "ok"}
 
     @app.post("/webhook")
-    async def telegram_webhook(request: Request):
+    async def telegram_webhook(request: Request) -> dict[str, bool]:
         """
         Receive Telegram updates.
 
@@ -53,26 +161,28 @@ def create_webhook_app(
         parses update JSON, and routes to bot service.
         """
         # Validate webhook secret if configured
-        if config.webhook_secret:
+        if webhook_secret:
             secret = request.headers.get("X-Telegram-Bot-Api-Secret-Token", "")
-            if secret != config.webhook_secret:
+            if not hmac.compare_digest(secret.encode(), webhook_secret):
                 logger.warning("[Telegram] Invalid webhook secret")
                 raise HTTPException(status_code=401, detail="Invalid webhook secret")
 
         # Parse update
         try:
-            update = await request.json()
+            raw = await request.body()
+            update = orjson.loads(raw) if orjson is not None else json.loads(raw)
         except Exception as e:
             logger.error(f"[Telegram] Invalid JSON: {e}")
             raise HTTPException(status_code=400, detail="Invalid JSON")
 
-        # Route to bot service
+        # Hand off to the workers; a full queue asks Telegram to retry later
+        start_workers()
         try:
-            result = await bot_service.handle_update(update)
-            return result
-        except Exception as e:
-            logger.error(f"[Telegram] Update handling error: {e}")
-            # Still return 200 to Telegram to avoid retries
-            return {"ok": True}
+            queues[hash(_chat_key(update)) % workers].put_nowait(update)
+        except asyncio.QueueFull:
+            logger.warning("[Telegram] Update queue full, rejecting update")
+            raise HTTPException(status_code=429, detail="Too many pending updates")
+
+        return {"ok": True}
 
     return app
@@ -5,18 +5,26 @@ HTTP-based chat handler for web widgets.
 Provides a simple REST API for chat interactions.
 """
 
+import asyncio
+import inspect
 import logging
 import uuid
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
 from typing import Any, Optional, Dict
 from datetime import datetime, timedelta
 
 from fastapi import FastAPI, Request, HTTPException
-from pydantic import BaseModel
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, ValidationError
 
 from channels.base_channel import BaseChannel
 
 logger = logging.getLogger(__name__)
 
+# Seconds between sweeps of expired sessions
+_GC_INTERVAL_SECONDS = 30.0
+
 
 class ChatMessage(BaseModel):
     """Chat message request model."""
@@ -31,35 +39,98 @@ class ChatResponse(BaseModel):
     timestamp: str
 
 
+class SessionResponse(BaseModel):
+    """Session history response model."""
+    session_id: str
+    created_at: str
+    last_activity: str
+    history: list[dict[str, Any]]
+
+
 class WebChatHandler(BaseChannel):
-    """HTTP-based chat handler for web widgets."""
+    """
+    HTTP-based chat handler for web widgets.
+
+    The first message starts a background task that sweeps expired sessions.
+    Callers outside the chat app's lifespan must ``await aclose()`` before
+    their event loop ends to stop it.
+    """
 
     channel_name = "web"
 
-    def __init__(self, agent: Any = None):
+    def __init__(self, agent: Any = None, history_cap: int = 50):
         """
         Initialize web chat handler.
 
         Args:
             agent: Optional agent to handle messages
+            history_cap: Maximum messages kept per session (oldest dropped first)
         """
         super().__init__()
-        self._agent = agent
+        self.set_agent(agent)
+        self._history_cap = history_cap
 
-        # Simple in-memory session storage
+        # Simple in-memory session storage, least recently active first
         # In production, use Redis or similar
-        self._sessions: Dict[str, Dict[str, Any]] = {}
+        self._sessions: OrderedDict[str, Dict[str, Any]] = OrderedDict()
         self._session_ttl = timedelta(hours=24)
 
+        # Background sweep of expired sessions, started on first message
+        self._gc_task: Optional[asyncio.Task] = None
+
+    def set_agent(self, agent: Any) -> None:
+        """
+        Set the agent that handles messages and resolve its execute method.
+
+        Args:
+            agent: An agent instance with an execute(text, metadata) method
+        """
+        super().set_agent(agent)
+        self._execute = getattr(agent, "execute", None) if agent else None
+        self._is_async = inspect.iscoroutinefunction(self._execute)
+
     def _cleanup_sessions(self) -> None:
-        """Remove expired sessions."""
+        """
+        Remove expired sessions.
+
+        Sessions are kept in last-activity order and share one TTL, so
+        expired sessions are always at the front; stop at the first live one.
+        """
         now = datetime.utcnow()
-        expired = [
-            sid for sid, data in self._sessions.items()
-            if now - data.get("last_activity", now) > self._session_ttl
-        ]
-        for sid in expired:
-            del self._sessions[sid]
+        sessions = self._sessions
+        while sessions:
+            sid, data = next(iter(sessions.items()))
+            if now - data["last_activity"] <= self._session_ttl:
+                break
+            del sessions[sid]
+
+    async def _gc_loop(self) -> None:
+        """Periodically remove expired sessions."""
+        while True:
+            await asyncio.sleep(_GC_INTERVAL_SECONDS)
+            self._cleanup_sessions()
+
+    def _ensure_gc_task(self) -> None:
+        """
+        Start the cleanup task unless one is already running on this loop.
+
+        A task that has finished, or that belongs to an event loop other than
+        the running one (e.g. a previous asyncio.run()), is replaced.
+        """
+        task = self._gc_task
+        if (
+            task is None
+            or task.done()
+            or task.get_loop() is not asyncio.get_running_loop()
+        ):
+            self._gc_task = asyncio.create_task(self._gc_loop())
+
+    async def aclose(self) -> None:
+        """Stop the background session cleanup task."""
+        task, self._gc_task = self._gc_task, None
+        # A task left on a finished loop can no longer be cancelled
+        if task is not None and not task.get_loop().is_closed():
+            task.cancel()
 
     def _get_or_create_session(self, session_id: Optional[str]) -> str:
         """
@@ -71,19 +142,25 @@ class WebChatHandler(BaseChannel):
         Returns:
             Session ID
         """
-        self._cleanup_sessions()
+        now = datetime.utcnow()
+        session = self._sessions.get(session_id) if session_id else None
 
-        if session_id and session_id in self._sessions:
-            # Update last activity
-            self._sessions[session_id]["last_activity"] = datetime.utcnow()
-            return session_id
+        if session_id and session is not None:
+            if now - session["last_activity"] <= self._session_ttl:
+                # Update last activity
+                session["last_activity"] = now
+                self._sessions.move_to_end(session_id)
+                return session_id
+            # Expired but not yet swept
+            del self._sessions[session_id]
 
         # Create new session
         new_session_id = str(uuid.uuid4())
         self._sessions[new_session_id] = {
             "created_at": datetime.utcnow(),
             "last_activity": datetime.utcnow(),
-            "history": [],
+            "history": deque(maxlen=self._history_cap),
+            "user_message_count": 0,
         }
         return new_session_id
 
@@ -129,27 +206,38 @@ class WebChatHandler(BaseChannel):
         """
         metadata = metadata or {}
 
+        self._ensure_gc_task()
+
         # Get or create session
         session_id = self._get_or_create_session(session_id)
 
         # Store user message
         if session_id in self._sessions:
-            self._sessions[session_id]["history"].append({
+            session = self._sessions[session_id]
+            session["history"].append({
                 "role": "user",
                 "text": text,
                 "timestamp": datetime.utcnow().isoformat(),
             })
+            session["user_message_count"] += 1
 
-            # Add session history to metadata
-            metadata["session_history"] = self._sessions[session_id]["history"]
+            # Add a read-only snapshot of session history to metadata, plus
+            # a running user-message count (history is capped, so agents
+            # can't recount it reliably)
+            metadata["session_history"] = tuple(session["history"])
+            metadata["user_message_count"] = session["user_message_count"]
 
         # Route to agent
-        if self._agent and hasattr(self._agent, "execute"):
+        if self._execute is not None:
             try:
-                result = self._agent.execute(text, metadata)
-                if hasattr(result, "__await__"):
-                    result = await result
-                return result
+                if self._is_async:
+                    response: str = await self._execute(text, metadata)
+                else:
+                    # Keep blocking agents off the event loop
+                    response = await asyncio.to_thread(self._execute, text, metadata)
+                    if inspect.isawaitable(response):
+                        response = await response
+                return response
             except Exception as e:
                 logger.error(f"[WebChat] Agent execution error: {e}")
                 return "Sorry, I encountered an error processing your message."
@@ -176,24 +264,48 @@ def create_web_chat_app(handler: WebChatHandler) -> FastAPI:
         uvicorn.run(app, host="0.0.0.0", port=8000)
         ```
     """
-    app = FastAPI(title="ANO Web Chat", version="1.0.0")
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        yield
+        # Stop the session cleanup task on shutdown
+        await handler.aclose()
+
+    app = FastAPI(title="ANO Web Chat", version="1.0.0", lifespan=lifespan)
 
+    # Typed responses are serialized straight to JSON bytes by pydantic-core
     @app.get("/health")
-    async def health_check():
+    async def health_check() -> dict[str, str]:
         """Health check endpoint."""
         return {"status": "ok"}
 
-    @app.post("/chat", response_model=ChatResponse)
-    async def chat(message: ChatMessage):
+    @app.post(
+        "/chat",
+        response_model=ChatResponse,
+        openapi_extra={
+            "requestBody": {
+                "content": {"application/json": {"schema": ChatMessage.model_json_schema()}},
+                "required": True,
+            }
+        },
+    )
+    async def chat(request: Request):
         """
         Process chat message.
 
+        The body is decoded and validated in one pass by pydantic-core
+        rather than being parsed to a dict first.
+
         Args:
-            message: ChatMessage with session_id and message text
+            request: Request whose JSON body is a ChatMessage
 
         Returns:
             ChatResponse with session_id, response, and timestamp
         """
+        try:
+            message = ChatMessage.model_validate_json(await request.body())
+        except ValidationError as e:
+            raise RequestValidationError(e.errors(include_url=False))
+
         if not message.message or not message.message.strip():
             raise HTTPException(status_code=400, detail="Message cannot be empty")
 
@@ -217,7 +329,7 @@ def create_web_chat_app(handler: WebChatHandler) -> FastAPI:
             logger.error(f"[WebChat] Chat error: {e}")
             raise HTTPException(status_code=500, detail="Internal server error")
 
-    @app.get("/session/{session_id}")
+    @app.get("/session/{session_id}", response_model=SessionResponse)
     async def get_session(session_id: str):
         """
         Get session history.
@@ -235,7 +347,7 @@ def create_web_chat_app(handler: WebChatHandler) -> FastAPI:
             "session_id": session_id,
             "created_at": handler._sessions[session_id]["created_at"].isoformat(),
             "last_activity": handler._sessions[session_id]["last_activity"].isoformat(),
-            "history": handler._sessions[session_id]["history"],
+            "history": list(handler._sessions[session_id]["history"]),
         }
 
     return app
@@ -21,6 +21,11 @@ logger = logging.getLogger(__name__)
 class StatefulAgent:
     """Simple stateful agent for demonstration."""
 
+    __slots__ = ("conversation_count", "user_name")
+
+    _NAME_PREFIX = "my name is "
+    _NAME_PREFIX_LEN = len(_NAME_PREFIX)
+
     def __init__(self):
         self.conversation_count = 0
         self.user_name = None
@@ -38,9 +43,10 @@ class StatefulAgent:
         """
         self.conversation_count += 1
 
-        # Handle name setting
-        if text.lower().startswith("my name is "):
-            self.user_name = text[11:].strip()
+        # Handle name setting (case-fold only the prefix, not the whole message)
+        prefix_len = self._NAME_PREFIX_LEN
+        if len(text) >= prefix_len and text[:prefix_len].casefold() == self._NAME_PREFIX:
+            self.user_name = text[prefix_len:].strip()
             return f"Nice to meet you, {self.user_name}!"
 
         # Personalized greeting
@@ -7,11 +7,12 @@ upstream data flow.
 """
 
 import asyncio
+from itertools import repeat
 
 from ano_core.types import AgentContext, AgentInput, AgentOutput, OrgProfile
 from ano_core.environment import EnvironmentTier
 from agent_framework.base_agent import BaseAgent
-from agent_framework.llm.base_backend import LocalBackend
+from agent_framework.llm.local_backend import get_local_backend
 from pipeline.pipeline import Pipeline, Stage, PipelineResult
 from pipeline.coordinator import PipelineCoordinator
 from registry.agent_registry import AgentRegistry, AgentMetadataEntry
@@ -25,6 +26,8 @@ from policy.gates import TestSuccessGate, SecurityValidationGate
 class ResearcherAgent(BaseAgent):
     """Gathers information on a topic."""
 
+    __slots__ = ()
+
     agent_name = "researcher"
     version = "1.0.0"
 
@@ -36,11 +39,9 @@ class ResearcherAgent(BaseAgent):
         # In production, this would call an LLM
         return AgentOutput(
             result={
-                "findings": [
-                    f"Finding 1 about {topic}",
-                    f"Finding 2 about {topic}",
-                    f"Finding 3 about {topic}",
-                ],
+                "findings": list(
+                    map("Finding {} about {}".format, (1, 2, 3), repeat(topic))
+                ),
                 "source_count": 12,
             },
             metadata=self.get_metadata(),
@@ -50,6 +51,8 @@ class ResearcherAgent(BaseAgent):
 class AnalystAgent(BaseAgent):
     """Analyzes research findings."""
 
+    __slots__ = ()
+
     agent_name = "analyst"
     version = "1.0.0"
 
@@ -61,10 +64,11 @@ class AnalystAgent(BaseAgent):
         upstream = input_data.context.upstream_outputs or {}
         research = upstream.get("research", {})
         findings = research.get("findings", [])
+        insights = list(map("Insight from: {}".format, findings))
 
         return AgentOutput(
             result={
-                "insights": [f"Insight from: {f}" for f in findings],
+                "insights": insights,
                 "confidence": 0.85,
             },
             metadata=self.get_metadata(),
@@ -74,6 +78,8 @@ class AnalystAgent(BaseAgent):
 class ComplianceAgent(BaseAgent):
     """Checks compliance of analysis."""
 
+    __slots__ = ()
+
     agent_name = "compliance_checker"
     version = "1.0.0"
 
@@ -93,6 +99,8 @@ class ComplianceAgent(BaseAgent):
 class ReviewerAgent(BaseAgent):
     """Executive review of final outputs."""
 
+    __slots__ = ()
+
     agent_name = "reviewer"
     version = "1.0.0"
 
@@ -119,7 +127,7 @@ async def main():
     context = AgentContext(org_profile=org)
 
     # Create a local LLM backend (deterministic, no API calls)
-    backend = LocalBackend()
+    backend = get_local_backend()
 
     # Register agents
     registry = AgentRegistry()
@@ -155,7 +163,9 @@ async def main():
             Stage(
                 name="analysis",
                 agents=["analyst", "compliance_checker"],
-                parallel=True,  # Run analyst and compliance in parallel
+                # Run analyst and compliance in one TaskGroup, bounded by
+                # the coordinator's max_concurrent_agents
+                parallel=True,
                 description="Analyze findings and check compliance",
             ),
             Stage(
@@ -188,24 +198,26 @@ async def main():
 
     # --- Run Pipeline ---
 
+    # Agents are stateless, so the registry builds each one once and the
+    # coordinator reuses it for every stage and run
     coordinator = PipelineCoordinator(
         pipeline=pipeline,
         registry=registry,
-        context=context,
-        llm_backend=backend,
+        agent_kwargs={"context": context, "llm": backend},
     )
 
     print("Running pipeline...")
     result: PipelineResult = await coordinator.run(
-        initial_input={"topic": "AI governance best practices"}
+        initial_input={"topic": "AI governance best practices"},
+        context=context,
     )
 
     print(f"\nPipeline completed: {'SUCCESS' if result.success else 'FAILED'}")
-    print(f"Duration: {result.total_duration_ms:.0f}ms")
+    print(f"Duration: {result.duration_ms:.0f}ms")
     print()
 
     # Show outputs per stage
-    for stage_name, output in result.stage_outputs.items():
+    for stage_name, output in result.outputs.items():
         print(f"--- {stage_name} ---")
         if isinstance(output, dict):
             for key, value in output.items():
@@ -9,8 +9,18 @@ Run: python3 examples/registry_policy_demo.py
 """
 
 import asyncio
+import io
 import sys
+from collections import ChainMap
+from contextvars import ContextVar
+from dataclasses import replace
 from pathlib import Path
+from typing import Awaitable, Callable, Optional
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None  # type: ignore[assignment]
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -22,6 +32,7 @@ from registry import (
     register_agent,
 )
 from policy import (
+    PolicyContext,
     PolicyEngine,
     get_tier_policy,
 )
@@ -43,6 +54,8 @@ from ano_core.environment import EnvironmentTier
 class TestRunnerAgent:
     """Agent that executes test suites."""
 
+    __slots__ = ()
+
     async def execute(self, input_data: dict) -> dict:
         print(f"  TestRunnerAgent executing...")
         return {
@@ -62,6 +75,8 @@ class TestRunnerAgent:
 class SecurityScannerAgent:
     """Agent that performs security scanning."""
 
+    __slots__ = ()
+
     async def execute(self, input_data: dict) -> dict:
         print(f"  SecurityScannerAgent executing...")
         return {
@@ -81,6 +96,8 @@ class SecurityScannerAgent:
 class CodeReviewerAgent:
     """Agent that reviews code quality."""
 
+    __slots__ = ()
+
     async def execute(self, input_data: dict) -> dict:
         print(f"  CodeReviewerAgent executing...")
         return {
@@ -154,16 +171,16 @@ async def demo_policy_development():
 
     # Context with some failures
     print("\n1. Evaluating with some gate failures:")
-    context = {
-        "tests_passed": True,
-        "files_verified": True,
-        "current_branch": "main",
-        "allowed_branches": ["feature/*", "bugfix/*"],  # main not allowed!
-        "documentation_updated": False,  # Docs not updated!
-        "lint_passed": True,
-        "type_check_passed": True,
-        "security_scan_passed": True,
-    }
+    context = PolicyContext(
+        tests_passed=True,
+        files_verified=True,
+        current_branch="main",
+        allowed_branches=("feature/*", "bugfix/*"),  # main not allowed!
+        documentation_updated=False,  # Docs not updated!
+        lint_passed=True,
+        type_check_passed=True,
+        security_scan_passed=True,
+    )
 
     decision = await engine.evaluate_pre("test-runner", context)
 
@@ -199,19 +216,19 @@ async def demo_policy_test():
 
     # Context with all passes
     print("\n1. All gates passing:")
-    context = {
-        "tests_passed": True,
-        "files_verified": True,
-        "current_branch": "feature/demo",
-        "allowed_branches": ["feature/*", "bugfix/*"],
-        "documentation_updated": True,
-        "lint_passed": True,
-        "type_check_passed": True,
-        "security_scan_passed": True,
-        "approval_granted": True,
-        "approver": "tech-lead",
-        "approval_timestamp": "2026-02-16T10:00:00Z",
-    }
+    context = PolicyContext(
+        tests_passed=True,
+        files_verified=True,
+        current_branch="feature/demo",
+        allowed_branches=("feature/*", "bugfix/*"),
+        documentation_updated=True,
+        lint_passed=True,
+        type_check_passed=True,
+        security_scan_passed=True,
+        approval_granted=True,
+        approver="tech-lead",
+        approval_timestamp="2026-02-16T10:00:00Z",
+    )
 
     decision = await engine.evaluate_pre("test-runner", context)
     print(f"  Decision: {'ALLOW' if decision.allowed else 'DENY'}")
@@ -219,7 +236,7 @@ async def demo_policy_test():
 
     # Context with approval missing
     print("\n2. Missing approval:")
-    context["approval_granted"] = False
+    context = replace(context, approval_granted=False)
 
     decision = await engine.evaluate_pre("test-runner", context)
     print(f"  Decision: {'ALLOW' if decision.allowed else 'DENY'}")
@@ -246,19 +263,19 @@ async def demo_policy_production():
     print(f"\nLoaded {len(gates)} policy gates for {tier.value} tier")
 
     # Perfect context
-    context = {
-        "tests_passed": True,
-        "files_verified": True,
-        "current_branch": "main",
-        "allowed_branches": ["main"],
-        "documentation_updated": True,
-        "lint_passed": True,
-        "type_check_passed": True,
-        "security_scan_passed": True,
-        "approval_granted": True,
-        "approver": "deployment-manager",
-        "approval_timestamp": "2026-02-16T10:00:00Z",
-    }
+    context = PolicyContext(
+        tests_passed=True,
+        files_verified=True,
+        current_branch="main",
+        allowed_branches=("main",),
+        documentation_updated=True,
+        lint_passed=True,
+        type_check_passed=True,
+        security_scan_passed=True,
+        approval_granted=True,
+        approver="deployment-manager",
+        approval_timestamp="2026-02-16T10:00:00Z",
+    )
 
     decision = await engine.evaluate_pre("test-runner", context)
     print(f"  Decision: {'ALLOW' if decision.allowed else 'DENY'}")
@@ -279,37 +296,39 @@ async def demo_complete_workflow():
 
     print("\nRunning multi-agent workflow with policy enforcement...")
 
-    # 1. Run test agent
-    print("\n1. Running test-runner agent:")
-    test_agent_class = registry.get("test-runner")
-    test_agent = test_agent_class()
-    test_output = await test_agent.execute({})
-
-    # 2. Run security agent
-    print("\n2. Running security-scanner agent:")
-    security_agent_class = registry.get("security-scanner")
-    security_agent = security_agent_class()
-    security_output = await security_agent.execute({})
-
-    # 3. Run code review agent
-    print("\n3. Running code-reviewer agent:")
-    review_agent_class = registry.get("code-reviewer")
-    review_agent = review_agent_class()
-    review_output = await review_agent.execute({})
-
-    # 4. Build policy context from agent outputs
+    async def run_agent(name: str) -> dict:
+        agent = registry.get(name)()
+        print(f"  → {name} started")
+        output: dict = await agent.execute({})
+        print(f"  ✓ {name} finished")
+        return output
+
+    # 1-3. The three agents share no data, so run them concurrently
+    # (the same mechanism a Stage(parallel=True) uses in a pipeline)
+    print("\n1-3. Running test-runner, security-scanner and code-reviewer:")
+    test_output, security_output, review_output = await asyncio.gather(
+        run_agent("test-runner"),
+        run_agent("security-scanner"),
+        run_agent("code-reviewer"),
+    )
+
+    # 4. Build policy context from agent outputs. ChainMap layers the
+    # outputs without copying them; earlier maps win, matching the
+    # precedence of the old {**test, **security, **review, ...} merge.
     print("\n4. Building policy context from agent outputs:")
-    context = {
-        **test_output,
-        **security_output,
-        **review_output,
-        "files_verified": True,
-        "current_branch": "feature/complete-workflow",
-        "allowed_branches": ["feature/*"],
-        "documentation_updated": True,
-        "approval_granted": True,
-        "approver": "workflow-manager",
-    }
+    context = ChainMap(
+        {
+            "files_verified": True,
+            "current_branch": "feature/complete-workflow",
+            "allowed_branches": ["feature/*"],
+            "documentation_updated": True,
+            "approval_granted": True,
+            "approver": "workflow-manager",
+        },
+        review_output,
+        security_output,
+        test_output,
+    )
 
     # 5. Evaluate policy
     print("\n5. Evaluating policy gates:")
@@ -331,6 +350,31 @@ async def demo_complete_workflow():
 # =============================================================================
 
 
+# Buffer for the demo running in the current task; None means real stdout
+_demo_output: ContextVar[Optional[io.StringIO]] = ContextVar("_demo_output", default=None)
+
+
+class _TaskStdout:
+    """sys.stdout proxy that sends each demo task's prints to its own buffer."""
+
+    def __init__(self, stream):
+        self._stream = stream
+
+    def write(self, text: str) -> int:
+        return (_demo_output.get() or self._stream).write(text)
+
+    def flush(self) -> None:
+        (_demo_output.get() or self._stream).flush()
+
+
+async def _capture(demo: Callable[[], Awaitable[None]]) -> str:
+    """Run a demo in its own task context and return what it printed."""
+    buffer = io.StringIO()
+    _demo_output.set(buffer)
+    await demo()
+    return buffer.getvalue()
+
+
 async def main():
     """Run all demos."""
     print("\n" + "=" * 70)
@@ -340,13 +384,22 @@ async def main():
     # Registry demos
     demo_registry()
 
-    # Policy demos
-    await demo_policy_development()
-    await demo_policy_test()
-    await demo_policy_production()
-
-    # Complete workflow
-    await demo_complete_workflow()
+    # The policy and workflow demos share no state, so run them
+    # concurrently. Each prints into its own buffer, and the buffers are
+    # written out in order so the output doesn't interleave.
+    stdout = sys.stdout
+    sys.stdout = _TaskStdout(stdout)
+    try:
+        outputs = await asyncio.gather(
+            _capture(demo_policy_development),
+            _capture(demo_policy_test),
+            _capture(demo_policy_production),
+            _capture(demo_complete_workflow),
+        )
+    finally:
+        sys.stdout = stdout
+    for output in outputs:
+        sys.stdout.write(output)
 
     print("\n" + "=" * 70)
     print("DEMO COMPLETE")
@@ -361,4 +414,8 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # One runner owns the loop for every demo; uvloop (the "speedups"
+    # extra) supplies it when installed
+    loop_factory = uvloop.new_event_loop if uvloop is not None else None
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        runner.run(main())
@@ -6,7 +6,14 @@ Demonstrates how to create a Telegram bot using the channels module.
 
 import asyncio
 import logging
-from channels.telegram import TelegramConfig, TelegramBotService, create_webhook_app
+from importlib.util import find_spec
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None  # type: ignore[assignment]
+
+_HAVE_HTTPTOOLS = find_spec("httptools") is not None
 
 
 # Configure logging
@@ -21,6 +28,8 @@ logger = logging.getLogger(__name__)
 class EchoAgent:
     """Simple echo agent for demonstration."""
 
+    __slots__ = ()
+
     async def execute(self, text: str, metadata: dict) -> str:
         """
         Process user input.
@@ -36,6 +45,31 @@ class EchoAgent:
         return f"Hello @{username}! You said: {text}"
 
 
+# Static replies, built once at import
+_HELP_TEXT = """
+Available commands:
+
+/start - Start the bot
+/help - Show this help message
+/echo [text] - Echo your message
+/about - About this bot
+
+Or just send any message and I'll echo it back!
+"""
+
+_ABOUT_TEXT = """
+This is an example Telegram bot built with ANO Foundation channels.
+
+- Clean Python 3.11+ codebase
+- Type hints throughout
+- Production logging
+- Rate limiting built-in
+- Tier-based access control
+
+Built with the ANO Foundation framework.
+"""
+
+
 # Command handlers
 def handle_start(sender_id: str, args: str, metadata: dict) -> str:
     """Handle /start command."""
@@ -47,16 +81,7 @@ def handle_start(sender_id: str, args: str, metadata: dict) -> str:
 
 def handle_help(sender_id: str, args: str, metadata: dict) -> str:
     """Handle /help command."""
-    return """
-Available commands:
-
-/start - Start the bot
-/help - Show this help message
-/echo [text] - Echo your message
-/about - About this bot
-
-Or just send any message and I'll echo it back!
-"""
+    return _HELP_TEXT
 
 
 def handle_echo(sender_id: str, args: str, metadata: dict) -> str:
@@ -68,26 +93,21 @@ def handle_echo(sender_id: str, args: str, metadata: dict) -> str:
 
 def handle_about(sender_id: str, args: str, metadata: dict) -> str:
     """Handle /about command."""
-    return """
-This is an example Telegram bot built with ANO Foundation channels.
-
-- Clean Python 3.11+ codebase
-- Type hints throughout
-- Production logging
-- Rate limiting built-in
-- Tier-based access control
-
-Built with the ANO Foundation framework.
-"""
+    return _ABOUT_TEXT
 
 
 async def main():
     """Main entry point."""
     try:
-        # Load configuration from environment
+        # Load configuration from environment. The service and webhook
+        # modules (httpx, FastAPI) are only imported once it validates.
+        from channels.telegram.config import TelegramConfig
+
         config = TelegramConfig.from_env()
         logger.info("Telegram config loaded")
 
+        from channels.telegram import TelegramBotService, create_webhook_app
+
         # Create agent
         agent = EchoAgent()
         logger.info("Agent created")
@@ -120,7 +140,17 @@ async def main():
         logger.info("Webhook endpoint: POST /webhook")
 
         import uvicorn
-        uvicorn.run(app, host="0.0.0.0", port=8000)
+
+        # Serve on the already-running loop (uvicorn.run() would try to
+        # start a second one); httptools parses HTTP in C when installed
+        server_config = uvicorn.Config(
+            app,
+            host="0.0.0.0",
+            port=8000,
+            http="httptools" if _HAVE_HTTPTOOLS else "h11",
+            access_log=False,
+        )
+        await uvicorn.Server(server_config).serve()
 
     except ValueError as e:
         logger.error(f"Configuration error: {e}")
@@ -135,5 +165,9 @@ async def main():
 
 
 if __name__ == "__main__":
-    exit_code = asyncio.run(main())
+    # uvloop (the "speedups" extra) replaces the asyncio event loop with a
+    # libuv-based one when available
+    loop_factory = uvloop.new_event_loop if uvloop is not None else None
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        exit_code = runner.run(main())
     exit(exit_code)
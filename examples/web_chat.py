@@ -5,8 +5,18 @@ Demonstrates how to create a web chat API using the channels module.
 """
 
 import asyncio
+import functools
+import importlib
 import logging
-from channels.web import WebChatHandler, create_web_chat_app
+import re
+from importlib.util import find_spec
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None  # type: ignore[assignment]
+
+_HAVE_HTTPTOOLS = find_spec("httptools") is not None
 
 
 # Configure logging
@@ -17,10 +27,22 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+@functools.cache
+def _get_cors_middleware():
+    """Import FastAPI's CORS middleware on first use."""
+    return importlib.import_module("fastapi.middleware.cors").CORSMiddleware
+
+
+# Whole-word, case-insensitive keyword match against the raw message
+_KEYWORDS = re.compile(r"\b(hello|hi|bye|goodbye)\b", re.IGNORECASE)
+
+
 # Example agent with conversation context
 class ConversationalAgent:
     """Simple conversational agent for demonstration."""
 
+    __slots__ = ()
+
     async def execute(self, text: str, metadata: dict) -> str:
         """
         Process user input with conversation history.
@@ -34,16 +56,22 @@ class ConversationalAgent:
         """
         # Get conversation history from metadata
         history = metadata.get("session_history", [])
-        message_count = len([m for m in history if m.get("role") == "user"])
+        # Prefer the handler's running count; recount only if it's missing
+        message_count = metadata.get("user_message_count")
+        if message_count is None:
+            message_count = sum(1 for m in history if m.get("role") == "user")
 
         # Simple responses based on conversation state
         if message_count == 1:
             return "Hi! I'm your AI assistant. How can I help you today?"
 
-        if "hello" in text.lower() or "hi" in text.lower():
+        match = _KEYWORDS.search(text)
+        keyword = match.group(1).lower() if match else None
+
+        if keyword in ("hello", "hi"):
             return "Hello! What would you like to talk about?"
 
-        if "bye" in text.lower() or "goodbye" in text.lower():
+        if keyword in ("bye", "goodbye"):
             return "Goodbye! Feel free to come back anytime."
 
         # Echo with context
@@ -53,6 +81,9 @@ class ConversationalAgent:
 async def main():
     """Main entry point."""
     try:
+        # Deferred so FastAPI is only imported when the server starts
+        from channels.web import WebChatHandler, create_web_chat_app
+
         # Create agent
         agent = ConversationalAgent()
         logger.info("Agent created")
@@ -66,9 +97,8 @@ async def main():
         logger.info("Web app created")
 
         # Add CORS for development (remove or restrict in production)
-        from fastapi.middleware.cors import CORSMiddleware
         app.add_middleware(
-            CORSMiddleware,
+            _get_cors_middleware(),
             allow_origins=["*"],  # In production: restrict to your domain
             allow_credentials=True,
             allow_methods=["*"],
@@ -84,7 +114,17 @@ async def main():
         logger.info("  GET /health - Health check")
 
         import uvicorn
-        uvicorn.run(app, host="0.0.0.0", port=8000)
+
+        # Serve on the already-running loop (uvicorn.run() would try to
+        # start a second one); httptools parses HTTP in C when installed
+        server_config = uvicorn.Config(
+            app,
+            host="0.0.0.0",
+            port=8000,
+            http="httptools" if _HAVE_HTTPTOOLS else "h11",
+            access_log=False,
+        )
+        await uvicorn.Server(server_config).serve()
 
     except Exception as e:
         logger.error(f"Startup error: {e}", exc_info=True)
@@ -94,5 +134,9 @@ async def main():
 
 
 if __name__ == "__main__":
-    exit_code = asyncio.run(main())
+    # uvloop (the "speedups" extra) replaces the asyncio event loop with a
+    # libuv-based one when available
+    loop_factory = uvloop.new_event_loop if uvloop is not None else None
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        exit_code = runner.run(main())
     exit(exit_code)
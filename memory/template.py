@@ -4,6 +4,8 @@ WORKING.md Template Rendering and Parsing
 Handles conversion between WorkingState dataclass and markdown format.
 """
 
+import functools
+import re
 from typing import TYPE_CHECKING
 
 from ano_core.logging import get_agent_logger
@@ -14,295 +16,330 @@ if TYPE_CHECKING:
 logger = get_agent_logger(__name__)
 
 
+# Fixed skeleton of WORKING.md; only the section bodies vary per render.
+_TEMPLATE = (
+    "# Agent Working Memory\n\n"
+    "## Current Task\n\n{task}"
+    "## Context\n\n{context}"
+    "## Next Steps\n\n{next_steps}"
+    "## Blockers\n\n{blockers}"
+    "## Handoff Notes\n\n{handoff}"
+    "## Files Modified\n\n{files}"
+    "## Decisions Made\n\n{decisions}"
+    "## Session History\n\n{history}"
+)
+
+
+def _render_task(task: "TaskInfo | None") -> str:
+    if not task:
+        return "No active task.\n\n"
+    body = (
+        f"**Title**: {task.title}\n\n"
+        f"**Status**: {task.status}\n\n"
+        f"**Assigned**: {task.assigned_at}\n\n"
+    )
+    if task.description:
+        body += f"**Description**: {task.description}\n\n"
+    return body
+
+
+def _render_bullets(items: list[str], empty: str) -> str:
+    if not items:
+        return empty
+    return "".join([f"- {item}\n" for item in items]) + "\n"
+
+
+def _render_next_steps(steps: list[str]) -> str:
+    if not steps:
+        return "No next steps defined.\n\n"
+    return "".join([f"{i}. {step}\n" for i, step in enumerate(steps, 1)]) + "\n"
+
+
+def _render_blockers(blockers: list["BlockerInfo"]) -> str:
+    if not blockers:
+        return "No blockers.\n\n"
+    return "".join(
+        [
+            f"### {b.severity.upper()}: {b.description}\n\n*Created: {b.created_at}*\n\n"
+            for b in blockers
+        ]
+    )
+
+
+def _render_files(files: list[str]) -> str:
+    if not files:
+        return "No files modified.\n\n"
+    return "".join([f"- `{file_path}`\n" for file_path in files]) + "\n"
+
+
+def _render_history(history: list["SessionEntry"]) -> str:
+    # The document ends with a single newline, so entries are separated
+    # by a blank line rather than followed by one
+    if not history:
+        return "No session history.\n"
+    return "\n".join(
+        [
+            f"### {e.timestamp}\n\n**Action**: {e.action}\n\n**Outcome**: {e.outcome}\n"
+            for e in history
+        ]
+    )
+
+
 def render_working_state(state: "WorkingState") -> str:
     """
     Render WorkingState to markdown matching the WORKING.md template format.
 
+    Only the section bodies are built per call; the headers come from the
+    precomputed _TEMPLATE. A state with nothing in it renders to a cached
+    constant.
+
     Args:
         state: WorkingState to render
 
     Returns:
         Markdown-formatted string
     """
-    lines = [
-        "# Agent Working Memory",
-        "",
-        "## Current Task",
-        "",
-    ]
-
-    # Current Task section
-    if state.current_task:
-        lines.extend([
-            f"**Title**: {state.current_task.title}",
-            "",
-            f"**Status**: {state.current_task.status}",
-            "",
-            f"**Assigned**: {state.current_task.assigned_at}",
-            "",
-        ])
-        if state.current_task.description:
-            lines.extend([
-                f"**Description**: {state.current_task.description}",
-                "",
-            ])
-    else:
-        lines.extend([
-            "No active task.",
-            "",
-        ])
-
-    # Context section
-    lines.extend([
-        "## Context",
-        "",
-    ])
-    if state.context:
-        for item in state.context:
-            lines.append(f"- {item}")
-        lines.append("")
-    else:
-        lines.extend([
-            "No context items.",
-            "",
-        ])
-
-    # Next Steps section
-    lines.extend([
-        "## Next Steps",
-        "",
-    ])
-    if state.next_steps:
-        for i, step in enumerate(state.next_steps, 1):
-            lines.append(f"{i}. {step}")
-        lines.append("")
-    else:
-        lines.extend([
-            "No next steps defined.",
-            "",
-        ])
-
-    # Blockers section
-    lines.extend([
-        "## Blockers",
-        "",
-    ])
-    if state.blockers:
-        for blocker in state.blockers:
-            lines.extend([
-                f"### {blocker.severity.upper()}: {blocker.description}",
-                "",
-                f"*Created: {blocker.created_at}*",
-                "",
-            ])
-    else:
-        lines.extend([
-            "No blockers.",
-            "",
-        ])
-
-    # Handoff Notes section
-    lines.extend([
-        "## Handoff Notes",
-        "",
-    ])
-    if state.handoff_notes:
-        lines.extend([
-            state.handoff_notes,
-            "",
-        ])
-    else:
-        lines.extend([
-            "No handoff notes.",
-            "",
-        ])
-
-    # Files Modified section
-    lines.extend([
-        "## Files Modified",
-        "",
-    ])
-    if state.files_modified:
-        for file_path in state.files_modified:
-            lines.append(f"- `{file_path}`")
-        lines.append("")
-    else:
-        lines.extend([
-            "No files modified.",
-            "",
-        ])
-
-    # Decisions Made section
-    lines.extend([
-        "## Decisions Made",
-        "",
-    ])
-    if state.decisions_made:
-        for decision in state.decisions_made:
-            lines.append(f"- {decision}")
-        lines.append("")
-    else:
-        lines.extend([
-            "No decisions recorded.",
-            "",
-        ])
-
-    # Session History section
-    lines.extend([
-        "## Session History",
-        "",
-    ])
-    if state.session_history:
-        for entry in state.session_history:
-            lines.extend([
-                f"### {entry.timestamp}",
-                "",
-                f"**Action**: {entry.action}",
-                "",
-                f"**Outcome**: {entry.outcome}",
-                "",
-            ])
-    else:
-        lines.extend([
-            "No session history.",
-            "",
-        ])
-
-    return "\n".join(lines)
+    if not (
+        state.current_task
+        or state.context
+        or state.next_steps
+        or state.blockers
+        or state.handoff_notes
+        or state.session_history
+        or state.files_modified
+        or state.decisions_made
+    ):
+        return _empty_state_markdown()
+    return _render_sections(state)
+
+
+@functools.cache
+def _empty_state_markdown() -> str:
+    # Import here to avoid circular dependency
+    from memory.working_memory import WorkingState
+
+    return _render_sections(WorkingState())
+
+
+def _render_sections(state: "WorkingState") -> str:
+    return _TEMPLATE.format_map(
+        {
+            "task": _render_task(state.current_task),
+            "context": _render_bullets(state.context, "No context items.\n\n"),
+            "next_steps": _render_next_steps(state.next_steps),
+            "blockers": _render_blockers(state.blockers),
+            "handoff": (
+                f"{state.handoff_notes}\n\n" if state.handoff_notes else "No handoff notes.\n\n"
+            ),
+            "files": _render_files(state.files_modified),
+            "decisions": _render_bullets(
+                state.decisions_made, "No decisions recorded.\n\n"
+            ),
+            "history": _render_history(state.session_history),
+        }
+    )
+
+
+# Classifies a (stripped) WORKING.md line in one match. Each alternative has
+# a single named group, so match.lastgroup is the line kind and
+# match.group(kind) its payload.
+_LINE_RE = re.compile(
+    r"## (?P<section>.*)"
+    r"|\*\*Title\*\*:(?P<title>.*)"
+    r"|\*\*Status\*\*:(?P<status>.*)"
+    r"|\*\*Assigned\*\*:(?P<assigned>.*)"
+    r"|\*\*Description\*\*:(?P<description>.*)"
+    r"|\*\*Action\*\*:(?P<action>.*)"
+    r"|\*\*Outcome\*\*:(?P<outcome>.*)"
+    r"|\*Created:(?P<created>.*)"
+    r"|### (?P<heading>.*)"
+    r"|- (?P<file>`(?:.*`)?)"
+    r"|- (?P<item>.*)"
+    r"|\d.*?\. (?P<step>.*)"
+)
+
+
+class _WorkingStateParser:
+    """Line-by-line WORKING.md parser state; see parse_working_state()."""
+
+    def __init__(self) -> None:
+        # Import here to avoid circular dependency
+        from memory.working_memory import (
+            WorkingState,
+            TaskInfo,
+            BlockerInfo,
+            SessionEntry,
+        )
+
+        self._task_info = TaskInfo
+        self._blocker_info = BlockerInfo
+        self._session_entry = SessionEntry
+        self.state = WorkingState()
+        self.blocker_desc: str | None = None
+        self.blocker_severity: str | None = None
+        self.session_timestamp: str | None = None
+        self.session_action: str | None = None
+
+    def parse(self, markdown: str) -> "WorkingState":
+        """
+        Parse markdown into self.state.
+
+        Args:
+            markdown: Markdown content to parse
+
+        Returns:
+            The parsed WorkingState
+        """
+        handlers = _HANDLERS
+        match_line = _LINE_RE.fullmatch
+        section = None
+
+        for raw_line in markdown.split("\n"):
+            line = raw_line.strip()
+            if not line:
+                # Blank separators (about half the file) carry no data
+                continue
+            m = match_line(line)
+            kind = m.lastgroup if m else None
+
+            if m is not None and kind == "section":
+                section = m.group("section").strip()
+            elif section == "Handoff Notes":
+                # Free text: every line but headings and the placeholder
+                self._handoff_line(line)
+            elif m is not None and kind is not None and section is not None:
+                handler = handlers.get((section, kind))
+                if handler is not None:
+                    handler(self, line, m.group(kind))
+
+        # Save any remaining session entry
+        self._flush_session("")
+        return self.state
+
+    # --- Current Task ---
+
+    def _title(self, line: str, value: str) -> None:
+        self.state.current_task = self._task_info(title=value.strip())
+
+    def _status(self, line: str, value: str) -> None:
+        if self.state.current_task:
+            self.state.current_task.status = value.strip()
+
+    def _assigned(self, line: str, value: str) -> None:
+        if self.state.current_task:
+            self.state.current_task.assigned_at = value.strip()
+
+    def _description(self, line: str, value: str) -> None:
+        if self.state.current_task:
+            self.state.current_task.description = value.strip()
+
+    # --- List sections ---
+
+    def _context_item(self, line: str, value: str) -> None:
+        if line != "- No context items.":
+            self.state.context.append(line[2:])
+
+    def _next_step(self, line: str, value: str) -> None:
+        self.state.next_steps.append(value)
+
+    def _file(self, line: str, value: str) -> None:
+        self.state.files_modified.append(line[3:-1])
+
+    def _decision(self, line: str, value: str) -> None:
+        if line != "- No decisions recorded.":
+            self.state.decisions_made.append(line[2:])
+
+    # --- Blockers ---
+
+    def _blocker_heading(self, line: str, value: str) -> None:
+        # "### SEVERITY: description"
+        severity, sep, desc = value.partition(":")
+        if sep:
+            self.blocker_severity = severity.strip().lower()
+            self.blocker_desc = desc.strip()
+
+    def _blocker_created(self, line: str, value: str) -> None:
+        if not self.blocker_desc:
+            return
+        self.state.blockers.append(
+            self._blocker_info(
+                description=self.blocker_desc,
+                severity=self.blocker_severity or "medium",
+                created_at=value.replace("*Created:", "").replace("*", "").strip(),
+            )
+        )
+        self.blocker_desc = None
+        self.blocker_severity = None
+
+    # --- Handoff Notes ---
+
+    def _handoff_line(self, line: str) -> None:
+        if line and not line.startswith("#") and line != "No handoff notes.":
+            if self.state.handoff_notes:
+                self.state.handoff_notes += "\n" + line
+            else:
+                self.state.handoff_notes = line
+
+    # --- Session History ---
+
+    def _session_heading(self, line: str, value: str) -> None:
+        # New session entry; save the previous one if it never got an outcome
+        self._flush_session("")
+        self.session_timestamp = value
+        self.session_action = None
+
+    def _session_action(self, line: str, value: str) -> None:
+        self.session_action = value.strip()
+
+    def _session_outcome(self, line: str, value: str) -> None:
+        self._flush_session(value.strip())
+
+    def _flush_session(self, outcome: str) -> None:
+        if self.session_timestamp and self.session_action:
+            self.state.session_history.append(
+                self._session_entry(
+                    timestamp=self.session_timestamp,
+                    action=self.session_action,
+                    outcome=outcome,
+                )
+            )
+            self.session_timestamp = None
+            self.session_action = None
+
+
+# (section, line kind) -> handler; other combinations are ignored
+_HANDLERS = {
+    ("Current Task", "title"): _WorkingStateParser._title,
+    ("Current Task", "status"): _WorkingStateParser._status,
+    ("Current Task", "assigned"): _WorkingStateParser._assigned,
+    ("Current Task", "description"): _WorkingStateParser._description,
+    ("Context", "item"): _WorkingStateParser._context_item,
+    ("Context", "file"): _WorkingStateParser._context_item,
+    ("Next Steps", "step"): _WorkingStateParser._next_step,
+    ("Blockers", "heading"): _WorkingStateParser._blocker_heading,
+    ("Blockers", "created"): _WorkingStateParser._blocker_created,
+    ("Files Modified", "file"): _WorkingStateParser._file,
+    ("Decisions Made", "item"): _WorkingStateParser._decision,
+    ("Decisions Made", "file"): _WorkingStateParser._decision,
+    ("Session History", "heading"): _WorkingStateParser._session_heading,
+    ("Session History", "action"): _WorkingStateParser._session_action,
+    ("Session History", "outcome"): _WorkingStateParser._session_outcome,
+}
 
 
 def parse_working_state(markdown: str) -> "WorkingState":
     """
     Parse a WORKING.md file back into WorkingState.
 
+    Each line is classified by a single precompiled regex and dispatched
+    on (section, line kind) to the handler that updates the state.
+
     Args:
         markdown: Markdown content to parse
 
     Returns:
         WorkingState parsed from markdown
     """
-    # Import here to avoid circular dependency
-    from memory.working_memory import (
-        WorkingState,
-        TaskInfo,
-        BlockerInfo,
-        SessionEntry,
-    )
-
-    state = WorkingState()
-    lines = markdown.split("\n")
-    current_section = None
-    current_blocker_desc = None
-    current_blocker_severity = None
-    current_session_timestamp = None
-    current_session_action = None
-
-    i = 0
-    while i < len(lines):
-        line = lines[i].strip()
-
-        # Section headers
-        if line.startswith("## "):
-            current_section = line[3:].strip()
-            i += 1
-            continue
-
-        # Parse based on current section
-        if current_section == "Current Task":
-            if line.startswith("**Title**:"):
-                title = line.split(":", 1)[1].strip()
-                state.current_task = TaskInfo(title=title)
-            elif line.startswith("**Status**:") and state.current_task:
-                state.current_task.status = line.split(":", 1)[1].strip()
-            elif line.startswith("**Assigned**:") and state.current_task:
-                state.current_task.assigned_at = line.split(":", 1)[1].strip()
-            elif line.startswith("**Description**:") and state.current_task:
-                state.current_task.description = line.split(":", 1)[1].strip()
-
-        elif current_section == "Context":
-            if line.startswith("- ") and line != "- No context items.":
-                state.context.append(line[2:])
-
-        elif current_section == "Next Steps":
-            if line and line[0].isdigit() and ". " in line:
-                step = line.split(". ", 1)[1]
-                state.next_steps.append(step)
-
-        elif current_section == "Blockers":
-            if line.startswith("### "):
-                # Parse blocker header: "### SEVERITY: description"
-                parts = line[4:].split(":", 1)
-                if len(parts) == 2:
-                    current_blocker_severity = parts[0].strip().lower()
-                    current_blocker_desc = parts[1].strip()
-            elif line.startswith("*Created:") and current_blocker_desc:
-                created_at = line.replace("*Created:", "").replace("*", "").strip()
-                state.blockers.append(
-                    BlockerInfo(
-                        description=current_blocker_desc,
-                        severity=current_blocker_severity or "medium",
-                        created_at=created_at,
-                    )
-                )
-                current_blocker_desc = None
-                current_blocker_severity = None
-
-        elif current_section == "Handoff Notes":
-            if line and not line.startswith("#") and line != "No handoff notes.":
-                if state.handoff_notes:
-                    state.handoff_notes += "\n" + line
-                else:
-                    state.handoff_notes = line
-
-        elif current_section == "Files Modified":
-            if line.startswith("- `") and line.endswith("`"):
-                file_path = line[3:-1]
-                state.files_modified.append(file_path)
-
-        elif current_section == "Decisions Made":
-            if line.startswith("- ") and line != "- No decisions recorded.":
-                state.decisions_made.append(line[2:])
-
-        elif current_section == "Session History":
-            if line.startswith("### "):
-                # New session entry
-                if current_session_timestamp and current_session_action:
-                    # Save previous entry
-                    state.session_history.append(
-                        SessionEntry(
-                            timestamp=current_session_timestamp,
-                            action=current_session_action,
-                            outcome="",
-                        )
-                    )
-                current_session_timestamp = line[4:]
-                current_session_action = None
-            elif line.startswith("**Action**:"):
-                current_session_action = line.split(":", 1)[1].strip()
-            elif line.startswith("**Outcome**:"):
-                outcome = line.split(":", 1)[1].strip()
-                if current_session_timestamp and current_session_action:
-                    state.session_history.append(
-                        SessionEntry(
-                            timestamp=current_session_timestamp,
-                            action=current_session_action,
-                            outcome=outcome,
-                        )
-                    )
-                    current_session_timestamp = None
-                    current_session_action = None
-
-        i += 1
-
-    # Save any remaining session entry
-    if current_session_timestamp and current_session_action:
-        state.session_history.append(
-            SessionEntry(
-                timestamp=current_session_timestamp,
-                action=current_session_action,
-                outcome="",
-            )
-        )
-
+    state = _WorkingStateParser().parse(markdown)
     logger.debug("Parsed working state from markdown")
     return state
@@ -7,6 +7,10 @@ blockers, and session history.
 
 from __future__ import annotations
 
+import json
+import os
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -18,6 +22,10 @@ from memory.template import parse_working_state, render_working_state
 
 logger = get_agent_logger(__name__)
 
+_TASK_STATUSES = frozenset({"pending", "in_progress", "completed", "blocked"})
+_ACTIVE_STATUSES = frozenset({"pending", "in_progress", "blocked"})
+_SEVERITIES = frozenset({"low", "medium", "high", "critical"})
+
 
 @dataclass
 class TaskInfo:
@@ -34,8 +42,7 @@ class TaskInfo:
             self.assigned_at = datetime.now().isoformat()
 
         # Validate status
-        valid_statuses = {"pending", "in_progress", "completed", "blocked"}
-        if self.status not in valid_statuses:
+        if self.status not in _TASK_STATUSES:
             logger.warning(
                 f"Invalid task status '{self.status}', defaulting to 'pending'"
             )
@@ -56,8 +63,7 @@ class BlockerInfo:
             self.created_at = datetime.now().isoformat()
 
         # Validate severity
-        valid_severities = {"low", "medium", "high", "critical"}
-        if self.severity not in valid_severities:
+        if self.severity not in _SEVERITIES:
             logger.warning(
                 f"Invalid blocker severity '{self.severity}', defaulting to 'medium'"
             )
@@ -95,89 +101,286 @@ class WorkingState:
     session_history: list[SessionEntry] = field(default_factory=list)
     files_modified: list[str] = field(default_factory=list)
     decisions_made: list[str] = field(default_factory=list)
+    # Membership sets for append_unique(), keyed by list field name, each
+    # paired with the list length it was last in sync with
+    _seen: dict[str, tuple[set[str], int]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def append_unique(self, name: str, item: str) -> bool:
+        """
+        Append to a string list field unless the item is already present.
+
+        Membership is checked against a companion set, so repeated calls stay
+        O(1) instead of scanning the list. The set is rebuilt if the list's
+        length changed since it was last used (e.g. appended to directly).
+
+        Args:
+            name: List field name (context, next_steps, files_modified,
+                decisions_made)
+            item: Item to add
+
+        Returns:
+            True if the item was appended, False if it was a duplicate
+        """
+        items: list[str] = getattr(self, name)
+        cached = self._seen.get(name)
+        if cached is not None and cached[1] == len(items):
+            seen = cached[0]
+        else:
+            seen = set(items)
+        if item in seen:
+            self._seen[name] = (seen, len(items))
+            return False
+        seen.add(item)
+        items.append(item)
+        self._seen[name] = (seen, len(items))
+        return True
 
     def has_active_task(self) -> bool:
         """Check if there is an active task."""
-        return self.current_task is not None and self.current_task.status in {
-            "pending",
-            "in_progress",
-            "blocked",
-        }
+        task = self.current_task
+        return task is not None and task.status in _ACTIVE_STATUSES
 
     def has_blockers(self) -> bool:
         """Check if there are any blockers."""
-        return len(self.blockers) > 0
+        return bool(self.blockers)
 
     def critical_blockers(self) -> list[BlockerInfo]:
         """Get list of critical blockers."""
+        if not self.blockers:
+            return []
         return [b for b in self.blockers if b.severity == "critical"]
 
 
+# --- Journal operations ---
+#
+# Each applies one recorded mutation to a WorkingState. The live helpers on
+# WorkingMemory and journal replay in load() share them, so both paths
+# produce the same state. The list helpers return False for duplicates,
+# which are then not journaled.
+
+
+def _apply_context(state: WorkingState, item: str) -> bool:
+    return state.append_unique("context", item)
+
+
+def _apply_next_step(state: WorkingState, step: str) -> bool:
+    return state.append_unique("next_steps", step)
+
+
+def _apply_file_modified(state: WorkingState, file_path: str) -> bool:
+    return state.append_unique("files_modified", file_path)
+
+
+def _apply_decision(state: WorkingState, decision: str) -> bool:
+    return state.append_unique("decisions_made", decision)
+
+
+def _apply_blocker(
+    state: WorkingState, description: str, severity: str, created_at: str
+) -> bool:
+    state.blockers.append(
+        BlockerInfo(description=description, severity=severity, created_at=created_at)
+    )
+    # Update task status to blocked if there's an active task
+    if state.current_task and state.current_task.status != "completed":
+        state.current_task.status = "blocked"
+    return True
+
+
+def _apply_session(
+    state: WorkingState, timestamp: str, action: str, outcome: str
+) -> bool:
+    state.session_history.append(
+        SessionEntry(timestamp=timestamp, action=action, outcome=outcome)
+    )
+    return True
+
+
+_JOURNAL_OPS: dict[str, Callable[..., bool]] = {
+    "context": _apply_context,
+    "next_step": _apply_next_step,
+    "file": _apply_file_modified,
+    "decision": _apply_decision,
+    "blocker": _apply_blocker,
+    "session": _apply_session,
+}
+
+
 class WorkingMemory:
     """
     Persistent working memory for an agent across sessions.
 
     Manages reading and writing the WORKING.md file that tracks an agent's
     current task state, context, blockers, and session history.
+
+    Append-style updates (context, next steps, files, decisions, blockers,
+    session entries) are written as one line each to WORKING.journal, which
+    load() replays on top of WORKING.md. flush(), save(), or leaving a
+    ``with memory:`` block rewrites WORKING.md once and clears the journal,
+    so N updates cost O(N) bytes written instead of N full rewrites.
     """
 
-    def __init__(self, agent_name: str, memory_dir: str) -> None:
+    def __init__(
+        self, agent_name: str, memory_dir: str, durable: bool = False
+    ) -> None:
         """
         Initialize working memory.
 
         Args:
             agent_name: Name of the agent
-            memory_dir: Directory to store WORKING.md file
+            memory_dir: Directory to store WORKING.md file (created on the
+                first write)
+            durable: fsync WORKING.md before replacing it, so a save survives
+                power loss (slower)
         """
         self.agent_name = agent_name
+        self.durable = durable
         self.memory_dir = Path(memory_dir)
         self.working_file = self.memory_dir / "WORKING.md"
+        self.journal_file = self.memory_dir / "WORKING.journal"
         self._state: WorkingState | None = None
-
-        # Ensure memory directory exists
-        self.memory_dir.mkdir(parents=True, exist_ok=True)
+        # True while the journal holds updates not yet in WORKING.md
+        self._dirty = False
+        # hash() of the WORKING.md content last read or written by us
+        self._last_hash: int | None = None
+        # Timestamp shared by every update inside batch()
+        self._tick_ts: str | None = None
+        # The memory directory is created on first write, not here
+        self._dir_ready = False
 
         logger.info(
             f"WorkingMemory initialized for agent '{agent_name}' at {self.working_file}"
         )
 
+    def __enter__(self) -> WorkingMemory:
+        """Batch updates; WORKING.md is rewritten once on exit."""
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.flush()
+
+    @contextmanager
+    def batch(self) -> Iterator[WorkingMemory]:
+        """
+        Group updates into one tick: they share a timestamp, and WORKING.md
+        is rewritten once on exit.
+
+        Yields:
+            This WorkingMemory
+        """
+        outer_ts = self._tick_ts
+        if outer_ts is None:
+            self._tick_ts = datetime.now().isoformat()
+        try:
+            yield self
+        finally:
+            self._tick_ts = outer_ts
+            if outer_ts is None:
+                self.flush()
+
+    def _now(self) -> str:
+        """Timestamp for a new entry: the batch tick, or the current time."""
+        return self._tick_ts or datetime.now().isoformat()
+
     def load(self) -> WorkingState:
         """
-        Load working state from WORKING.md file.
+        Load working state from WORKING.md file, then replay the journal.
 
         Returns:
             WorkingState loaded from file, or empty state if file doesn't exist
         """
-        if not self.working_file.exists():
+        try:
+            content = self.working_file.read_text(encoding="utf-8")
+        except FileNotFoundError:
             logger.info(
                 f"No existing WORKING.md for '{self.agent_name}', "
                 f"starting with empty state"
             )
             self._state = WorkingState()
-            return self._state
+            self._last_hash = None
+        else:
+            try:
+                self._state = parse_working_state(content)
+                self._last_hash = hash(content)
+                task = self._state.current_task
+                logger.info(
+                    f"Loaded working state for '{self.agent_name}' - "
+                    f"Task: {task.title if task else 'None'}, "
+                    f"Blockers: {len(self._state.blockers)}"
+                )
+            except Exception as e:
+                logger.error(
+                    f"Failed to load WORKING.md for '{self.agent_name}': {e}",
+                    exc_info=True,
+                )
+                # Return empty state on error
+                self._state = WorkingState()
+                self._last_hash = None
+                return self._state
+
+        self._dirty = self._replay_journal(self._state) > 0
+        return self._state
+
+    def _replay_journal(self, state: WorkingState) -> int:
+        """
+        Apply journaled updates to a freshly loaded state.
 
+        Args:
+            state: State parsed from WORKING.md
+
+        Returns:
+            Number of journal entries applied
+        """
         try:
-            content = self.working_file.read_text(encoding="utf-8")
-            self._state = parse_working_state(content)
-            logger.info(
-                f"Loaded working state for '{self.agent_name}' - "
-                f"Task: {self._state.current_task.title if self._state.current_task else 'None'}, "
-                f"Blockers: {len(self._state.blockers)}"
-            )
-            return self._state
-        except Exception as e:
-            logger.error(
-                f"Failed to load WORKING.md for '{self.agent_name}': {e}",
-                exc_info=True,
-            )
-            # Return empty state on error
-            self._state = WorkingState()
-            return self._state
+            lines = self.journal_file.read_text(encoding="utf-8").splitlines()
+        except FileNotFoundError:
+            return 0
+
+        applied = 0
+        for line in lines:
+            try:
+                op, *args = json.loads(line)
+                _JOURNAL_OPS[op](state, *args)
+            except Exception as e:
+                # e.g. a line cut short by a crash mid-append
+                logger.warning(
+                    f"Skipping unreadable journal entry for '{self.agent_name}': {e}"
+                )
+                continue
+            applied += 1
+        return applied
+
+    def _record(self, op: str, *args: str) -> None:
+        """
+        Apply an update to the in-memory state and append it to the journal.
+
+        Args:
+            op: Journal operation name (a key of _JOURNAL_OPS)
+            *args: Operation arguments
+        """
+        if not _JOURNAL_OPS[op](self.get_state(), *args):
+            return
+        entry = json.dumps([op, *args], ensure_ascii=False)
+        self._ensure_dir()
+        with self.journal_file.open("a", encoding="utf-8") as f:
+            f.write(entry + "\n")
+        self._dirty = True
+
+    def flush(self) -> None:
+        """Rewrite WORKING.md with all journaled updates and clear the journal."""
+        if self._dirty and self._state is not None:
+            self.save(self._state)
 
     def save(self, state: WorkingState) -> None:
         """
         Save working state to WORKING.md file.
 
+        The full state now lives in WORKING.md, so the journal is cleared.
+        The file write is skipped when the rendered content matches what was
+        last read or written.
+
         Args:
             state: WorkingState to persist
         """
@@ -185,8 +388,16 @@ class WorkingMemory:
 
         try:
             content = render_working_state(state)
-            self.working_file.write_text(content, encoding="utf-8")
-            logger.info(f"Saved working state for '{self.agent_name}'")
+            content_hash = hash(content)
+            if content_hash == self._last_hash:
+                logger.debug(f"Working state unchanged for '{self.agent_name}'")
+            else:
+                self._write_atomic(content.encode("utf-8"))
+                self._last_hash = content_hash
+                logger.info(f"Saved working state for '{self.agent_name}'")
+            # Only drop the journal once WORKING.md holds its updates
+            self.journal_file.unlink(missing_ok=True)
+            self._dirty = False
         except Exception as e:
             logger.error(
                 f"Failed to save WORKING.md for '{self.agent_name}': {e}",
@@ -194,6 +405,35 @@ class WorkingMemory:
             )
             raise
 
+    def _ensure_dir(self) -> None:
+        """Create the memory directory before the first write."""
+        if not self._dir_ready:
+            self.memory_dir.mkdir(parents=True, exist_ok=True)
+            self._dir_ready = True
+
+    def _write_atomic(self, data: bytes) -> None:
+        """
+        Replace WORKING.md with data via a temp file and rename.
+
+        A crash mid-write leaves the previous WORKING.md intact rather than
+        a truncated one.
+
+        Args:
+            data: Encoded file content
+        """
+        self._ensure_dir()
+        tmp_path = self.working_file.with_suffix(".md.tmp")
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+            if self.durable:
+                os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, self.working_file)
+
     def get_state(self) -> WorkingState:
         """Get current working state, loading if necessary."""
         if self._state is None:
@@ -202,20 +442,13 @@ class WorkingMemory:
 
     def update_session(self, action: str, outcome: str) -> None:
         """
-        Append a session entry and save.
+        Append a session entry (journaled).
 
         Args:
             action: Description of the action taken
             outcome: Description of the outcome
         """
-        state = self.get_state()
-        entry = SessionEntry(
-            timestamp=datetime.now().isoformat(),
-            action=action,
-            outcome=outcome,
-        )
-        state.session_history.append(entry)
-        self.save(state)
+        self._record("session", self._now(), action, outcome)
         logger.debug(f"Added session entry for '{self.agent_name}': {action}")
 
     def set_task(self, title: str, description: str = "") -> None:
@@ -231,6 +464,7 @@ class WorkingMemory:
             title=title,
             description=description,
             status="pending",
+            assigned_at=self._now(),
         )
         self.save(state)
         logger.info(f"Set task for '{self.agent_name}': {title}")
@@ -253,21 +487,19 @@ class WorkingMemory:
 
     def add_blocker(self, description: str, severity: str = "medium") -> None:
         """
-        Add a blocker.
+        Add a blocker (journaled).
+
+        Marks an active task as blocked.
 
         Args:
             description: Description of the blocker
             severity: Severity level (low, medium, high, critical)
         """
-        state = self.get_state()
-        blocker = BlockerInfo(description=description, severity=severity)
-        state.blockers.append(blocker)
-
-        # Update task status to blocked if there's an active task
-        if state.current_task and state.current_task.status != "completed":
-            state.current_task.status = "blocked"
-
-        self.save(state)
+        # Validate once here so replay records the normalized values
+        blocker = BlockerInfo(
+            description=description, severity=severity, created_at=self._now()
+        )
+        self._record("blocker", blocker.description, blocker.severity, blocker.created_at)
         logger.warning(f"Added blocker for '{self.agent_name}': {description}")
 
     def clear_blockers(self) -> None:
@@ -284,29 +516,17 @@ class WorkingMemory:
         logger.info(f"Cleared {blocker_count} blockers for '{self.agent_name}'")
 
     def add_context(self, context_item: str) -> None:
-        """Add a context item."""
-        state = self.get_state()
-        if context_item not in state.context:
-            state.context.append(context_item)
-            self.save(state)
+        """Add a context item (journaled)."""
+        self._record("context", context_item)
 
     def add_next_step(self, step: str) -> None:
-        """Add a next step."""
-        state = self.get_state()
-        if step not in state.next_steps:
-            state.next_steps.append(step)
-            self.save(state)
+        """Add a next step (journaled)."""
+        self._record("next_step", step)
 
     def add_file_modified(self, file_path: str) -> None:
-        """Record a file modification."""
-        state = self.get_state()
-        if file_path not in state.files_modified:
-            state.files_modified.append(file_path)
-            self.save(state)
+        """Record a file modification (journaled)."""
+        self._record("file", file_path)
 
     def add_decision(self, decision: str) -> None:
-        """Record a decision."""
-        state = self.get_state()
-        if decision not in state.decisions_made:
-            state.decisions_made.append(decision)
-            self.save(state)
+        """Record a decision (journaled)."""
+        self._record("decision", decision)
@@ -9,6 +9,8 @@ from __future__ import annotations
 
 import asyncio
 import time
+from collections import ChainMap
+from dataclasses import dataclass
 from typing import Any
 
 from ano_core.errors import AgentExecutionError, PolicyViolationError
@@ -20,6 +22,21 @@ from policy.hooks import PolicyHook
 
 logger = get_agent_logger(__name__)
 
+# Marks the end of the input stream between run_many() stage workers
+_END_OF_RUNS = object()
+
+
+@dataclass
+class _PipelineRun:
+    """State of one input flowing through run_many()."""
+
+    input: dict[str, Any]
+    context: AgentContext
+    result: PipelineResult
+    start_time: float = 0.0
+    aborted: bool = False
+    crashed: bool = False
+
 
 class PipelineCoordinator:
     """
@@ -39,6 +56,8 @@ class PipelineCoordinator:
         registry: Any,
         policy_engine: Any | None = None,
         hooks: list[PolicyHook] | None = None,
+        agent_kwargs: dict[str, Any] | None = None,
+        max_concurrent_agents: int = 8,
     ) -> None:
         """
         Initialize the coordinator.
@@ -48,11 +67,25 @@ class PipelineCoordinator:
             registry: AgentRegistry for instantiating agents
             policy_engine: Optional PolicyEngine for enforcement
             hooks: Optional list of PolicyHooks to run around agent execution
+            agent_kwargs: Constructor arguments passed to registry.get_agent()
+                when it first instantiates an agent (e.g. context, llm).
+                Every agent the pipeline uses is resolved here, once.
+            max_concurrent_agents: Most agents executing at once across all
+                stages and runs of this coordinator (e.g. the profile's
+                "max_concurrent_agents" config or the tier's restriction)
         """
+        if max_concurrent_agents < 1:
+            raise ValueError("max_concurrent_agents must be at least 1")
+
         self.pipeline = pipeline
         self.registry = registry
         self.policy_engine = policy_engine
         self.hooks = hooks or []
+        self.agent_kwargs = agent_kwargs or {}
+        self.max_concurrent_agents = max_concurrent_agents
+        # Shared by every agent execution, so parallel stages and
+        # overlapping run_many() stages draw from one pool
+        self._agent_slots = asyncio.Semaphore(max_concurrent_agents)
 
         # Validate pipeline against registry
         missing = self.pipeline.validate(registry)
@@ -61,6 +94,17 @@ class PipelineCoordinator:
                 f"Pipeline '{pipeline.name}' references missing agents: {missing}"
             )
 
+        # Resolve every agent up front. Instances are shared by all stages
+        # and runs, including concurrent ones, which is safe because agents
+        # keep their per-execution state per execute() call.
+        self._agents: dict[str, Any] = {}
+        for stage in pipeline.stages:
+            for agent_name in stage.agents:
+                if agent_name not in self._agents:
+                    self._agents[agent_name] = registry.get_agent(
+                        agent_name, **self.agent_kwargs
+                    )
+
         logger.info(
             f"PipelineCoordinator initialized for pipeline '{pipeline.name}'"
         )
@@ -78,7 +122,9 @@ class PipelineCoordinator:
         2. Run policy pre-check (if policy engine provided)
         3. Execute agent(s) - parallel if stage.parallel
         4. Run policy post-check (if policy engine provided)
-        5. Pass outputs to next stage via context.upstream_outputs
+        5. Pass outputs to next stage via context.upstream_outputs, which
+           gains one ChainMap layer per completed stage during the run and
+           is flattened back to a dict when the run ends
 
         Args:
             initial_input: Initial input data for the pipeline
@@ -91,75 +137,190 @@ class PipelineCoordinator:
         result = PipelineResult(success=False)
         current_input = initial_input.copy()
 
-        logger.info(f"Starting pipeline '{self.pipeline.name}' execution")
+        logger.info("Starting pipeline '%s' execution", self.pipeline.name)
 
         try:
             for stage in self.pipeline.stages:
-                logger.info(
-                    f"Executing stage '{stage.name}' "
-                    f"({'parallel' if stage.parallel else 'sequential'})"
-                )
+                if not await self._run_stage(stage, current_input, context, result):
+                    break
 
-                try:
-                    stage_outputs = await self._execute_stage(
-                        stage, current_input, context
-                    )
+            result.success = self._succeeded(result)
 
-                    # Merge stage outputs into overall result
-                    result.outputs.update(stage_outputs)
-                    result.stages_completed.append(stage.name)
+        except Exception as e:
+            result.error = f"Pipeline execution error: {e}"
+            logger.error(result.error, exc_info=True)
 
-                    # Update context with outputs for next stage
-                    context.upstream_outputs.update(stage_outputs)
+        finally:
+            context.upstream_outputs = dict(context.upstream_outputs)
+            self._finish(result, start_time)
 
-                    logger.info(
-                        f"Stage '{stage.name}' completed successfully with "
-                        f"{len(stage_outputs)} agent outputs"
-                    )
+        return result
 
-                except Exception as e:
-                    result.stages_failed.append(stage.name)
-                    result.error = str(e)
+    async def run_many(
+        self,
+        inputs: list[dict[str, Any]],
+        context: AgentContext,
+    ) -> list[PipelineResult]:
+        """
+        Execute the pipeline over several inputs with stages overlapped.
 
-                    logger.error(
-                        f"Stage '{stage.name}' failed: {e}",
-                        exc_info=True,
-                    )
+        Each stage runs as a worker connected to the next by a bounded
+        queue (Pipeline.buffer_size), so stage N+1 starts on the first
+        input while stage N moves on to the second. Each input runs with
+        its own copy of the context, and stages still see a single input's
+        data in order, exactly as in run().
 
-                    # If stage is required, stop pipeline
-                    if stage.required:
-                        logger.error(
-                            f"Required stage '{stage.name}' failed, "
-                            f"aborting pipeline"
-                        )
-                        break
-                    else:
-                        logger.warning(
-                            f"Optional stage '{stage.name}' failed, continuing"
-                        )
-
-            # Pipeline succeeds if all required stages completed
-            result.success = len(result.stages_failed) == 0 or not any(
-                stage.required and stage.name in result.stages_failed
-                for stage in self.pipeline.stages
+        Args:
+            inputs: Initial input data, one dict per pipeline run
+            context: Agent context template, copied for each run
+
+        Returns:
+            PipelineResult for each input, in input order
+        """
+        stages = self.pipeline.stages
+        queues: list[asyncio.Queue] = [
+            asyncio.Queue(maxsize=self.pipeline.buffer_size) for _ in stages
+        ]
+        runs = [
+            _PipelineRun(
+                input=initial_input.copy(),
+                context=AgentContext(
+                    org_profile=context.org_profile,
+                    pipeline_state=dict(context.pipeline_state),
+                    upstream_outputs=dict(context.upstream_outputs),
+                ),
+                result=PipelineResult(success=False),
             )
+            for initial_input in inputs
+        ]
 
-        except Exception as e:
-            result.error = f"Pipeline execution error: {e}"
-            logger.error(result.error, exc_info=True)
+        logger.info(
+            "Starting pipeline '%s' over %d inputs", self.pipeline.name, len(runs)
+        )
 
-        finally:
-            duration_ms = (time.perf_counter() - start_time) * 1000
-            result.duration_ms = duration_ms
+        async def feed() -> None:
+            for run in runs:
+                run.start_time = time.perf_counter()
+                await queues[0].put(run)
+            await queues[0].put(_END_OF_RUNS)
+
+        async def work(index: int) -> None:
+            stage = stages[index]
+            inbox = queues[index]
+            outbox = queues[index + 1] if index + 1 < len(stages) else None
+
+            while (run := await inbox.get()) is not _END_OF_RUNS:
+                if not run.aborted:
+                    try:
+                        if not await self._run_stage(
+                            stage, run.input, run.context, run.result
+                        ):
+                            run.aborted = True
+                    except Exception as e:
+                        run.result.error = f"Pipeline execution error: {e}"
+                        run.aborted = run.crashed = True
+                        logger.error(run.result.error, exc_info=True)
+
+                if outbox is not None:
+                    await outbox.put(run)
+                else:
+                    run.result.success = not run.crashed and self._succeeded(
+                        run.result
+                    )
+                    run.context.upstream_outputs = dict(run.context.upstream_outputs)
+                    self._finish(run.result, run.start_time)
+
+            if outbox is not None:
+                await outbox.put(_END_OF_RUNS)
+
+        await asyncio.gather(feed(), *(work(i) for i in range(len(stages))))
+        return [run.result for run in runs]
+
+    async def _run_stage(
+        self,
+        stage: Stage,
+        stage_input: dict[str, Any],
+        context: AgentContext,
+        result: PipelineResult,
+    ) -> bool:
+        """
+        Execute one stage of a run and record its outcome on the result.
+
+        Args:
+            stage: Stage to execute
+            stage_input: Input data for this stage
+            context: Execution context for this run
+            result: Result being accumulated for this run
+
+        Returns:
+            False if a required stage failed and the run should stop
+        """
+        logger.info(
+            "Executing stage '%s' (%s)",
+            stage.name,
+            "parallel" if stage.parallel else "sequential",
+        )
+
+        # The stage's agents write their outputs into a fresh front layer,
+        # which later stages see through the ChainMap. A failed stage's
+        # layer is dropped, so partial outputs don't leak downstream. The
+        # first stage layers over the caller's mapping without writing to it;
+        # run() and run_many() flatten the layers when the run ends.
+        upstream = context.upstream_outputs
+        if not isinstance(upstream, ChainMap):
+            upstream = ChainMap(upstream)
+        context.upstream_outputs = upstream.new_child()
+
+        try:
+            stage_outputs = await self._execute_stage(stage, stage_input, context)
+
+            # Merge stage outputs into overall result
+            result.outputs.update(stage_outputs)
+            result.stages_completed.append(stage.name)
 
             logger.info(
-                f"Pipeline '{self.pipeline.name}' finished in {duration_ms:.2f}ms - "
-                f"Success: {result.success}, "
-                f"Completed: {len(result.stages_completed)}, "
-                f"Failed: {len(result.stages_failed)}"
+                "Stage '%s' completed successfully with %d agent outputs",
+                stage.name,
+                len(stage_outputs),
             )
 
-        return result
+        except Exception as e:
+            context.upstream_outputs = upstream
+            result.stages_failed.append(stage.name)
+            result.error = str(e)
+
+            logger.error("Stage '%s' failed: %s", stage.name, e, exc_info=True)
+
+            # If stage is required, stop pipeline
+            if stage.required:
+                logger.error(
+                    "Required stage '%s' failed, aborting pipeline", stage.name
+                )
+                return False
+            logger.warning("Optional stage '%s' failed, continuing", stage.name)
+
+        return True
+
+    def _succeeded(self, result: PipelineResult) -> bool:
+        """Whether every required stage completed."""
+        return len(result.stages_failed) == 0 or not any(
+            stage.required and stage.name in result.stages_failed
+            for stage in self.pipeline.stages
+        )
+
+    def _finish(self, result: PipelineResult, start_time: float) -> None:
+        """Record the run's duration and log its summary."""
+        duration_ms = (time.perf_counter() - start_time) * 1000
+        result.duration_ms = duration_ms
+
+        logger.info(
+            "Pipeline '%s' finished in %.2fms - Success: %s, Completed: %d, Failed: %d",
+            self.pipeline.name,
+            duration_ms,
+            result.success,
+            len(result.stages_completed),
+            len(result.stages_failed),
+        )
 
     async def _execute_stage(
         self,
@@ -170,6 +331,8 @@ class PipelineCoordinator:
         """
         Execute a single stage.
 
+        Each agent's output is also written to context.upstream_outputs.
+
         Args:
             stage: Stage to execute
             stage_input: Input data for this stage
@@ -183,27 +346,37 @@ class PipelineCoordinator:
             PolicyViolationError: If policy check fails
         """
         stage_outputs: dict[str, Any] = {}
+        # One input object serves every agent in the stage
+        agent_input = AgentInput(data=stage_input, context=context)
 
         if stage.parallel and len(stage.agents) > 1:
-            # Execute agents in parallel
-            tasks = [
-                self._execute_agent(agent_name, stage_input, context)
-                for agent_name in stage.agents
-            ]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-
-            # Process results
-            for agent_name, result in zip(stage.agents, results):
-                if isinstance(result, Exception):
+            # Execute agents in parallel (bounded by max_concurrent_agents).
+            # The first failure cancels the stage's remaining agents.
+            async def run_agent(agent_name: str) -> AgentOutput:
+                try:
+                    return await self._execute_agent(agent_name, agent_input)
+                except Exception as e:
                     raise AgentExecutionError(
-                        f"Agent '{agent_name}' failed: {result}",
+                        f"Agent '{agent_name}' failed: {e}",
                         agent_name=agent_name,
-                    )
-                stage_outputs[agent_name] = result
+                    ) from e
+
+            try:
+                async with asyncio.TaskGroup() as group:
+                    tasks = {
+                        agent_name: group.create_task(run_agent(agent_name))
+                        for agent_name in stage.agents
+                    }
+            except BaseExceptionGroup as failures:
+                raise failures.exceptions[0]
+
+            for agent_name, task in tasks.items():
+                output = stage_outputs[agent_name] = task.result()
+                context.upstream_outputs[agent_name] = output
         else:
             # Execute agents sequentially
             for agent_name in stage.agents:
-                output = await self._execute_agent(agent_name, stage_input, context)
+                output = await self._execute_agent(agent_name, agent_input)
                 stage_outputs[agent_name] = output
 
                 # Make this agent's output available to next agent in stage
@@ -214,16 +387,15 @@ class PipelineCoordinator:
     async def _execute_agent(
         self,
         agent_name: str,
-        agent_input_data: dict[str, Any],
-        context: AgentContext,
+        agent_input: AgentInput,
     ) -> AgentOutput:
         """
         Execute a single agent with policy checks.
 
         Args:
             agent_name: Name of the agent to execute
-            agent_input_data: Input data for the agent
-            context: Execution context
+            agent_input: Stage input, shared by the stage's agents (hooks
+                that modify data get a new AgentInput, never this one)
 
         Returns:
             AgentOutput from the agent
@@ -232,25 +404,23 @@ class PipelineCoordinator:
             AgentExecutionError: If agent execution fails
             PolicyViolationError: If policy check fails
         """
-        logger.debug(f"Executing agent '{agent_name}'")
+        logger.debug("Executing agent '%s'", agent_name)
+        hooks = self.hooks
+        policy_engine = self.policy_engine
 
-        # Get agent instance from registry
-        agent = self.registry.get_agent(agent_name)
+        # The (shared) agent instance resolved in __init__
+        agent = self._agents.get(agent_name)
         if agent is None:
             raise AgentExecutionError(
                 f"Agent '{agent_name}' not found in registry",
                 agent_name=agent_name,
             )
 
-        # Build agent input
-        agent_input = AgentInput(
-            data=agent_input_data,
-            context=context,
-        )
-
         # 1. Run before_execute hooks
-        for hook in self.hooks:
-            logger.debug(f"Running hook '{hook.name}' before_execute for '{agent_name}'")
+        for hook in hooks:
+            logger.debug(
+                "Running hook '%s' before_execute for '%s'", hook.name, agent_name
+            )
             hook_result = await hook.before_execute(agent_name, agent_input)
             if not hook_result.proceed:
                 raise PolicyViolationError(
@@ -272,9 +442,9 @@ class PipelineCoordinator:
                 )
 
         # 2. Pre-execution policy check
-        if self.policy_engine:
-            logger.debug(f"Running pre-execution policy check for '{agent_name}'")
-            pre_check = await self.policy_engine.evaluate_pre(
+        if policy_engine is not None:
+            logger.debug("Running pre-execution policy check for '%s'", agent_name)
+            pre_check = await policy_engine.evaluate_pre(
                 agent_name, agent_input.model_dump()
             )
             if not pre_check.allowed:
@@ -283,9 +453,10 @@ class PipelineCoordinator:
                     violations=[v.model_dump() for v in pre_check.violations],
                 )
 
-        # 3. Execute agent
+        # 3. Execute agent, waiting for a slot if the pool is busy
         try:
-            output = await agent.execute(agent_input)
+            async with self._agent_slots:
+                output = await agent.execute(agent_input)
         except Exception as e:
             raise AgentExecutionError(
                 f"Agent '{agent_name}' execution failed: {e}",
@@ -293,9 +464,9 @@ class PipelineCoordinator:
             ) from e
 
         # 4. Post-execution policy check
-        if self.policy_engine:
-            logger.debug(f"Running post-execution policy check for '{agent_name}'")
-            post_check = await self.policy_engine.evaluate_post(
+        if policy_engine is not None:
+            logger.debug("Running post-execution policy check for '%s'", agent_name)
+            post_check = await policy_engine.evaluate_post(
                 agent_name, output.model_dump()
             )
             if not post_check.allowed:
@@ -305,8 +476,10 @@ class PipelineCoordinator:
                 )
 
         # 5. Run after_execute hooks
-        for hook in self.hooks:
-            logger.debug(f"Running hook '{hook.name}' after_execute for '{agent_name}'")
+        for hook in hooks:
+            logger.debug(
+                "Running hook '%s' after_execute for '%s'", hook.name, agent_name
+            )
             hook_result = await hook.after_execute(agent_name, output)
             if not hook_result.proceed:
                 raise PolicyViolationError(
@@ -320,5 +493,5 @@ class PipelineCoordinator:
                     }],
                 )
 
-        logger.debug(f"Agent '{agent_name}' completed successfully")
+        logger.debug("Agent '%s' completed successfully", agent_name)
         return output
@@ -7,6 +7,7 @@ Defines the structure of a multi-stage agent pipeline with validation support.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Any
 
 from ano_core.logging import get_agent_logger
@@ -71,19 +72,25 @@ class Pipeline:
     A multi-stage agent execution pipeline.
 
     Defines the structure of agent execution with validation support
-    to ensure all referenced agents exist in the registry.
+    to ensure all referenced agents exist in the registry. Stages are
+    fixed once the pipeline is constructed; derived values (stage_names,
+    total_agents, the by-name index) are computed once.
     """
 
-    def __init__(self, name: str, stages: list[Stage]) -> None:
+    def __init__(
+        self, name: str, stages: list[Stage], buffer_size: int = 8
+    ) -> None:
         """
         Initialize a pipeline.
 
         Args:
             name: Unique identifier for this pipeline
             stages: List of stages to execute in order
+            buffer_size: Max inputs queued between stages in batch runs
         """
         self.name = name
         self.stages = stages
+        self.buffer_size = buffer_size
         self._validate_structure()
 
     def _validate_structure(self) -> None:
@@ -91,21 +98,21 @@ class Pipeline:
         if not self.stages:
             raise ValueError(f"Pipeline '{self.name}' must have at least one stage")
 
-        # Check for duplicate stage names
-        stage_names = [stage.name for stage in self.stages]
-        if len(stage_names) != len(set(stage_names)):
+        # Index stages by name; a shorter index means duplicate names
+        self._stage_by_name = {stage.name: stage for stage in self.stages}
+        if len(self._stage_by_name) != len(self.stages):
             raise ValueError(f"Pipeline '{self.name}' has duplicate stage names")
 
         logger.info(
             f"Pipeline '{self.name}' initialized with {len(self.stages)} stages"
         )
 
-    @property
+    @cached_property
     def stage_names(self) -> list[str]:
         """Get list of all stage names in order."""
         return [stage.name for stage in self.stages]
 
-    @property
+    @cached_property
     def total_agents(self) -> int:
         """Total number of agent references across all stages."""
         return sum(len(stage.agents) for stage in self.stages)
@@ -115,30 +122,19 @@ class Pipeline:
         Check that all referenced agents exist in the registry.
 
         Args:
-            registry: AgentRegistry instance to check against
+            registry: AgentRegistry instance to check against (anything with
+                a set-like agent_name_set)
 
         Returns:
-            List of agent names that are missing from the registry
+            Sorted list of agent names that are missing from the registry
         """
-        missing_agents = []
-        all_agent_names = set()
-
-        for stage in self.stages:
-            for agent_name in stage.agents:
-                all_agent_names.add(agent_name)
-
-        # Check each unique agent name against the registry
-        for agent_name in all_agent_names:
-            if not registry.has_agent(agent_name):
-                missing_agents.append(agent_name)
-                logger.warning(
-                    f"Pipeline '{self.name}' references unknown agent: {agent_name}"
-                )
+        requested = {name for stage in self.stages for name in stage.agents}
+        missing_agents = sorted(requested - registry.agent_name_set)
 
         if missing_agents:
             logger.error(
                 f"Pipeline '{self.name}' validation failed: {len(missing_agents)} "
-                f"missing agents"
+                f"missing agents: {missing_agents}"
             )
         else:
             logger.info(f"Pipeline '{self.name}' validation passed")
@@ -147,10 +143,7 @@ class Pipeline:
 
     def get_stage(self, stage_name: str) -> Stage | None:
         """Get a stage by name, or None if not found."""
-        for stage in self.stages:
-            if stage.name == stage_name:
-                return stage
-        return None
+        return self._stage_by_name.get(stage_name)
 
     def __repr__(self) -> str:
         return (
@@ -6,11 +6,13 @@ validation, hooks for custom logic, and tier-specific policy configurations.
 
 Components:
 - PolicyEngine: Orchestrates gate evaluation and decision making
+- PolicyContext: Immutable, hashable evaluation context for the built-in gates
 - PolicyGate: Individual validation gates (tests, security, quality, etc.)
 - PolicyHook: Extension points for custom enforcement logic
 - Tier Policies: Pre-configured policies for dev/test/prod environments
 """
 
+from policy.context import PolicyContext
 from policy.engine import PolicyDecision, PolicyEngine
 from policy.gates import (
     GATE_REGISTRY,
@@ -45,6 +47,7 @@ __all__ = [
     # Engine
     "PolicyEngine",
     "PolicyDecision",
+    "PolicyContext",
     # Gates
     "PolicyGate",
     "GateResult",
@@ -0,0 +1,62 @@
+"""
+Policy Context
+
+Typed, immutable evaluation context for the built-in policy gates.
+"""
+
+from dataclasses import dataclass, field, fields
+from types import MappingProxyType
+from typing import Any, Mapping
+
+
+@dataclass(slots=True, frozen=True)
+class PolicyContext:
+    """
+    Immutable input for policy evaluation.
+
+    Carries the keys the built-in gates read, with the same defaults the
+    gates apply to a missing key. Instances are hashable (mapping fields
+    are left out of the hash but still compared, and are copied into
+    read-only views), so the engine can key its decision cache on the
+    context itself. Keys for custom gates go in ``extra``.
+    """
+
+    tests_passed: bool = False
+    test_results: Mapping[str, Any] = field(default_factory=dict, hash=False)
+    files_verified: bool = False
+    missing_files: tuple[str, ...] = ()
+    current_branch: str = ""
+    allowed_branches: tuple[str, ...] = ()
+    documentation_updated: bool = False
+    documentation_score: float = 1.0
+    missing_docs: tuple[str, ...] = ()
+    lint_passed: bool = False
+    type_check_passed: bool = False
+    quality_issues: tuple[str, ...] = ()
+    security_scan_passed: bool = False
+    vulnerabilities_found: int = 0
+    severity_levels: Mapping[str, Any] = field(default_factory=dict, hash=False)
+    approval_granted: bool = False
+    approver: str = "unknown"
+    approval_timestamp: str = "unknown"
+    extra: Mapping[str, Any] = field(default_factory=dict, hash=False)
+
+    def __post_init__(self) -> None:
+        """Snapshot mapping fields so the context can't change after hashing."""
+        for name in _MAPPING_FIELDS:
+            object.__setattr__(self, name, MappingProxyType(dict(getattr(self, name))))
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Flatten into the mapping form gates are evaluated against.
+
+        Returns:
+            Dict of every field, with ``extra`` merged in at the top level
+        """
+        data = {name: getattr(self, name) for name in _FIELD_NAMES}
+        data.update(self.extra)
+        return data
+
+
+_FIELD_NAMES = tuple(f.name for f in fields(PolicyContext) if f.name != "extra")
+_MAPPING_FIELDS = ("test_results", "severity_levels", "extra")
@@ -5,17 +5,45 @@ Orchestrates policy gate evaluation for pre- and post-execution checks.
 Aggregates gate results into policy decisions and violation reports.
 """
 
+import asyncio
 import logging
-from dataclasses import dataclass, field
-from typing import Any
+import time
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import dataclass, field, replace
+from typing import Any, Optional, Union
 
 from ano_core.environment import EnvironmentTier
 from ano_core.types import PolicyViolation
+from policy.context import PolicyContext
 from policy.gates import GateResult, PolicyGate
 
 logger = logging.getLogger(__name__)
 
 
+def _freeze(value: Any) -> Any:
+    """
+    Convert a context value into a hashable cache-key equivalent.
+
+    Args:
+        value: Context value (nested mappings, lists and sets are frozen recursively)
+
+    Returns:
+        Hashable representation of value
+
+    Raises:
+        TypeError: If value (or a nested value) can't be made hashable
+    """
+    if isinstance(value, Mapping):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(v) for v in value)
+    hash(value)
+    return value
+
+
 @dataclass
 class PolicyDecision:
     """
@@ -31,6 +59,16 @@ class PolicyDecision:
     violations: list[PolicyViolation] = field(default_factory=list)
 
 
+def _copy_decision(decision: PolicyDecision) -> PolicyDecision:
+    """Copy a decision so callers can't mutate a cached instance."""
+    return replace(
+        decision,
+        gates_passed=list(decision.gates_passed),
+        gates_failed=list(decision.gates_failed),
+        violations=list(decision.violations),
+    )
+
+
 class PolicyEngine:
     """
     Policy enforcement engine.
@@ -40,16 +78,45 @@ class PolicyEngine:
     gate configuration with different enforcement levels.
     """
 
-    def __init__(self, gates: list[PolicyGate], tier: EnvironmentTier):
+    def __init__(
+        self,
+        gates: list[PolicyGate],
+        tier: EnvironmentTier,
+        cache_size: int = 0,
+        cache_ttl_s: Optional[float] = None,
+        max_concurrent_gates: Optional[int] = None,
+    ):
         """
         Initialize policy engine.
 
+        Decisions can be cached by (phase, agent, data) when every gate is
+        cacheable, so repeated evaluations of the same input skip the gates.
+        Caching is off by default: it only pays off when callers pass the
+        same small, stable data repeatedly (e.g. a PolicyContext), not whole
+        agent inputs that differ on every call.
+
         Args:
             gates: List of policy gates to evaluate
             tier: Environment tier (controls enforcement strictness)
+            cache_size: Maximum cached decisions (0, the default, disables
+                caching)
+            cache_ttl_s: Seconds a cached decision stays valid (None = no expiry)
+            max_concurrent_gates: Most gate evaluations in flight at once,
+                across all concurrent evaluate_pre/post calls (None = no
+                limit), e.g. to stay under a scanner's rate limit
         """
         self.gates = gates
         self.tier = tier
+        self.cache_size = cache_size
+        self.cache_ttl_s = cache_ttl_s
+        self._gate_slots = (
+            asyncio.Semaphore(max_concurrent_gates)
+            if max_concurrent_gates is not None
+            else None
+        )
+        self._cache: OrderedDict[tuple, tuple[float, PolicyDecision]] = OrderedDict()
+        self._cache_hits = 0
+        self._cache_misses = 0
         logger.info(
             f"Initialized PolicyEngine with {len(gates)} gates for tier {tier.value}"
         )
@@ -57,7 +124,7 @@ class PolicyEngine:
     async def evaluate_pre(
         self,
         agent_name: str,
-        input_data: dict[str, Any],
+        input_data: Union[Mapping[str, Any], PolicyContext],
     ) -> PolicyDecision:
         """
         Evaluate policy gates before agent execution.
@@ -67,13 +134,19 @@ class PolicyEngine:
 
         Args:
             agent_name: Name of the agent about to execute
-            input_data: Input data and context for the agent
+            input_data: Input data and context for the agent (a dict, a
+                ChainMap layering several agent outputs without copying them,
+                or a PolicyContext, which is used as its own cache key)
 
         Returns:
             PolicyDecision indicating whether execution should proceed
         """
         logger.info(f"Pre-execution policy evaluation for agent '{agent_name}'")
 
+        cache_data = input_data
+        if isinstance(input_data, PolicyContext):
+            input_data = input_data.to_dict()
+
         # Build evaluation context
         context = {
             "agent_name": agent_name,
@@ -85,12 +158,12 @@ class PolicyEngine:
         # Merge input_data into context for gate evaluation
         context.update(input_data)
 
-        return await self._evaluate_gates(context)
+        return await self._evaluate_cached("pre-execution", agent_name, cache_data, context)
 
     async def evaluate_post(
         self,
         agent_name: str,
-        output: dict[str, Any],
+        output: Mapping[str, Any],
     ) -> PolicyDecision:
         """
         Evaluate policy gates after agent execution.
@@ -118,7 +191,108 @@ class PolicyEngine:
         # Merge output into context for gate evaluation
         context.update(output)
 
-        return await self._evaluate_gates(context)
+        return await self._evaluate_cached("post-execution", agent_name, output, context)
+
+    def cache_stats(self) -> dict[str, int]:
+        """
+        Get decision cache statistics.
+
+        Returns:
+            Dict with hits, misses, and current size of the decision cache
+        """
+        return {
+            "hits": self._cache_hits,
+            "misses": self._cache_misses,
+            "size": len(self._cache),
+        }
+
+    def clear_cache(self) -> None:
+        """Drop all cached decisions."""
+        self._cache.clear()
+
+    def _cache_key(
+        self,
+        phase: str,
+        agent_name: str,
+        data: Union[Mapping[str, Any], PolicyContext],
+    ) -> Optional[tuple]:
+        """
+        Build the decision cache key, or None if this evaluation can't be cached.
+
+        Args:
+            phase: Evaluation phase ("pre-execution" or "post-execution")
+            agent_name: Name of the agent being evaluated
+            data: Input or output data merged into the gate context; a
+                PolicyContext is hashed as-is instead of being frozen
+
+        Returns:
+            Hashable key, or None when caching is disabled, a gate is not
+            cacheable, or the data isn't hashable
+        """
+        if self.cache_size <= 0:
+            return None
+        if not all(gate.cacheable for gate in self.gates):
+            return None
+        try:
+            if isinstance(data, PolicyContext):
+                hash(data)
+                return (phase, agent_name, data)
+            return (phase, agent_name, _freeze(data))
+        except TypeError:
+            return None
+
+    async def _evaluate_cached(
+        self,
+        phase: str,
+        agent_name: str,
+        data: Union[Mapping[str, Any], PolicyContext],
+        context: dict[str, Any],
+    ) -> PolicyDecision:
+        """
+        Evaluate gates, serving repeated evaluations from the decision cache.
+
+        Args:
+            phase: Evaluation phase ("pre-execution" or "post-execution")
+            agent_name: Name of the agent being evaluated
+            data: Input or output data merged into the gate context
+            context: Full evaluation context
+
+        Returns:
+            PolicyDecision (a copy when served from the cache)
+        """
+        key = self._cache_key(phase, agent_name, data)
+        if key is None:
+            return await self._evaluate_gates(context)
+
+        now = time.monotonic()
+        cached = self._cache.get(key)
+        if cached is not None:
+            stored_at, decision = cached
+            if self.cache_ttl_s is None or now - stored_at < self.cache_ttl_s:
+                self._cache.move_to_end(key)
+                self._cache_hits += 1
+                logger.debug(f"Policy decision cache hit for agent '{agent_name}'")
+                # Re-emit the tier's failed-gate warning/error so denials
+                # served from the cache still reach the audit log
+                self._compute_decision(decision.gates_failed, context)
+                return _copy_decision(decision)
+            del self._cache[key]
+
+        self._cache_misses += 1
+        decision = await self._evaluate_gates(context)
+        self._cache[key] = (now, decision)
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return _copy_decision(decision)
+
+    async def _evaluate_gate(
+        self, gate: PolicyGate, context: dict[str, Any]
+    ) -> GateResult:
+        """Evaluate one gate, waiting for a slot if concurrency is capped."""
+        if self._gate_slots is None:
+            return await gate.evaluate(context)
+        async with self._gate_slots:
+            return await gate.evaluate(context)
 
     async def _evaluate_gates(self, context: dict[str, Any]) -> PolicyDecision:
         """
@@ -134,33 +308,41 @@ class PolicyEngine:
         gates_failed: list[str] = []
         violations: list[PolicyViolation] = []
 
-        for gate in self.gates:
-            try:
-                result = await gate.evaluate(context)
-                logger.debug(
-                    f"Gate '{gate.name}': {'PASS' if result.passed else 'FAIL'} "
-                    f"({result.message})"
-                )
-
-                if result.passed:
-                    gates_passed.append(gate.name)
-                else:
-                    gates_failed.append(gate.name)
-                    violations.append(
-                        self._create_violation(gate, result, context)
-                    )
+        # Gates are independent, so evaluate them concurrently; results come
+        # back in gate order
+        results = await asyncio.gather(
+            *(self._evaluate_gate(gate, context) for gate in self.gates),
+            return_exceptions=True,
+        )
 
-            except Exception as e:
-                logger.error(f"Gate '{gate.name}' evaluation failed: {e}")
+        for gate, result in zip(self.gates, results):
+            if isinstance(result, Exception):
+                logger.error(f"Gate '{gate.name}' evaluation failed: {result}")
                 gates_failed.append(gate.name)
                 violations.append(
                     PolicyViolation(
                         gate=gate.name,
                         severity="error",
-                        message=f"Gate evaluation error: {str(e)}",
+                        message=f"Gate evaluation error: {str(result)}",
                         remediation="Check gate configuration and context data",
                     )
                 )
+                continue
+            if isinstance(result, BaseException):
+                raise result
+
+            logger.debug(
+                f"Gate '{gate.name}': {'PASS' if result.passed else 'FAIL'} "
+                f"({result.message})"
+            )
+
+            if result.passed:
+                gates_passed.append(gate.name)
+            else:
+                gates_failed.append(gate.name)
+                violations.append(
+                    self._create_violation(gate, result, context)
+                )
 
         # Determine overall decision based on tier
         allowed = self._compute_decision(gates_failed, context)
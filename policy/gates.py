@@ -6,6 +6,7 @@ and operational standards in agent execution.
 """
 
 import logging
+import sys
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import Any
@@ -35,8 +36,13 @@ class PolicyGate(ABC):
     A policy gate evaluates a specific aspect of agent execution context
     (e.g., test results, code quality, security) and returns a pass/fail
     decision with context.
+
+    Gates whose result depends only on the evaluation context should set
+    ``cacheable = True`` so the engine may reuse their decisions.
     """
 
+    cacheable: bool = False
+
     def __init__(self, name: str, description: str):
         """
         Initialize a policy gate.
@@ -45,7 +51,8 @@ class PolicyGate(ABC):
             name: Gate identifier (e.g., "test-success")
             description: Human-readable description of what this gate checks
         """
-        self.name = name
+        # Interned: gate names recur in every result and decision
+        self.name = sys.intern(name)
         self.description = description
 
     @abstractmethod
@@ -73,6 +80,8 @@ class TestSuccessGate(PolicyGate):
     deployment or production operations.
     """
 
+    cacheable = True
+
     def __init__(self):
         super().__init__(
             name="test-success",
@@ -116,6 +125,8 @@ class FileVerificationGate(PolicyGate):
     modified unexpectedly.
     """
 
+    cacheable = True
+
     def __init__(self):
         super().__init__(
             name="file-verification",
@@ -167,6 +178,8 @@ class BranchPolicyGate(PolicyGate):
     on main).
     """
 
+    cacheable = True
+
     def __init__(self):
         super().__init__(
             name="branch-policy",
@@ -217,6 +230,8 @@ class DocumentationGate(PolicyGate):
     updates (README, API docs, inline comments).
     """
 
+    cacheable = True
+
     def __init__(self):
         super().__init__(
             name="documentation",
@@ -268,6 +283,8 @@ class CodeQualityGate(PolicyGate):
     static type checking.
     """
 
+    cacheable = True
+
     def __init__(self):
         super().__init__(
             name="code-quality",
@@ -317,6 +334,8 @@ class SecurityValidationGate(PolicyGate):
     dependency checks, secret scanning, and vulnerability scanning.
     """
 
+    cacheable = True
+
     def __init__(self):
         super().__init__(
             name="security-validation",
@@ -361,6 +380,8 @@ class ApprovalGate(PolicyGate):
     approval before proceeding.
     """
 
+    cacheable = True
+
     def __init__(self):
         super().__init__(
             name="approval",
@@ -31,21 +31,21 @@ def get_tier_policy(tier: EnvironmentTier) -> list[PolicyGate]:
     - TEST: All gates enforced, approval required for destructive operations
     - PRODUCTION: All gates strictly enforced with no exceptions
 
+    Gate sets are built once at import; gates are stateless, so the
+    instances are shared between callers.
+
     Args:
         tier: Environment tier to get policy gates for
 
     Returns:
         List of PolicyGate instances configured for the tier
     """
-    if tier == EnvironmentTier.DEVELOPMENT:
-        return _get_development_policy()
-    elif tier == EnvironmentTier.TEST:
-        return _get_test_policy()
-    else:  # PRODUCTION
-        return _get_production_policy()
+    gates = _TIER_GATES.get(tier, _TIER_GATES[EnvironmentTier.PRODUCTION])
+    logger.debug("Using %d policy gates for %s tier", len(gates), tier.value)
+    return list(gates)
 
 
-def _get_development_policy() -> list[PolicyGate]:
+def _get_development_policy() -> tuple[PolicyGate, ...]:
     """
     Get policy gates for development environment.
 
@@ -55,9 +55,9 @@ def _get_development_policy() -> list[PolicyGate]:
     - Focus on education and awareness
 
     Returns:
-        List of development-appropriate policy gates
+        Development-appropriate policy gates
     """
-    gates = [
+    return (
         TestSuccessGate(),
         FileVerificationGate(),
         BranchPolicyGate(),
@@ -65,15 +65,10 @@ def _get_development_policy() -> list[PolicyGate]:
         CodeQualityGate(),
         SecurityValidationGate(),
         # No approval gate in development
-    ]
-
-    logger.info(
-        f"Loaded {len(gates)} policy gates for DEVELOPMENT tier (advisory mode)"
     )
-    return gates
 
 
-def _get_test_policy() -> list[PolicyGate]:
+def _get_test_policy() -> tuple[PolicyGate, ...]:
     """
     Get policy gates for test environment.
 
@@ -83,9 +78,9 @@ def _get_test_policy() -> list[PolicyGate]:
     - Provides pre-production validation
 
     Returns:
-        List of test-appropriate policy gates
+        Test-appropriate policy gates
     """
-    gates = [
+    return (
         TestSuccessGate(),
         FileVerificationGate(),
         BranchPolicyGate(),
@@ -93,13 +88,10 @@ def _get_test_policy() -> list[PolicyGate]:
         CodeQualityGate(),
         SecurityValidationGate(),
         ApprovalGate(),  # Required for destructive operations
-    ]
-
-    logger.info(f"Loaded {len(gates)} policy gates for TEST tier (enforced mode)")
-    return gates
+    )
 
 
-def _get_production_policy() -> list[PolicyGate]:
+def _get_production_policy() -> tuple[PolicyGate, ...]:
     """
     Get policy gates for production environment.
 
@@ -109,9 +101,9 @@ def _get_production_policy() -> list[PolicyGate]:
     - Zero tolerance for violations
 
     Returns:
-        List of production-appropriate policy gates
+        Production-appropriate policy gates
     """
-    gates = [
+    return (
         TestSuccessGate(),
         FileVerificationGate(),
         BranchPolicyGate(),
@@ -119,10 +111,15 @@ def _get_production_policy() -> list[PolicyGate]:
         CodeQualityGate(),
         SecurityValidationGate(),
         ApprovalGate(),  # Always required in production
-    ]
+    )
 
-    logger.info(f"Loaded {len(gates)} policy gates for PRODUCTION tier (strict mode)")
-    return gates
+
+# Tier gate sets, built once at import
+_TIER_GATES: dict[EnvironmentTier, tuple[PolicyGate, ...]] = {
+    EnvironmentTier.DEVELOPMENT: _get_development_policy(),
+    EnvironmentTier.TEST: _get_test_policy(),
+    EnvironmentTier.PRODUCTION: _get_production_policy(),
+}
 
 
 def get_custom_policy(gate_names: list[str]) -> list[PolicyGate]:
@@ -6,6 +6,8 @@ metadata-driven agent discovery, capability tracking, and team organization.
 """
 
 import logging
+import sys
+from collections.abc import KeysView
 from dataclasses import dataclass, field
 from typing import Any, Callable, Optional
 
@@ -20,18 +22,27 @@ class AgentMetadataEntry:
     Metadata entry for a registered agent.
 
     Captures agent identity, capabilities, team membership, and optional
-    input/output schemas for validation.
+    input/output schemas for validation. Identity strings are interned and
+    capabilities stored as a tuple, since the same team, version and
+    capability names repeat across many entries.
     """
 
     name: str
     team: str  # "executive", "development", "operations", etc.
     version: str
-    capabilities: list[str]
+    capabilities: tuple[str, ...]  # any iterable of names is accepted
     description: str = ""
     input_schema: Optional[dict[str, Any]] = None
     output_schema: Optional[dict[str, Any]] = None
     reporting_to: Optional[str] = None  # Name of supervisor agent
 
+    def __post_init__(self) -> None:
+        """Intern identity strings and freeze capabilities into a tuple."""
+        self.name = sys.intern(self.name)
+        self.team = sys.intern(self.team)
+        self.version = sys.intern(self.version)
+        self.capabilities = tuple(sys.intern(c) for c in self.capabilities)
+
 
 class AgentRegistry:
     """
@@ -46,6 +57,12 @@ class AgentRegistry:
         """Initialize empty registry."""
         self._agents: dict[str, type] = {}
         self._metadata: dict[str, AgentMetadataEntry] = {}
+        # Secondary indexes for list_agents() filters, each keyed by agent
+        # name so registration order is kept and unregister is O(1)
+        self._by_team: dict[str, dict[str, AgentMetadataEntry]] = {}
+        self._by_capability: dict[str, dict[str, AgentMetadataEntry]] = {}
+        # Shared agent instances handed out by get_agent()
+        self._instances: dict[str, Any] = {}
         logger.debug("Initialized AgentRegistry")
 
     def register(self, agent_class: type, metadata: AgentMetadataEntry) -> None:
@@ -67,6 +84,9 @@ class AgentRegistry:
 
         self._agents[metadata.name] = agent_class
         self._metadata[metadata.name] = metadata
+        self._by_team.setdefault(metadata.team, {})[metadata.name] = metadata
+        for capability in metadata.capabilities:
+            self._by_capability.setdefault(capability, {})[metadata.name] = metadata
         logger.info(
             f"Registered agent '{metadata.name}' (team={metadata.team}, "
             f"version={metadata.version}, capabilities={len(metadata.capabilities)})"
@@ -93,6 +113,36 @@ class AgentRegistry:
             )
         return self._agents[name]
 
+    def get_agent(self, name: str, **init_kwargs: Any) -> Optional[Any]:
+        """
+        Get a shared instance of a registered agent, creating it on first use.
+
+        The instance is reused for every later call (e.g. each stage of each
+        pipeline run), possibly concurrently, so agents served this way must
+        not keep per-run state on the instance. BaseAgent keeps its start time
+        and LLM usage per execute() call. init_kwargs are only used when the
+        instance is created.
+
+        Args:
+            name: Agent name to look up
+            **init_kwargs: Constructor arguments (e.g. context, llm)
+
+        Returns:
+            The agent instance, or None if the agent is not registered
+        """
+        agent = self._instances.get(name)
+        if agent is None:
+            agent_class = self._agents.get(name)
+            if agent_class is None:
+                return None
+            agent = self._instances[name] = agent_class(**init_kwargs)
+            logger.debug(f"Created shared instance of agent '{name}'")
+        return agent
+
+    def clear_instances(self) -> None:
+        """Drop all shared agent instances so the next get_agent() rebuilds them."""
+        self._instances.clear()
+
     def get_metadata(self, name: str) -> AgentMetadataEntry:
         """
         Retrieve metadata for a registered agent.
@@ -129,13 +179,20 @@ class AgentRegistry:
         Returns:
             List of metadata entries matching the filters
         """
-        results = list(self._metadata.values())
-
-        if team:
-            results = [m for m in results if m.team == team]
-
-        if capability:
-            results = [m for m in results if capability in m.capabilities]
+        if team and capability:
+            by_team = self._by_team.get(team, {})
+            by_capability = self._by_capability.get(capability, {})
+            # Scan the smaller index, probing the larger one
+            if len(by_capability) < len(by_team):
+                results = [m for n, m in by_capability.items() if n in by_team]
+            else:
+                results = [m for n, m in by_team.items() if n in by_capability]
+        elif team:
+            results = list(self._by_team.get(team, {}).values())
+        elif capability:
+            results = list(self._by_capability.get(capability, {}).values())
+        else:
+            results = list(self._metadata.values())
 
         logger.debug(
             f"Listed {len(results)} agents (team={team}, capability={capability})"
@@ -154,6 +211,16 @@ class AgentRegistry:
         """
         return name in self._agents
 
+    @property
+    def agent_name_set(self) -> KeysView[str]:
+        """
+        Registered agent names as a live, set-like view.
+
+        Supports set operations directly, so Pipeline.validate can find
+        every missing agent with one set difference.
+        """
+        return self._agents.keys()
+
     def unregister(self, name: str) -> None:
         """
         Unregister an agent.
@@ -171,7 +238,11 @@ class AgentRegistry:
             )
 
         del self._agents[name]
-        del self._metadata[name]
+        self._instances.pop(name, None)
+        metadata = self._metadata.pop(name)
+        self._by_team[metadata.team].pop(name, None)
+        for capability in metadata.capabilities:
+            self._by_capability[capability].pop(name, None)
         logger.info(f"Unregistered agent '{name}'")
 
 
@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime
 
 import pytest
 
 from agent_framework.base_agent import BaseAgent
 from agent_framework.llm.base_backend import LLMBackend, LLMResponse
+from agent_framework.llm.local_backend import get_local_backend
+from agent_framework.llm.single_flight import SingleFlight
+from agent_framework.llm.tokens import allocate_token_budget, estimate_tokens
 from ano_core.errors import AgentExecutionError
 from ano_core.types import AgentContext, AgentInput, AgentMetadata, AgentOutput, OrgProfile
 
@@ -36,7 +40,7 @@ class TestBaseAgent:
         agent = ConcreteAgent(context=sample_context, llm=mock_llm)
         assert agent.agent_name == "test-agent"
         assert agent.version == "1.0.0"
-        assert agent._llm_call_count == 0
+        assert agent.get_metadata().llm_calls == 0
 
     @pytest.mark.asyncio
     async def test_execute(self, sample_context, sample_input, mock_llm):
@@ -49,17 +53,31 @@ class TestBaseAgent:
     async def test_call_llm_tracks_usage(self, sample_context, mock_llm):
         agent = ConcreteAgent(context=sample_context, llm=mock_llm)
         await agent.call_llm("test prompt")
-        assert agent._llm_call_count == 1
-        assert agent._total_input_tokens == 100
-        assert agent._total_output_tokens == 50
+        metadata = agent.get_metadata()
+        assert metadata.llm_calls == 1
+        assert metadata.tokens_used == 150
 
     @pytest.mark.asyncio
     async def test_call_llm_multiple(self, sample_context, mock_llm):
         agent = ConcreteAgent(context=sample_context, llm=mock_llm)
         await agent.call_llm("prompt 1")
         await agent.call_llm("prompt 2")
-        assert agent._llm_call_count == 2
-        assert agent._total_input_tokens == 200
+        metadata = agent.get_metadata()
+        assert metadata.llm_calls == 2
+        assert metadata.tokens_used == 300
+
+    @pytest.mark.asyncio
+    async def test_execute_metadata_is_per_call(self, sample_context, mock_llm):
+        agent = ConcreteAgent(context=sample_context, llm=mock_llm)
+        await agent.call_llm("outside execute")
+        outputs = await asyncio.gather(
+            agent.execute(AgentInput(data={"query": "a"}, context=sample_context)),
+            agent.execute(AgentInput(data={"query": "b"}, context=sample_context)),
+        )
+        assert [o.metadata.llm_calls for o in outputs] == [1, 1]
+        assert [o.metadata.tokens_used for o in outputs] == [150, 150]
+        later = await agent.execute(AgentInput(data={"query": "c"}, context=sample_context))
+        assert later.metadata.started_at > outputs[0].metadata.started_at
 
     @pytest.mark.asyncio
     async def test_call_llm_passes_params(self, sample_context, mock_llm):
@@ -68,6 +86,83 @@ class TestBaseAgent:
         assert mock_llm.calls[0]["max_tokens"] == 1000
         assert mock_llm.calls[0]["temperature"] == 0.7
 
+    @pytest.mark.asyncio
+    async def test_call_llm_default_max_tokens(self, sample_context, mock_llm):
+        agent = ConcreteAgent(context=sample_context, llm=mock_llm)
+        agent.expected_output_tokens = 2048
+        await agent.call_llm("test")
+        assert mock_llm.calls[0]["max_tokens"] == 2048
+
+    def test_get_max_tokens_override(self, sample_context, mock_llm):
+        agent = ConcreteAgent(context=sample_context, llm=mock_llm)
+        default_input = AgentInput(data={}, context=sample_context)
+        override_input = AgentInput(data={"max_output_tokens": 512}, context=sample_context)
+        assert agent.get_max_tokens(default_input) == agent.expected_output_tokens
+        assert agent.get_max_tokens(override_input) == 512
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_calls_coalesced(self, sample_context):
+        class SlowBackend(MockLLMBackend):
+            async def complete(self, *args, **kwargs) -> LLMResponse:
+                await asyncio.sleep(0.01)
+                return await super().complete(*args, **kwargs)
+
+        llm = SlowBackend()
+        first = ConcreteAgent(context=sample_context, llm=llm)
+        second = ConcreteAgent(context=sample_context, llm=llm)
+        results = await asyncio.gather(
+            first.call_llm("same prompt"), second.call_llm("same prompt")
+        )
+        assert results[0] == results[1]
+        assert len(llm.calls) == 1
+        assert first.get_metadata().llm_calls + second.get_metadata().llm_calls == 1
+
+    @pytest.mark.asyncio
+    async def test_call_llm_streaming(self, sample_context, mock_llm):
+        agent = ConcreteAgent(context=sample_context, llm=mock_llm)
+        chunks = [chunk async for chunk in agent.call_llm_streaming("test")]
+        assert "".join(chunks) == '{"result": "test"}'
+        assert agent.get_metadata().llm_calls == 1
+        assert mock_llm.calls[0]["max_tokens"] == agent.expected_output_tokens
+
+    @pytest.mark.asyncio
+    async def test_call_llm_streaming_failure_raises(self, sample_context):
+        class FailingBackend(LLMBackend):
+            async def complete(self, *args, **kwargs) -> LLMResponse:
+                raise Exception("API down")
+
+        agent = ConcreteAgent(context=sample_context, llm=FailingBackend())
+        with pytest.raises(AgentExecutionError):
+            async for _ in agent.call_llm_streaming("test"):
+                pass
+
+    def test_truncate_text_fits(self, sample_context, mock_llm):
+        agent = ConcreteAgent(context=sample_context, llm=mock_llm)
+        assert agent.truncate_text("short text", 100) == "short text"
+
+    def test_truncate_text_oversized(self, sample_context, mock_llm):
+        agent = ConcreteAgent(context=sample_context, llm=mock_llm)
+        result = agent.truncate_text("x" * 1000, 10)
+        assert result.startswith("x" * 40)
+        assert result.endswith("[TRUNCATED]")
+        assert "x" * 41 not in result
+
+    def test_fit_documents_counts_prompt_overhead(self, sample_context, mock_llm):
+        agent = ConcreteAgent(context=sample_context, llm=mock_llm)
+
+        def render(docs):
+            return "Instructions " * 50 + "\n".join(docs)
+
+        prompt = agent.fit_documents(["a" * 4000, "b" * 2000], render, 500)
+        assert estimate_tokens(prompt) <= 500
+        assert "[TRUNCATED]" in prompt
+
+    def test_get_prompt_budget(self, sample_context, mock_llm):
+        agent = ConcreteAgent(context=sample_context, llm=mock_llm)
+        agent.context_window_tokens = 10_000
+        system_tokens = estimate_tokens(agent.get_system_prompt())
+        assert agent.get_prompt_budget(1000) == 9000 - system_tokens
+
     def test_parse_json_response_valid(self, sample_context, mock_llm):
         agent = ConcreteAgent(context=sample_context, llm=mock_llm)
         result = agent.parse_json_response('{"key": "value"}')
@@ -94,6 +189,20 @@ class TestBaseAgent:
         agent.attach_policy(hook)
         assert len(agent._policy_hooks) == 1
 
+    def test_slotted_subclass_has_no_instance_dict(self, sample_context, mock_llm):
+        class SlottedAgent(BaseAgent):
+            __slots__ = ()
+
+            def get_system_prompt(self) -> str:
+                return ""
+
+            async def execute(self, input_data: AgentInput) -> AgentOutput:
+                raise NotImplementedError
+
+        agent = SlottedAgent(context=sample_context, llm=mock_llm)
+        assert not hasattr(agent, "__dict__")
+        assert agent.context is sample_context
+
     def test_get_metadata(self, sample_context, mock_llm):
         agent = ConcreteAgent(context=sample_context, llm=mock_llm)
         meta = agent.get_metadata()
@@ -136,3 +245,102 @@ class TestLLMResponse:
             metadata={"stop_reason": "end_turn"},
         )
         assert resp.metadata["stop_reason"] == "end_turn"
+
+
+class TestGetLocalBackend:
+    def test_shared_per_config(self):
+        assert get_local_backend() is get_local_backend()
+        other = get_local_backend(model="mistral")
+        assert other is not get_local_backend()
+        assert other.model == "mistral"
+
+
+class TestEstimateTokens:
+    def test_empty(self):
+        assert estimate_tokens("") == 0
+
+    def test_rounds_up(self):
+        assert estimate_tokens("abcd") == 1
+        assert estimate_tokens("abcde") == 2
+
+
+class TestAllocateTokenBudget:
+    def test_under_budget_unchanged(self):
+        assert allocate_token_budget([10, 20], 100) == [10, 20]
+
+    def test_proportional_split(self):
+        assert allocate_token_budget([300, 100], 100) == [75, 25]
+
+    def test_largest_remainder_sums_to_budget(self):
+        shares = allocate_token_budget([1, 1, 1], 2)
+        assert sum(shares) == 2
+        assert all(share in (0, 1) for share in shares)
+
+
+class TestSingleFlight:
+    @pytest.mark.asyncio
+    async def test_sequential_calls_not_shared(self):
+        flight = SingleFlight()
+        calls = []
+
+        async def work():
+            calls.append(1)
+            return len(calls)
+
+        assert await flight.do("key", work) == 1
+        assert await flight.do("key", work) == 2
+        assert flight.inflight_count == 0
+
+    @pytest.mark.asyncio
+    async def test_exception_shared_with_waiters(self):
+        flight = SingleFlight()
+
+        async def failing():
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(
+            flight.do("key", failing), flight.do("key", failing), return_exceptions=True
+        )
+        assert all(isinstance(r, ValueError) for r in results)
+        assert flight.inflight_count == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_leaves_waiters_running(self):
+        flight = SingleFlight()
+        release = asyncio.Event()
+
+        async def work():
+            await release.wait()
+            return "done"
+
+        leader = asyncio.create_task(flight.do("key", work))
+        waiter = asyncio.create_task(flight.do("key", work))
+        await asyncio.sleep(0)
+        leader.cancel()
+        await asyncio.sleep(0)
+        release.set()
+        assert await waiter == "done"
+        assert leader.cancelled()
+        assert flight.inflight_count == 0
+
+    @pytest.mark.asyncio
+    async def test_shared_call_cancelled_without_waiters(self):
+        flight = SingleFlight()
+        started = asyncio.Event()
+        cancelled = asyncio.Event()
+
+        async def work():
+            started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        caller = asyncio.create_task(flight.do("key", work))
+        await started.wait()
+        caller.cancel()
+        await asyncio.wait_for(cancelled.wait(), 1)
+        await asyncio.sleep(0)
+        assert flight.inflight_count == 0
@@ -9,6 +9,7 @@ from datetime import datetime
 from unittest.mock import patch
 
 import pytest
+from pydantic import ValidationError
 
 from ano_core.environment import EnvironmentTier, TierRestrictions, get_tier_restrictions
 from ano_core.errors import (
@@ -21,7 +22,7 @@ from ano_core.errors import (
     RegistryError,
 )
 from ano_core.logging import JsonFormatter, get_agent_logger, setup_logging
-from ano_core.settings import AnoProfile, AnoSettings
+from ano_core.settings import AnoProfile, AnoSettings, load_settings
 from ano_core.types import (
     AgentContext,
     AgentInput,
@@ -60,6 +61,49 @@ class TestAnoSettings:
         assert settings.has_feature("audit_trail") is True
         assert settings.has_feature("nonexistent") is False
 
+    def test_features_cached(self):
+        settings = AnoSettings(ANO_FEATURES="audit_trail")
+        assert settings.features is settings.features
+
+    def test_has_feature_after_model_copy(self):
+        settings = AnoSettings(ANO_FEATURES="audit_trail")
+        copied = settings.model_copy(update={"ANO_FEATURES": "policy_presets"})
+        assert copied.has_feature("policy_presets") is True
+        assert copied.has_feature("audit_trail") is False
+        assert settings.has_feature("audit_trail") is True
+
+    def test_settings_frozen(self):
+        settings = AnoSettings(ANO_FEATURES="audit_trail")
+        with pytest.raises(ValidationError):
+            settings.ANO_FEATURES = "policy_presets"
+
+    def test_load_settings_cached(self):
+        assert load_settings() is load_settings()
+
+    def test_load_settings_missing_config_file(self, monkeypatch, tmp_dir):
+        monkeypatch.setenv("ANO_CONFIG_FILE", os.path.join(tmp_dir, "missing.toml"))
+        load_settings.cache_clear()
+        try:
+            settings = load_settings()
+            assert settings.ANO_CONFIG_FILE.endswith("missing.toml")
+        finally:
+            load_settings.cache_clear()
+
+    def test_load_settings_toml_overlay(self, monkeypatch, tmp_dir):
+        config_path = os.path.join(tmp_dir, "ano.toml")
+        with open(config_path, "w") as f:
+            f.write('ano_log_level = "DEBUG"\nano_debug = true\n')
+        monkeypatch.setenv("ANO_CONFIG_FILE", config_path)
+        monkeypatch.setenv("ANO_DEBUG", "false")
+        monkeypatch.delenv("ANO_LOG_LEVEL", raising=False)
+        load_settings.cache_clear()
+        try:
+            settings = load_settings()
+            assert settings.ANO_LOG_LEVEL == "DEBUG"
+            assert settings.ANO_DEBUG is False  # env var takes precedence
+        finally:
+            load_settings.cache_clear()
+
     def test_profile_enum(self):
         assert AnoProfile.MINIMAL.value == "minimal"
         assert AnoProfile.MSR.value == "msr"
@@ -110,6 +154,12 @@ class TestAgentInput:
         assert inp.data["query"] == "test"
         assert inp.policy_attachments == []
 
+    def test_model_dump_includes_org_profile(self, sample_context):
+        inp = AgentInput(data={"query": "test"}, context=sample_context)
+        dumped = inp.model_dump()
+        assert dumped["data"] == {"query": "test"}
+        assert dumped["context"]["org_profile"]["org_name"] == "Test Organization"
+
 
 class TestAgentMetadata:
     def test_create(self):
@@ -172,6 +222,18 @@ class TestAgentOutput:
         assert output.result["answer"] == "42"
         assert output.policy_report is None
 
+    def test_model_dump_nested(self):
+        meta = AgentMetadata(
+            agent_name="test",
+            version="1.0.0",
+            started_at=datetime(2026, 1, 1),
+        )
+        output = AgentOutput(result={"answer": "42"}, metadata=meta)
+        dumped = output.model_dump()
+        assert dumped["result"] == {"answer": "42"}
+        assert dumped["metadata"]["agent_name"] == "test"
+        assert dumped["policy_report"] is None
+
 
 # --- Errors ---
 
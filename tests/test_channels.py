@@ -2,12 +2,18 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
+
+import httpx
 import pytest
 
 from channels.base_channel import BaseChannel
 from channels.cli.repl import CLIRepl
 from channels.telegram.auth import TelegramAuth, TierConfig
+from channels.telegram.bot_service import TelegramBotService
 from channels.telegram.commands import CommandRegistry
+from channels.telegram.config import TelegramConfig
 
 
 # --- BaseChannel ---
@@ -26,6 +32,22 @@ class TestBaseChannel:
         repl.set_agent(agent)
         assert repl._agent is agent
 
+    def test_lazy_package_exports(self):
+        """Channel exports resolve on first access."""
+        import channels
+        from channels.telegram.config import TelegramConfig
+
+        assert channels.TelegramConfig is TelegramConfig
+        with pytest.raises(AttributeError):
+            channels.NoSuchChannel
+
+    def test_lazy_telegram_exports(self):
+        """Telegram service and webhook resolve on first access."""
+        import channels.telegram
+        from channels.telegram.bot_service import TelegramBotService
+
+        assert channels.telegram.TelegramBotService is TelegramBotService
+
 
 # --- CLIRepl ---
 
@@ -67,6 +89,33 @@ class TestCLIRepl:
         response = await repl.handle_message("user", "hello")
         assert response == "Response: hello"
 
+    @pytest.mark.asyncio
+    async def test_handle_message_with_sync_agent(self):
+        class SyncAgent:
+            def execute(self, text, metadata):
+                return f"Sync: {text}"
+
+        repl = CLIRepl()
+        repl.set_agent(SyncAgent())
+        response = await repl.handle_message("user", "hello")
+        assert response == "Sync: hello"
+
+    @pytest.mark.asyncio
+    async def test_handle_message_agent_error(self):
+        class FailingAgent:
+            async def execute(self, text, metadata):
+                raise ValueError("boom")
+
+        repl = CLIRepl(agent=FailingAgent())
+        response = await repl.handle_message("user", "hello")
+        assert response == "Error: boom"
+
+    def test_print_help(self, capsys):
+        CLIRepl()._print_help()
+        captured = capsys.readouterr()
+        assert captured.out.startswith("ANO Agent REPL Commands:")
+        assert "Everything else is sent to the agent." in captured.out
+
     def test_stop(self):
         repl = CLIRepl()
         repl._running = True
@@ -104,6 +153,25 @@ class TestCommandRegistry:
     def test_parse_command_with_bot_mention(self):
         assert CommandRegistry.parse_command("/start@botname args") == ("start", "args")
 
+    def test_parse_command_multiline_args(self):
+        assert CommandRegistry.parse_command("/note line1\nline2") == ("note", "line1\nline2")
+
+    def test_parse_command_any_token(self):
+        assert CommandRegistry.parse_command("/start-foo bar") == ("start-foo", "bar")
+        assert CommandRegistry.parse_command("/Привет") == ("привет", "")
+        assert CommandRegistry.parse_command("/") == ("", "")
+
+    def test_parse_command_short_messages_cached(self):
+        from channels.telegram.commands import _parse_command_cached
+
+        _parse_command_cached.cache_clear()
+        CommandRegistry.parse_command("/start")
+        CommandRegistry.parse_command("/start")
+        CommandRegistry.parse_command("/note " + "x" * 200)
+        CommandRegistry.parse_command("hello world")
+        info = _parse_command_cached.cache_info()
+        assert (info.hits, info.currsize) == (1, 1)
+
     def test_parse_command_case_insensitive(self):
         cmd, args = CommandRegistry.parse_command("/START")
         assert cmd == "start"
@@ -114,6 +182,16 @@ class TestCommandRegistry:
         cmd_data = registry.commands["export"]
         assert cmd_data["required_tier"] == "premium"
 
+    def test_get_entry(self):
+        registry = CommandRegistry()
+
+        def handler():
+            return None
+
+        registry.register("export", handler, "Export data", required_tier="premium")
+        assert registry.get_entry("export") == (handler, "premium", False)
+        assert registry.get_entry("nonexistent") is None
+
 
 # --- TelegramAuth ---
 
@@ -154,3 +232,452 @@ class TestTelegramAuth:
         assert config.name == "test"
         assert config.level == 5
         assert len(config.features) == 2
+        assert config.features == frozenset({"feature1", "feature2"})
+
+    def test_tier_config_frozen(self):
+        config = TierConfig("test", 5, ["feature1"])
+        with pytest.raises(AttributeError):
+            config.level = 6
+        assert config in {config}
+
+
+# --- TelegramBotService ---
+
+
+class TestTelegramBotService:
+    @pytest.mark.asyncio
+    async def test_send_message_reuses_client(self):
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json={"ok": True})
+
+        bot = TelegramBotService(TelegramConfig(bot_token="123:abc"))
+        bot._client = httpx.AsyncClient(
+            base_url="https://api.telegram.org/bot123:abc",
+            transport=httpx.MockTransport(handler),
+        )
+        client = bot._get_client()
+
+        assert await bot.send_message("42", "one") is True
+        assert await bot.send_message(42, "two") is True
+        assert bot._get_client() is client
+        assert [r.url.path for r in requests] == ["/bot123:abc/sendMessage"] * 2
+        assert json.loads(requests[1].content)["chat_id"] == 42
+
+        await bot.aclose()
+        assert bot._client is None
+
+    def test_gc_task_restarted_on_new_event_loop(self):
+        bot = TelegramBotService(TelegramConfig(bot_token="t"))
+
+        tasks = []
+
+        async def touch():
+            await bot.handle_message("1", "/help")
+            tasks.append(bot._gc_task)
+
+        asyncio.run(touch())
+        asyncio.run(touch())
+        first, second = tasks
+        assert second is not first
+        assert second.get_loop() is not first.get_loop()
+
+        # Closing from yet another loop drops the stale task without erroring
+        asyncio.run(bot.aclose())
+        assert bot._gc_task is None
+
+    @pytest.mark.asyncio
+    async def test_handle_update_sends_reply_before_returning(self):
+        sent = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            sent.append(json.loads(request.content))
+            return httpx.Response(200, json={"ok": True})
+
+        bot = TelegramBotService(TelegramConfig(bot_token="t"))
+        bot._client = httpx.AsyncClient(
+            base_url="https://api.telegram.org/bott",
+            transport=httpx.MockTransport(handler),
+        )
+        update = {"message": {"chat": {"id": 7}, "from": {"id": 1}, "text": "/nope"}}
+        assert await bot.handle_update(update) == {"ok": True}
+        assert sent[0]["chat_id"] == 7
+        assert sent[0]["text"].startswith("Unknown command: /nope")
+
+        await bot.aclose()
+
+    @pytest.mark.asyncio
+    async def test_send_message_truncates(self):
+        sent = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            sent.append(json.loads(request.content)["text"])
+            return httpx.Response(200, json={"ok": True})
+
+        bot = TelegramBotService(TelegramConfig(bot_token="t", max_message_length=100))
+        bot._client = httpx.AsyncClient(
+            base_url="https://api.telegram.org/bott",
+            transport=httpx.MockTransport(handler),
+        )
+        await bot.send_message(1, "x" * 200)
+        assert sent[0] == "x" * 50 + "\n\n[Message truncated]"
+        await bot.aclose()
+
+    def test_sweep_drops_idle_buckets(self, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr("channels.telegram.bot_service.time.monotonic", lambda: now[0])
+        bot = TelegramBotService(TelegramConfig(bot_token="t"))
+        bot._check_rate_limit(1)
+        now[0] += 45
+        bot._check_rate_limit(2)
+        now[0] += 30
+
+        bot._sweep_buckets()
+        assert list(bot._buckets) == [2]
+
+    def test_rate_limit_token_bucket(self, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr("channels.telegram.bot_service.time.monotonic", lambda: now[0])
+        bot = TelegramBotService(TelegramConfig(bot_token="t", rate_limit_per_minute=2))
+
+        assert bot._check_rate_limit(1) is True
+        assert bot._check_rate_limit(1) is True
+        assert bot._check_rate_limit(1) is False
+        # Other users have their own bucket
+        assert bot._check_rate_limit(2) is True
+
+        # One token refills every 30 seconds at 2/minute
+        now[0] += 30
+        assert bot._check_rate_limit(1) is True
+        assert bot._check_rate_limit(1) is False
+
+    @pytest.mark.asyncio
+    async def test_command_tier_enforced(self):
+        bot = TelegramBotService(TelegramConfig(bot_token="t"))
+        bot.register_command("export", lambda sid, args, meta: "exported", required_tier="premium")
+
+        denied = await bot.handle_message("1", "/export", {"tier": "free"})
+        assert "requires premium tier" in denied
+        assert await bot.handle_message("2", "/export", {"tier": "premium"}) == "exported"
+
+    @pytest.mark.asyncio
+    async def test_async_handlers(self):
+        async def status(sender_id, args, metadata):
+            return f"status {args}"
+
+        async def on_message(text, metadata):
+            return f"echo {text}"
+
+        bot = TelegramBotService(TelegramConfig(bot_token="t"))
+        bot.register_command("status", status)
+        bot.set_message_handler(on_message)
+
+        assert bot.commands.get_entry("status")[2] is True
+        assert await bot.handle_message("1", "/status now") == "status now"
+        assert await bot.handle_message("1", "hi") == "echo hi"
+
+    @pytest.mark.asyncio
+    async def test_fixed_replies(self):
+        bot = TelegramBotService(TelegramConfig(bot_token="t", rate_limit_per_minute=1))
+        assert await bot.handle_message("1", "/nope") == (
+            "Unknown command: /nope\n\nType /help to see available commands."
+        )
+        assert await bot.handle_message("1", "again") == (
+            "You're sending messages too fast. Please wait a moment."
+        )
+
+
+# --- WebChatHandler ---
+
+
+class TestWebChatHandler:
+    def test_expired_sessions_evicted_oldest_first(self):
+        chat_widget = pytest.importorskip("channels.web.chat_widget")
+        from datetime import datetime, timedelta
+
+        handler = chat_widget.WebChatHandler()
+        stale = handler._get_or_create_session(None)
+        live = handler._get_or_create_session(None)
+        handler._sessions[stale]["last_activity"] = datetime.utcnow() - timedelta(hours=25)
+        handler._sessions.move_to_end(stale, last=False)
+
+        # Touching a session moves it to the back of the eviction order
+        assert handler._get_or_create_session(live) == live
+        handler._cleanup_sessions()
+        assert list(handler._sessions) == [live]
+
+    def test_expired_session_replaced_on_access(self):
+        chat_widget = pytest.importorskip("channels.web.chat_widget")
+        from datetime import datetime, timedelta
+
+        handler = chat_widget.WebChatHandler()
+        stale = handler._get_or_create_session(None)
+        handler._sessions[stale]["last_activity"] = datetime.utcnow() - timedelta(hours=25)
+
+        assert handler._get_or_create_session(stale) != stale
+        assert stale not in handler._sessions
+
+    @pytest.mark.asyncio
+    async def test_finished_gc_task_is_restarted(self):
+        chat_widget = pytest.importorskip("channels.web.chat_widget")
+
+        handler = chat_widget.WebChatHandler()
+        await handler.handle_message("s", "hi")
+        first = handler._gc_task
+        assert first is not None
+        first.cancel()
+        await asyncio.sleep(0)
+
+        await handler.handle_message("s", "hi")
+        assert handler._gc_task is not first
+        assert not handler._gc_task.done()
+        await handler.aclose()
+        assert handler._gc_task is None
+
+    @pytest.mark.asyncio
+    async def test_history_capped(self):
+        chat_widget = pytest.importorskip("channels.web.chat_widget")
+
+        class RecordingAgent:
+            async def execute(self, text, metadata):
+                self.history = metadata["session_history"]
+                self.count = metadata["user_message_count"]
+                return "ok"
+
+        agent = RecordingAgent()
+        handler = chat_widget.WebChatHandler(agent=agent, history_cap=3)
+        sid = handler._get_or_create_session(None)
+        for i in range(5):
+            await handler.handle_message(sid, f"msg {i}")
+
+        assert [m["text"] for m in agent.history] == ["msg 2", "msg 3", "msg 4"]
+        assert isinstance(agent.history, tuple)
+        assert len(handler._sessions[sid]["history"]) == 3
+        assert agent.count == 5
+
+    @pytest.mark.asyncio
+    async def test_sync_agent_runs_off_event_loop(self):
+        import threading
+
+        chat_widget = pytest.importorskip("channels.web.chat_widget")
+
+        class SyncAgent:
+            def execute(self, text, metadata):
+                return threading.current_thread().name
+
+        handler = chat_widget.WebChatHandler(agent=SyncAgent())
+        thread_name = await handler.handle_message(None, "hello")
+        assert thread_name != threading.current_thread().name
+
+
+# --- Telegram webhook ---
+
+
+class TestTelegramWebhook:
+    def _make_app(
+        self, handle_update, queue_size=1000, webhook_secret="", workers=4, drain_timeout=2.0
+    ):
+        webhook = pytest.importorskip("channels.telegram.webhook")
+
+        class StubBot:
+            async def handle_update(self, update):
+                await handle_update(update)
+
+            async def aclose(self):
+                pass
+
+        return webhook.create_webhook_app(
+            StubBot(),
+            TelegramConfig(bot_token="t", webhook_secret=webhook_secret),
+            queue_size=queue_size,
+            workers=workers,
+            drain_timeout=drain_timeout,
+        )
+
+    @staticmethod
+    def _update(update_id, chat_id):
+        return {"update_id": update_id, "message": {"chat": {"id": chat_id}, "text": "hi"}}
+
+    def test_updates_processed_in_background(self):
+        import threading
+
+        from fastapi.testclient import TestClient
+
+        handled = threading.Event()
+
+        async def handle_update(update):
+            handled.set()
+
+        app = self._make_app(handle_update)
+        with TestClient(app) as client:
+            response = client.post("/webhook", json={"update_id": 1})
+            assert response.status_code == 200
+            assert response.json() == {"ok": True}
+            assert handled.wait(timeout=2)
+
+    def test_updates_processed_concurrently(self):
+        import asyncio
+        import threading
+
+        from fastapi.testclient import TestClient
+
+        active = 0
+        overlapped = threading.Event()
+
+        async def handle_update(update):
+            nonlocal active
+            active += 1
+            if active == 2:
+                overlapped.set()
+            await asyncio.sleep(0.2)
+            active -= 1
+
+        app = self._make_app(handle_update, workers=2)
+        with TestClient(app) as client:
+            # hash(1) % 2 != hash(2) % 2, so the chats land on different workers
+            client.post("/webhook", json=self._update(1, chat_id=1))
+            client.post("/webhook", json=self._update(2, chat_id=2))
+            assert overlapped.wait(timeout=2)
+
+    def test_same_chat_processed_in_order(self):
+        import asyncio
+
+        from fastapi.testclient import TestClient
+
+        active = 0
+        peak = 0
+        handled = []
+
+        async def handle_update(update):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.02)
+            handled.append(update["update_id"])
+            active -= 1
+
+        app = self._make_app(handle_update, workers=4)
+        with TestClient(app) as client:
+            for update_id in range(5):
+                client.post("/webhook", json=self._update(update_id, chat_id=42))
+        assert handled == [0, 1, 2, 3, 4]
+        assert peak == 1
+
+    def test_queued_updates_drained_on_shutdown(self):
+        import asyncio
+
+        from fastapi.testclient import TestClient
+
+        handled = []
+
+        async def handle_update(update):
+            await asyncio.sleep(0.05)
+            handled.append(update["update_id"])
+
+        app = self._make_app(handle_update, workers=1)
+        with TestClient(app) as client:
+            for update_id in range(3):
+                client.post("/webhook", json=self._update(update_id, chat_id=7))
+        assert handled == [0, 1, 2]
+
+    def test_workers_start_without_lifespan(self):
+        import threading
+
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+
+        handled = threading.Event()
+
+        async def handle_update(update):
+            handled.set()
+
+        parent = FastAPI()
+        # Starlette doesn't run the lifespan of mounted sub-applications
+        parent.mount("/telegram", self._make_app(handle_update))
+        with TestClient(parent) as client:
+            response = client.post("/telegram/webhook", json={"update_id": 1})
+            assert response.status_code == 200
+            assert handled.wait(timeout=2)
+
+    def test_full_queue_rejected(self):
+        import asyncio
+
+        from fastapi.testclient import TestClient
+
+        async def handle_update(update):
+            await asyncio.sleep(10)
+
+        app = self._make_app(handle_update, queue_size=1, workers=1, drain_timeout=0.1)
+        with TestClient(app) as client:
+            statuses = [
+                client.post("/webhook", json={"update_id": i}).status_code
+                for i in range(3)
+            ]
+        assert 429 in statuses
+
+    def test_invalid_json_rejected(self):
+        from fastapi.testclient import TestClient
+
+        async def handle_update(update):
+            pass
+
+        app = self._make_app(handle_update)
+        with TestClient(app) as client:
+            response = client.post("/webhook", content=b"{not json")
+        assert response.status_code == 400
+
+    def test_webhook_secret_checked(self):
+        from fastapi.testclient import TestClient
+
+        async def handle_update(update):
+            pass
+
+        app = self._make_app(handle_update, webhook_secret="s3cret")
+        header = "X-Telegram-Bot-Api-Secret-Token"
+        with TestClient(app) as client:
+            denied = client.post("/webhook", json={}, headers={header: "wrong"})
+            allowed = client.post("/webhook", json={}, headers={header: "s3cret"})
+        assert denied.status_code == 401
+        assert allowed.status_code == 200
+
+
+# --- Web chat app ---
+
+
+class TestWebChatApp:
+    def _client(self):
+        chat_widget = pytest.importorskip("channels.web.chat_widget")
+        from fastapi.testclient import TestClient
+
+        class EchoAgent:
+            async def execute(self, text, metadata):
+                return f"Echo: {text}"
+
+        app = chat_widget.create_web_chat_app(chat_widget.WebChatHandler(agent=EchoAgent()))
+        return TestClient(app)
+
+    def test_chat(self):
+        with self._client() as client:
+            response = client.post("/chat", json={"message": "hi"})
+        assert response.status_code == 200
+        assert response.json()["response"] == "Echo: hi"
+
+    def test_chat_invalid_body(self):
+        with self._client() as client:
+            missing = client.post("/chat", json={"session_id": "abc"})
+            malformed = client.post("/chat", content=b"{oops")
+            empty = client.post("/chat", json={"message": "  "})
+        assert missing.status_code == 422
+        assert malformed.status_code == 422
+        assert empty.status_code == 400
+
+    def test_session_history(self):
+        with self._client() as client:
+            session_id = client.post("/chat", json={"message": "hi"}).json()["session_id"]
+            response = client.get(f"/session/{session_id}")
+            missing = client.get("/session/nope")
+        assert response.status_code == 200
+        assert [m["role"] for m in response.json()["history"]] == ["user", "assistant"]
+        assert missing.status_code == 404
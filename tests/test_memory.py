@@ -6,6 +6,7 @@ import os
 
 import pytest
 
+from memory.template import parse_working_state, render_working_state
 from memory.working_memory import (
     BlockerInfo,
     SessionEntry,
@@ -79,11 +80,24 @@ class TestWorkingState:
         critical = state.critical_blockers()
         assert len(critical) == 2
 
+    def test_append_unique(self):
+        state = WorkingState(context=["a"])
+        assert state.append_unique("context", "b") is True
+        assert state.append_unique("context", "a") is False
+        # Direct appends are picked up on the next call
+        state.context.append("c")
+        assert state.append_unique("context", "c") is False
+        assert state.context == ["a", "b", "c"]
+        assert state == WorkingState(context=["a", "b", "c"])
+
 
 class TestWorkingMemory:
-    def test_init_creates_dir(self, tmp_dir):
+    def test_first_write_creates_dir(self, tmp_dir):
         subdir = os.path.join(tmp_dir, "agent-memory")
         memory = WorkingMemory("test-agent", subdir)
+        assert memory.load().current_task is None
+        assert not os.path.exists(subdir)
+        memory.add_context("Organization type: Municipal")
         assert os.path.isdir(subdir)
 
     def test_load_empty(self, tmp_dir):
@@ -170,3 +184,103 @@ class TestWorkingMemory:
         memory = WorkingMemory("test-agent", tmp_dir)
         state = memory.get_state()
         assert isinstance(state, WorkingState)
+
+    def test_updates_journaled_not_rewritten(self, tmp_dir):
+        memory = WorkingMemory("test-agent", tmp_dir)
+        memory.set_task("Test task")
+        before = memory.working_file.read_text(encoding="utf-8")
+        memory.add_context("Organization type: Municipal")
+        memory.add_next_step("Review regulations")
+        assert memory.working_file.read_text(encoding="utf-8") == before
+        assert len(memory.journal_file.read_text(encoding="utf-8").splitlines()) == 2
+
+    def test_context_manager_flushes(self, tmp_dir):
+        with WorkingMemory("test-agent", tmp_dir) as memory:
+            memory.set_task("Test task")
+            memory.add_blocker("Waiting for review", severity="high")
+            memory.update_session("Analyzed data", "Found 4 insights")
+        assert not memory.journal_file.exists()
+        state = WorkingMemory("test-agent", tmp_dir).load()
+        assert state.current_task.status == "blocked"
+        assert state.blockers[0].severity == "high"
+        assert state.session_history[0].outcome == "Found 4 insights"
+
+    def test_replay_matches_flush(self, tmp_dir):
+        memory = WorkingMemory("test-agent", tmp_dir)
+        memory.set_task("Test task")
+        memory.add_decision("Use PostgreSQL\tfor persistence")
+        memory.add_file_modified("src/main.py")
+        replayed = render_working_state(WorkingMemory("test-agent", tmp_dir).load())
+        memory.flush()
+        assert render_working_state(memory.load()) == replayed
+
+    def test_unchanged_save_skips_write(self, tmp_dir):
+        memory = WorkingMemory("test-agent", tmp_dir)
+        memory.set_task("Test task")
+        os.utime(memory.working_file, ns=(0, 0))
+        memory.save(memory.get_state())
+        assert memory.working_file.stat().st_mtime_ns == 0
+        memory.update_session("Analyzed data", "Found 4 insights")
+        memory.flush()
+        assert memory.working_file.stat().st_mtime_ns != 0
+
+    def test_save_replaces_file_atomically(self, tmp_dir):
+        memory = WorkingMemory("test-agent", tmp_dir, durable=True)
+        memory.set_task("Test task")
+        memory.set_task("Renamed task")
+        assert os.listdir(tmp_dir) == ["WORKING.md"]
+        assert memory.load().current_task.title == "Renamed task"
+
+    def test_batch_shares_timestamp(self, tmp_dir):
+        memory = WorkingMemory("test-agent", tmp_dir)
+        with memory.batch():
+            memory.set_task("Test task")
+            memory.add_blocker("Waiting for review")
+            memory.update_session("Analyzed data", "Found 4 insights")
+            assert memory.journal_file.exists()
+        assert not memory.journal_file.exists()
+        state = memory.load()
+        assert (
+            state.current_task.assigned_at
+            == state.blockers[0].created_at
+            == state.session_history[0].timestamp
+        )
+
+    def test_truncated_journal_entry_skipped(self, tmp_dir):
+        memory = WorkingMemory("test-agent", tmp_dir)
+        memory.add_context("kept")
+        with memory.journal_file.open("a", encoding="utf-8") as f:
+            f.write('["context", "lo')
+        assert WorkingMemory("test-agent", tmp_dir).load().context == ["kept"]
+
+
+class TestTemplate:
+    def _full_state(self):
+        state = WorkingState()
+        state.current_task = TaskInfo(
+            title="Ship it", description="Release 1.0", assigned_at="2026-01-01"
+        )
+        state.context = ["repo is clean"]
+        state.next_steps = ["tag", "publish"]
+        state.blockers = [BlockerInfo("CI down", "high", "2026-01-02")]
+        state.handoff_notes = "line one\nline two"
+        state.files_modified = ["setup.py"]
+        state.decisions_made = ["use hatch"]
+        state.session_history = [
+            SessionEntry("t1", "built", "ok"),
+            SessionEntry("t2", "tested", "green"),
+        ]
+        return state
+
+    def test_render_empty(self):
+        rendered = render_working_state(WorkingState())
+        assert rendered.startswith(
+            "# Agent Working Memory\n\n## Current Task\n\nNo active task.\n\n"
+        )
+        assert rendered.endswith("## Session History\n\nNo session history.\n")
+
+    def test_round_trip(self):
+        state = self._full_state()
+        rendered = render_working_state(state)
+        assert rendered.endswith("**Outcome**: green\n")
+        assert parse_working_state(rendered) == state
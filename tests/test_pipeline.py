@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
+
 import pytest
 
 from pipeline.pipeline import Pipeline, PipelineResult, Stage
+from registry.agent_registry import AgentMetadataEntry, AgentRegistry
 
 
 class TestStage:
@@ -93,6 +96,18 @@ class TestPipeline:
         pipeline = Pipeline("multi", stages)
         assert pipeline.total_agents == 3
 
+    def test_validate_reports_missing_sorted(self):
+        registry = AgentRegistry()
+        registry.register(
+            object,
+            AgentMetadataEntry(name="b", team="core", version="1.0.0", capabilities=()),
+        )
+        pipeline = Pipeline(
+            "test",
+            [Stage(name="s1", agents=["d", "b"]), Stage(name="s2", agents=["a", "d"])],
+        )
+        assert pipeline.validate(registry) == ["a", "d"]
+
     def test_get_stage(self):
         stages = [
             Stage(name="research", agents=["a1"]),
@@ -174,6 +189,7 @@ def _make_registry(agent_names: list[str]):
 
     # validate returns empty list (no missing agents)
     registry.has = lambda name: name in agents
+    registry.agent_name_set = agents.keys()
     return registry
 
 
@@ -281,3 +297,230 @@ class TestPipelineCoordinator:
 
         assert result.success is False
         assert "step1" in result.stages_failed
+
+    @pytest.mark.asyncio
+    async def test_run_many_results_in_input_order(self):
+        """run_many returns one result per input, each with its own context."""
+        pipeline = Pipeline(
+            "batched",
+            [
+                Stage(name="step1", agents=["agent-a"]),
+                Stage(name="step2", agents=["agent-b"]),
+            ],
+            buffer_size=1,
+        )
+        registry = _make_registry(["agent-a", "agent-b"])
+        coordinator = PipelineCoordinator(pipeline, registry)
+        context = _make_context()
+
+        results = await coordinator.run_many(
+            [{"query": str(i)} for i in range(3)], context
+        )
+
+        assert len(results) == 3
+        assert all(r.success for r in results)
+        assert all(r.stages_completed == ["step1", "step2"] for r in results)
+        assert context.upstream_outputs == {}
+        assert registry.get_agent("agent-b").execute.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_run_many_required_failure_skips_later_stages(self):
+        """A run whose required stage fails does not reach later stages."""
+        pipeline = Pipeline(
+            "batched-fail",
+            [
+                Stage(name="step1", agents=["agent-a"]),
+                Stage(name="step2", agents=["agent-b"]),
+            ],
+        )
+        registry = _make_registry(["agent-a", "agent-b"])
+        registry.get_agent("agent-a").execute.side_effect = [
+            _make_output(),
+            RuntimeError("boom"),
+        ]
+        coordinator = PipelineCoordinator(pipeline, registry)
+
+        results = await coordinator.run_many(
+            [{"query": "ok"}, {"query": "bad"}], _make_context()
+        )
+
+        assert results[0].success is True
+        assert results[1].success is False
+        assert results[1].stages_failed == ["step1"]
+        assert registry.get_agent("agent-b").execute.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_parallel_stage_bounded(self):
+        """A parallel stage runs at most max_concurrent_agents agents at once."""
+        names = [f"agent-{i}" for i in range(5)]
+        pipeline = Pipeline("fan-out", [Stage(name="step1", agents=names, parallel=True)])
+        registry = _make_registry(names)
+        running = peak = 0
+
+        async def execute(agent_input):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return _make_output()
+
+        for name in names:
+            registry.get_agent(name).execute.side_effect = execute
+        coordinator = PipelineCoordinator(
+            pipeline, registry, max_concurrent_agents=2
+        )
+
+        result = await coordinator.run({"query": "test"}, _make_context())
+
+        assert result.success is True
+        assert list(result.outputs) == names
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_parallel_stage_failure_cancels_siblings(self):
+        """The first failing agent fails the stage and cancels the rest."""
+        pipeline = Pipeline(
+            "fan-out-fail",
+            [Stage(name="step1", agents=["agent-a", "agent-b"], parallel=True)],
+        )
+        registry = _make_registry(["agent-a", "agent-b"])
+        cancelled = False
+
+        async def slow(agent_input):
+            nonlocal cancelled
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled = True
+                raise
+
+        registry.get_agent("agent-a").execute.side_effect = slow
+        registry.get_agent("agent-b").execute.side_effect = RuntimeError("boom")
+        coordinator = PipelineCoordinator(pipeline, registry)
+
+        result = await coordinator.run({"query": "test"}, _make_context())
+
+        assert result.success is False
+        assert "Agent 'agent-b' failed" in result.error
+        assert cancelled is True
+
+    @pytest.mark.asyncio
+    async def test_failed_stage_outputs_not_passed_downstream(self):
+        """A failed optional stage's partial outputs are rolled back."""
+        pipeline = Pipeline(
+            "rollback",
+            [
+                Stage(name="step1", agents=["agent-a"]),
+                Stage(name="step2", agents=["agent-b", "agent-c"], required=False),
+                Stage(name="step3", agents=["agent-d"]),
+            ],
+        )
+        registry = _make_registry(["agent-a", "agent-b", "agent-c", "agent-d"])
+        registry.get_agent("agent-c").execute.side_effect = RuntimeError("boom")
+        seen = {}
+
+        async def execute(agent_input):
+            seen.update(agent_input.context.upstream_outputs)
+            return _make_output()
+
+        registry.get_agent("agent-d").execute.side_effect = execute
+        context = _make_context()
+        coordinator = PipelineCoordinator(pipeline, registry)
+
+        result = await coordinator.run({"query": "test"}, context)
+
+        assert result.success is True
+        assert set(seen) == {"agent-a"}
+        assert set(context.upstream_outputs) == {"agent-a", "agent-d"}
+
+    @pytest.mark.asyncio
+    async def test_reused_context_flattened_after_each_run(self):
+        """Stage layers are flattened when a run ends, so reuse doesn't nest them."""
+        pipeline = Pipeline(
+            "reuse",
+            [
+                Stage(name="step1", agents=["agent-a"]),
+                Stage(name="step2", agents=["agent-b"]),
+            ],
+        )
+        registry = _make_registry(["agent-a", "agent-b"])
+        coordinator = PipelineCoordinator(pipeline, registry)
+        context = _make_context()
+        original = context.upstream_outputs
+
+        for _ in range(3):
+            await coordinator.run({"query": "test"}, context)
+            assert type(context.upstream_outputs) is dict
+            assert set(context.upstream_outputs) == {"agent-a", "agent-b"}
+        assert original == {}
+
+    @pytest.mark.asyncio
+    async def test_agent_resolved_once_per_coordinator(self):
+        """The coordinator resolves each agent once, when it is created."""
+        pipeline = Pipeline("repeat", [Stage(name="step1", agents=["agent-a"])])
+        registry = _make_registry(["agent-a"])
+        lookups = []
+        get_agent = registry.get_agent
+
+        def counting_get_agent(name):
+            lookups.append(name)
+            return get_agent(name)
+
+        registry.get_agent = counting_get_agent
+        coordinator = PipelineCoordinator(pipeline, registry)
+        assert lookups == ["agent-a"]
+
+        for _ in range(3):
+            result = await coordinator.run({"query": "test"}, _make_context())
+            assert result.success is True
+        assert lookups == ["agent-a"]
+
+    @pytest.mark.asyncio
+    async def test_stage_agents_share_input(self):
+        """Agents of one stage receive the same AgentInput."""
+        pipeline = Pipeline("shared", [Stage(name="step1", agents=["agent-a", "agent-b"])])
+        registry = _make_registry(["agent-a", "agent-b"])
+        coordinator = PipelineCoordinator(pipeline, registry)
+
+        result = await coordinator.run({"query": "test"}, _make_context())
+
+        assert result.success is True
+        first = registry.get_agent("agent-a").execute.await_args.args[0]
+        second = registry.get_agent("agent-b").execute.await_args.args[0]
+        assert first is second
+        assert first.data == {"query": "test"}
+
+    @pytest.mark.asyncio
+    async def test_agent_limit_shared_across_runs(self):
+        """max_concurrent_agents bounds agents across overlapping runs."""
+        pipeline = Pipeline(
+            "pooled",
+            [
+                Stage(name="step1", agents=["agent-a"]),
+                Stage(name="step2", agents=["agent-b"]),
+            ],
+        )
+        registry = _make_registry(["agent-a", "agent-b"])
+        running = peak = 0
+
+        async def execute(agent_input):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return _make_output()
+
+        registry.get_agent("agent-a").execute.side_effect = execute
+        registry.get_agent("agent-b").execute.side_effect = execute
+        coordinator = PipelineCoordinator(
+            pipeline, registry, max_concurrent_agents=1
+        )
+
+        results = await coordinator.run_many(
+            [{"query": str(i)} for i in range(3)], _make_context()
+        )
+
+        assert all(r.success for r in results)
+        assert peak == 1
@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections import ChainMap
 from datetime import datetime
 
 import pytest
 
 from ano_core.environment import EnvironmentTier
 from ano_core.types import AgentInput, AgentMetadata, AgentOutput, PolicyViolation
+from policy.context import PolicyContext
 from policy.engine import PolicyDecision, PolicyEngine
 from policy.gates import (
     ApprovalGate,
@@ -16,11 +19,19 @@ from policy.gates import (
     DocumentationGate,
     FileVerificationGate,
     GateResult,
+    PolicyGate,
     SecurityValidationGate,
     TestSuccessGate,
     get_gate,
     GATE_REGISTRY,
 )
+from policy.hooks import (
+    AuditLoggingHook,
+    CostTrackingHook,
+    DataSanitizationHook,
+    RateLimitHook,
+)
+from policy.tier_policy import get_tier_policy
 
 
 # --- Individual Gates ---
@@ -287,16 +298,136 @@ class TestPolicyEngine:
         decision = await engine.evaluate_pre("test-agent", {})
         assert decision.allowed is True
 
+    @pytest.mark.asyncio
+    async def test_gates_evaluated_concurrently(self):
+        running = 0
+        peak = 0
 
-# --- Policy Hooks ---
+        class SlowGate(PolicyGate):
+            def __init__(self, name, passed):
+                super().__init__(name=name, description="slow")
+                self.passed = passed
 
+            async def evaluate(self, context):
+                nonlocal running, peak
+                running += 1
+                peak = max(peak, running)
+                await asyncio.sleep(0.01)
+                running -= 1
+                if self.passed is None:
+                    raise RuntimeError("boom")
+                return GateResult(passed=self.passed, gate_name=self.name)
 
-from policy.hooks import (
-    AuditLoggingHook,
-    CostTrackingHook,
-    DataSanitizationHook,
-    RateLimitHook,
-)
+        gates = [SlowGate("a", True), SlowGate("b", None), SlowGate("c", False)]
+        engine = PolicyEngine(gates, EnvironmentTier.TEST)
+        decision = await engine.evaluate_pre("test-agent", {})
+        assert peak == 3
+        assert decision.gates_passed == ["a"]
+        assert decision.gates_failed == ["b", "c"]
+        assert "Gate evaluation error: boom" in decision.violations[0].message
+
+        peak = 0
+        capped = PolicyEngine(gates, EnvironmentTier.TEST, max_concurrent_gates=2)
+        assert await capped.evaluate_pre("test-agent", {}) == decision
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_decisions_cached(self):
+        engine = PolicyEngine([TestSuccessGate()], EnvironmentTier.TEST, cache_size=1024)
+        data = {"tests_passed": False, "test_results": {"failed": 2}}
+        first = await engine.evaluate_pre("test-agent", data)
+        second = await engine.evaluate_pre("test-agent", dict(data))
+        await engine.evaluate_post("test-agent", data)
+
+        assert second == first
+        assert second is not first
+        assert engine.cache_stats() == {"hits": 1, "misses": 2, "size": 2}
+
+    @pytest.mark.asyncio
+    async def test_cache_off_by_default(self):
+        engine = PolicyEngine([TestSuccessGate()], EnvironmentTier.TEST)
+        await engine.evaluate_pre("test-agent", {"tests_passed": True})
+        await engine.evaluate_pre("test-agent", {"tests_passed": True})
+        assert engine.cache_stats() == {"hits": 0, "misses": 0, "size": 0}
+
+    @pytest.mark.asyncio
+    async def test_cached_denial_still_logged(self, caplog):
+        engine = PolicyEngine([TestSuccessGate()], EnvironmentTier.TEST, cache_size=1024)
+        data = {"tests_passed": False, "test_results": {"failed": 2}}
+        await engine.evaluate_pre("test-agent", data)
+        caplog.clear()
+        with caplog.at_level("WARNING", logger="policy.engine"):
+            decision = await engine.evaluate_pre("test-agent", data)
+        assert decision.allowed is False
+        assert engine.cache_stats()["hits"] == 1
+        assert "gates failed (blocking)" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_cache_ttl_expires(self, monkeypatch):
+        now = [100.0]
+        monkeypatch.setattr("policy.engine.time.monotonic", lambda: now[0])
+        engine = PolicyEngine(
+            [TestSuccessGate()], EnvironmentTier.TEST, cache_size=1024, cache_ttl_s=5
+        )
+        await engine.evaluate_pre("test-agent", {"tests_passed": True})
+        now[0] += 10
+        await engine.evaluate_pre("test-agent", {"tests_passed": True})
+        assert engine.cache_stats()["misses"] == 2
+
+    @pytest.mark.asyncio
+    async def test_chain_map_input(self):
+        engine = PolicyEngine([TestSuccessGate()], EnvironmentTier.TEST, cache_size=1024)
+        layered = ChainMap({"tests_passed": True}, {"tests_passed": False})
+        first = await engine.evaluate_pre("test-agent", layered)
+        second = await engine.evaluate_pre("test-agent", {"tests_passed": True})
+
+        assert first.allowed is True
+        assert second == first
+        assert engine.cache_stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_policy_context_input(self):
+        engine = PolicyEngine([TestSuccessGate()], EnvironmentTier.TEST, cache_size=1024)
+        failing = PolicyContext(test_results={"failed": 3})
+        first = await engine.evaluate_pre("test-agent", failing)
+        second = await engine.evaluate_pre("test-agent", PolicyContext(test_results={"failed": 3}))
+
+        assert first.allowed is False
+        assert "3" in first.violations[0].message
+        assert second == first
+        assert engine.cache_stats() == {"hits": 1, "misses": 1, "size": 1}
+
+    def test_policy_context_frozen_and_hashable(self):
+        results = {"failed": 1}
+        context = PolicyContext(test_results=results, extra={"custom": True})
+        results["failed"] = 2
+
+        assert context.test_results["failed"] == 1
+        assert context.to_dict()["custom"] is True
+        assert hash(context) == hash(PolicyContext(test_results={"failed": 2}))
+        with pytest.raises(AttributeError):
+            context.tests_passed = True
+
+    @pytest.mark.asyncio
+    async def test_non_cacheable_gate_skips_cache(self):
+        class CountingGate(PolicyGate):
+            calls = 0
+
+            def __init__(self):
+                super().__init__(name="counting", description="counts")
+
+            async def evaluate(self, context):
+                CountingGate.calls += 1
+                return GateResult(passed=True, gate_name=self.name)
+
+        engine = PolicyEngine([CountingGate()], EnvironmentTier.TEST, cache_size=1024)
+        await engine.evaluate_pre("test-agent", {})
+        await engine.evaluate_pre("test-agent", {})
+        assert CountingGate.calls == 2
+        assert engine.cache_stats()["size"] == 0
+
+
+# --- Policy Hooks ---
 
 
 class TestAuditLoggingHook:
@@ -392,3 +523,21 @@ class TestDataSanitizationHook:
         assert result.proceed is True
         assert result.modified_data["password"] == "***REDACTED***"
         assert result.modified_data["data"] == "ok"
+
+
+# --- Tier Policies ---
+
+
+class TestTierPolicy:
+    def test_gate_counts(self):
+        assert len(get_tier_policy(EnvironmentTier.DEVELOPMENT)) == 6
+        assert len(get_tier_policy(EnvironmentTier.TEST)) == 7
+        assert len(get_tier_policy(EnvironmentTier.PRODUCTION)) == 7
+
+    def test_gates_shared_but_list_is_fresh(self):
+        first = get_tier_policy(EnvironmentTier.TEST)
+        second = get_tier_policy(EnvironmentTier.TEST)
+        assert first is not second
+        assert all(a is b for a, b in zip(first, second))
+        first.append(TestSuccessGate())
+        assert len(get_tier_policy(EnvironmentTier.TEST)) == 7
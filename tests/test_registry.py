@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import sys
+
 import pytest
 
 from ano_core.errors import RegistryError
@@ -118,6 +120,50 @@ class TestAgentRegistry:
         assert len(qa_agents) == 1
         assert qa_agents[0].name == "a1"
 
+    def test_list_agents_by_team_and_capability(self):
+        registry = AgentRegistry()
+        m1 = AgentMetadataEntry(name="a1", team="dev", version="1.0", capabilities=["qa"])
+        m2 = AgentMetadataEntry(name="a2", team="ops", version="1.0", capabilities=["qa"])
+        m3 = AgentMetadataEntry(name="a3", team="dev", version="1.0", capabilities=["qa"])
+        for m in (m1, m2, m3):
+            registry.register(type(m.name, (), {}), m)
+
+        assert registry.list_agents(team="dev", capability="qa") == [m1, m3]
+        registry.unregister("a1")
+        assert registry.list_agents(capability="qa") == [m2, m3]
+        assert registry.list_agents(team="missing") == []
+
+    def test_get_agent_shares_instance(self):
+        registry = AgentRegistry()
+
+        class Counted:
+            created = 0
+
+            def __init__(self, label="default"):
+                Counted.created += 1
+                self.label = label
+
+        metadata = AgentMetadataEntry(name="counted", team="dev", version="1.0", capabilities=[])
+        registry.register(Counted, metadata)
+
+        first = registry.get_agent("counted", label="shared")
+        assert registry.get_agent("counted") is first
+        assert first.label == "shared"
+        assert Counted.created == 1
+        assert registry.get_agent("missing") is None
+        assert registry.has("counted") is True
+
+        registry.clear_instances()
+        assert registry.get_agent("counted") is not first
+
+    def test_metadata_strings_interned(self):
+        team = "".join(["dev", "ops"])
+        metadata = AgentMetadataEntry(
+            name="a1", team=team, version="1.0", capabilities=["qa", "test"]
+        )
+        assert metadata.team is sys.intern("devops")
+        assert metadata.capabilities == ("qa", "test")
+
     def test_has_false_for_missing(self):
         registry = AgentRegistry()
         assert registry.has("nonexistent") is False